@@ -1,6 +1,43 @@
-from importlib import metadata
+from importlib import import_module, metadata
+from typing import TYPE_CHECKING, Any, Dict, List
 
-from langchain_salesforce.tools import SalesforceTool
+if TYPE_CHECKING:
+    from langchain_salesforce.cache import CacheBackend
+    from langchain_salesforce.cache_backends import RedisCache, SQLiteCache
+    from langchain_salesforce.extract import QueryExtractor
+    from langchain_salesforce.hedging import DeadlineExceededError
+    from langchain_salesforce.mirror import SQLiteMirror
+    from langchain_salesforce.pool import SalesforceToolPool, TokenBucket
+    from langchain_salesforce.profiling import Profiler
+    from langchain_salesforce.resilience import (
+        CircuitBreaker,
+        CircuitOpenError,
+        LoadSheddingError,
+    )
+    from langchain_salesforce.spool import SpooledResult
+    from langchain_salesforce.streaming import (
+        ChangeEvent,
+        ChangeEventSubscriber,
+        CometDEventSource,
+        EventSource,
+        QueueEventSource,
+    )
+    from langchain_salesforce.sync import (
+        IncrementalSync,
+        InMemoryWatermarkStore,
+        JSONFileWatermarkStore,
+        SyncResult,
+        WatermarkStore,
+    )
+    from langchain_salesforce.tools import SalesforceTool, WarmUp
+    from langchain_salesforce.typed import RecordSchema, TypedRecord, record_schema
+    from langchain_salesforce.validation import (
+        RecordValidationError,
+        RecordValidator,
+        SOQLValidationError,
+        SOQLValidator,
+    )
+    from langchain_salesforce.writes import WriteBehindBuffer
 
 try:
     __version__ = metadata.version(__package__)
@@ -9,7 +46,92 @@ except metadata.PackageNotFoundError:
     __version__ = "0.0.1"
 del metadata  # optional, avoids polluting the results of dir(__package__)
 
+# Public names are imported from their submodule on first access, so that
+# importing the package does not pay for langchain-core, simple-salesforce or
+# requests until they are needed.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "CacheBackend": "cache",
+    "ChangeEvent": "streaming",
+    "ChangeEventSubscriber": "streaming",
+    "CircuitBreaker": "resilience",
+    "CircuitOpenError": "resilience",
+    "CometDEventSource": "streaming",
+    "DeadlineExceededError": "hedging",
+    "EventSource": "streaming",
+    "IncrementalSync": "sync",
+    "InMemoryWatermarkStore": "sync",
+    "JSONFileWatermarkStore": "sync",
+    "LoadSheddingError": "resilience",
+    "Profiler": "profiling",
+    "QueryExtractor": "extract",
+    "QueueEventSource": "streaming",
+    "RecordSchema": "typed",
+    "RecordValidationError": "validation",
+    "RedisCache": "cache_backends",
+    "RecordValidator": "validation",
+    "SalesforceTool": "tools",
+    "SalesforceToolPool": "pool",
+    "SOQLValidationError": "validation",
+    "SOQLValidator": "validation",
+    "SpooledResult": "spool",
+    "SQLiteCache": "cache_backends",
+    "SQLiteMirror": "mirror",
+    "SyncResult": "sync",
+    "TokenBucket": "pool",
+    "TypedRecord": "typed",
+    "WarmUp": "tools",
+    "WatermarkStore": "sync",
+    "WriteBehindBuffer": "writes",
+    "record_schema": "typed",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
+    "CacheBackend",
+    "ChangeEvent",
+    "ChangeEventSubscriber",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CometDEventSource",
+    "DeadlineExceededError",
+    "EventSource",
+    "IncrementalSync",
+    "InMemoryWatermarkStore",
+    "JSONFileWatermarkStore",
+    "LoadSheddingError",
+    "Profiler",
+    "QueryExtractor",
+    "QueueEventSource",
+    "RecordSchema",
+    "RecordValidationError",
+    "RecordValidator",
+    "RedisCache",
     "SalesforceTool",
+    "SalesforceToolPool",
+    "SOQLValidationError",
+    "SOQLValidator",
+    "SpooledResult",
+    "SQLiteCache",
+    "SQLiteMirror",
+    "SyncResult",
+    "TokenBucket",
+    "TypedRecord",
+    "WarmUp",
+    "WatermarkStore",
+    "WriteBehindBuffer",
+    "record_schema",
     "__version__",
 ]
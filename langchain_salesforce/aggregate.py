@@ -0,0 +1,197 @@
+"""Server-side aggregation for the ``aggregate`` tool operation.
+
+Builds validated SOQL aggregate queries from an object, grouping fields and
+aggregate functions, so that agents get counts and sums as a compact table
+instead of moving raw rows into the model. Salesforce returns at most 2,000
+groups per aggregate query and does not support ``queryMore`` for them, so
+larger groupings are paged with keyset conditions on the grouping fields.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from langchain_salesforce.soql import SOQLParseError, parse_condition, quote_string
+from langchain_salesforce.sync import _VALID_FIELD_PATH_RE, _to_soql_datetime
+
+# Groups returned by a single aggregate query
+MAX_GROUPS_PER_QUERY = 2000
+
+_AGGREGATE_RE = re.compile(
+    r"^\s*(COUNT_DISTINCT|COUNT|SUM|AVG|MIN|MAX)\s*\(\s*([A-Za-z][\w.]*)?\s*\)\s*$",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class AggregateFunction:
+    """An aggregate function applied to a field, e.g. ``SUM(Amount)``."""
+
+    function: str
+    field: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.function}({self.field})"
+
+
+def parse_aggregate(expression: str) -> AggregateFunction:
+    """Parse an aggregate expression such as ``"sum(Amount)"``.
+
+    ``COUNT()`` is read as ``COUNT(Id)``, which can be grouped.
+
+    Raises:
+        ValueError: If the expression is not a supported aggregate function
+            of a valid field path.
+    """
+    match = _AGGREGATE_RE.match(expression)
+    if match is None:
+        raise ValueError(
+            f"Invalid aggregate: '{expression}'. Expected COUNT, COUNT_DISTINCT, "
+            "SUM, AVG, MIN or MAX of a field, e.g. 'SUM(Amount)'"
+        )
+    function, field_path = match.group(1).upper(), match.group(2)
+    if field_path is None:
+        if function != "COUNT":
+            raise ValueError(f"Aggregate {function}() requires a field")
+        field_path = "Id"
+    if not _VALID_FIELD_PATH_RE.match(field_path):
+        raise ValueError(f"Invalid field path: '{field_path}'")
+    return AggregateFunction(function, field_path)
+
+
+class AggregateQuery:
+    """A grouped aggregate over one object.
+
+    Args:
+        object_name: Object to aggregate; must already be validated.
+        group_by: Field paths to group by.
+        aggregates: Aggregate expressions; defaults to ``COUNT(Id)``.
+        where: Optional SOQL condition restricting the aggregated records.
+    """
+
+    def __init__(
+        self,
+        object_name: str,
+        group_by: Sequence[str] = (),
+        aggregates: Sequence[str] = (),
+        where: Optional[str] = None,
+    ) -> None:
+        for field_path in group_by:
+            if not _VALID_FIELD_PATH_RE.match(field_path):
+                raise ValueError(f"Invalid field path: '{field_path}'")
+        self.object_name = object_name
+        self.group_by = list(group_by)
+        self.aggregates = [parse_aggregate(a) for a in aggregates or ["COUNT(Id)"]]
+        self.where = where.strip() if where else None
+        if self.where:
+            try:
+                parse_condition(self.where)
+            except SOQLParseError as exc:
+                raise ValueError(f"Invalid where condition: {exc}") from exc
+
+    @property
+    def columns(self) -> List[str]:
+        """Column labels of the result table."""
+        return self.group_by + [aggregate.label for aggregate in self.aggregates]
+
+    def soql(
+        self,
+        after: Optional[Sequence[Any]] = None,
+        field_type: Optional[Callable[[str], Optional[str]]] = None,
+    ) -> str:
+        """Build the query for the groups following the ``after`` key.
+
+        Args:
+            after: Grouping values of the last group already fetched.
+            field_type: Returns the Salesforce type of a grouping field path,
+                used to format ``after`` values as SOQL literals.
+        """
+        select = [f"{path} g{i}" for i, path in enumerate(self.group_by)]
+        select += [
+            f"{aggregate.label} a{i}" for i, aggregate in enumerate(self.aggregates)
+        ]
+        conditions = [f"({self.where})"] if self.where else []
+        if after is not None:
+            conditions.append(self._keyset_condition(after, field_type))
+        query = f"SELECT {', '.join(select)} FROM {self.object_name}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        if self.group_by:
+            query += f" GROUP BY {', '.join(self.group_by)}"
+            orders = ", ".join(f"{path} ASC NULLS FIRST" for path in self.group_by)
+            query += f" ORDER BY {orders} LIMIT {MAX_GROUPS_PER_QUERY}"
+        return query
+
+    def row(self, record: Dict[str, Any]) -> List[Any]:
+        """Return the table row of an aggregate result record."""
+        values = [record.get(f"g{i}") for i in range(len(self.group_by))]
+        values += [record.get(f"a{i}") for i in range(len(self.aggregates))]
+        return values
+
+    def _keyset_condition(
+        self,
+        after: Sequence[Any],
+        field_type: Optional[Callable[[str], Optional[str]]],
+    ) -> str:
+        """Match the groups ordered after ``after`` (with NULLS FIRST)."""
+        literals = [
+            _literal(value, field_type(path) if field_type else None)
+            for path, value in zip(self.group_by, after)
+        ]
+        alternatives = []
+        for i, path in enumerate(self.group_by):
+            terms = [f"{self.group_by[j]} = {literals[j]}" for j in range(i)]
+            # Everything sorts after null; nothing sorts before it
+            terms.append(
+                f"{path} != null" if after[i] is None else f"{path} > {literals[i]}"
+            )
+            alternatives.append(" AND ".join(terms))
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return "(" + " OR ".join(f"({term})" for term in alternatives) + ")"
+
+
+def _literal(value: Any, field_type: Optional[str]) -> str:
+    """Format a grouping value returned by Salesforce as a SOQL literal."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if field_type == "date":
+        return str(value)
+    if field_type == "datetime":
+        return _to_soql_datetime(str(value))
+    return quote_string(str(value))
+
+
+def resolve_field_type(
+    describe: Callable[[str], Dict[str, Any]], object_name: str, path: str
+) -> Optional[str]:
+    """Return the type of a (dotted) field path, or None if it is unknown."""
+    parts = path.split(".")
+    current = object_name
+    for part in parts[:-1]:
+        reference = next(
+            (
+                field
+                for field in describe(current).get("fields", [])
+                if (field.get("relationshipName") or "").lower() == part.lower()
+            ),
+            None,
+        )
+        targets = (reference or {}).get("referenceTo") or []
+        if len(targets) != 1:
+            return None
+        current = targets[0]
+    field = next(
+        (
+            field
+            for field in describe(current).get("fields", [])
+            if field.get("name", "").lower() == parts[-1].lower()
+        ),
+        None,
+    )
+    return field.get("type") if field else None
@@ -0,0 +1,184 @@
+"""Output budgets for tool results.
+
+Large query pages, describes and object lists can overflow an agent's
+context. ``OutputBudget`` trims a result to a size budget, summarizes what
+was left out and hands back a continuation cursor. The remaining items stay
+in a local cursor store (together with the server-side ``nextRecordsUrl`` of
+a query), so a follow-up ``fetch_more`` call returns the next slice without
+running the query again.
+"""
+
+import json
+import math
+import secrets
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from langchain_salesforce.cache import TTLCache
+
+# Room reserved for the cursor, flags and summary added to a trimmed result
+_ENVELOPE_CHARS = 256
+
+_UNITS = ("bytes", "tokens")
+
+
+@dataclass(frozen=True)
+class _CursorState:
+    """Position in a paged result; a new state is stored for every slice."""
+
+    key: Optional[str]
+    items: List[Any]
+    offset: int
+    base: Dict[str, Any]
+    next_records_url: Optional[str] = None
+
+
+class OutputBudget:
+    """Trim tool results to a size budget and page through the rest.
+
+    Args:
+        limit: Maximum size of a result.
+        unit: ``"bytes"`` of compact JSON, or ``"tokens"`` estimated as one
+            token per four characters.
+        cursor_ttl: Seconds a continuation cursor stays valid.
+        maxsize: Maximum number of cursors kept.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        unit: str = "tokens",
+        cursor_ttl: float = 600.0,
+        maxsize: int = 1024,
+    ) -> None:
+        if limit <= 0:
+            raise ValueError("Output budget must be a positive integer")
+        if unit not in _UNITS:
+            raise ValueError(f"Output budget unit must be one of {_UNITS}")
+        self.limit = limit
+        self.unit = unit
+        self._cursors = TTLCache(maxsize=maxsize, ttl=cursor_ttl)
+        self._envelope = self.size("-" * _ENVELOPE_CHARS)
+
+    def size(self, value: Any) -> int:
+        """Return the size of ``value`` in the budget's unit."""
+        text = json.dumps(value, default=str, separators=(",", ":"))
+        if self.unit == "tokens":
+            return math.ceil(len(text) / 4)
+        return len(text.encode("utf-8"))
+
+    def apply(self, result: Any) -> Any:
+        """Return ``result`` unchanged if it fits, else its first slice.
+
+        Lists, query results (``records``) and describes (``fields``) are
+        trimmed; any other result is returned as is.
+        """
+        if self.size(result) <= self.limit:
+            return result
+        if isinstance(result, list):
+            return self._slice(_CursorState(None, result, 0, {}))
+        if not isinstance(result, dict):
+            return result
+        for key in ("records", "fields"):
+            if isinstance(result.get(key), list):
+                base = {k: v for k, v in result.items() if k != key}
+                next_url = base.pop("nextRecordsUrl", None)
+                if result.get("done", True):
+                    next_url = None
+                return self._slice(_CursorState(key, result[key], 0, base, next_url))
+        return result
+
+    def fetch_more(
+        self, cursor: str, query_more: Callable[[str], Dict[str, Any]]
+    ) -> Any:
+        """Return the slice after ``cursor``.
+
+        Args:
+            cursor: Cursor returned with a previous slice.
+            query_more: Fetches the query page at a ``nextRecordsUrl`` once
+                the locally held records are used up.
+
+        Raises:
+            ValueError: If the cursor is unknown or has expired.
+        """
+        state = self._cursors.get(cursor)
+        if state is None:
+            raise ValueError(f"Unknown or expired cursor: '{cursor}'")
+        if state.offset >= len(state.items) and state.next_records_url:
+            page = query_more(state.next_records_url)
+            next_url = None if page.get("done", True) else page.get("nextRecordsUrl")
+            state = replace(
+                state,
+                items=page.get("records", []),
+                offset=0,
+                next_records_url=next_url,
+            )
+        return self._slice(state)
+
+    def _slice(self, state: _CursorState) -> Any:
+        base, omitted = self._fit_base(state)
+        available = self.limit - self.size(base) - self._envelope
+        end, used = state.offset, 0
+        while end < len(state.items):
+            item_size = self.size(state.items[end]) + 1
+            # Always return one item so that paging makes progress
+            if end > state.offset and used + item_size > available:
+                break
+            used += item_size
+            end += 1
+
+        remaining = state.items[end:]
+        more = bool(remaining) or bool(state.next_records_url)
+        output = dict(base)
+        output[state.key or "items"] = state.items[state.offset : end]
+        if state.key == "records":
+            output["done"] = not more
+        if not more and not omitted:
+            return output if state.key else output["items"]
+
+        summary: Dict[str, Any] = {
+            "returned": end - state.offset,
+            "remaining": len(remaining),
+        }
+        if "totalSize" in base:
+            summary["total"] = base["totalSize"]
+        if state.next_records_url:
+            summary["more_on_server"] = True
+        fields = _item_fields(remaining)
+        if fields:
+            summary["fields"] = fields
+        if omitted:
+            summary["omitted"] = omitted
+        output["truncated"] = True
+        output["summary"] = summary
+        if more:
+            output["cursor"] = self._store(replace(state, offset=end))
+        return output
+
+    def _fit_base(self, state: _CursorState) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """Drop other list values of a trimmed dict (e.g. childRelationships)."""
+        if self.size(state.base) <= self.limit // 2:
+            return state.base, {}
+        base, omitted = {}, {}
+        for key, value in state.base.items():
+            if isinstance(value, list):
+                omitted[key] = len(value)
+            else:
+                base[key] = value
+        return base, omitted
+
+    def _store(self, state: _CursorState) -> str:
+        cursor = secrets.token_urlsafe(12)
+        self._cursors.set(cursor, state)
+        return cursor
+
+
+def _item_fields(items: List[Any]) -> List[str]:
+    """Return the keys of the remaining dict items, in first-seen order."""
+    seen: Dict[str, None] = {}
+    for item in items:
+        if isinstance(item, dict):
+            for key in item:
+                if key != "attributes":
+                    seen.setdefault(key, None)
+    return list(seen)
@@ -0,0 +1,150 @@
+"""Caches used by the Salesforce tool.
+
+Every cache implements ``CacheBackend``. ``TTLCache`` keeps entries in
+process; the backends in ``langchain_salesforce.cache_backends`` store them
+on disk or in Redis, so that all worker processes share warm caches.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class CacheBackend(ABC):
+    """Key-value storage with per-entry expiry.
+
+    Keys are strings so that related entries can be dropped together with
+    ``delete_prefix``. Values stored in shared backends must be
+    JSON-serializable.
+    """
+
+    @abstractmethod
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if missing."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache ``value`` under ``key``, overriding the default TTL if given."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` from the cache if present."""
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove every key starting with ``prefix``; return how many."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key, _MISSING) is not _MISSING
+
+
+class ScopedCache(CacheBackend):
+    """View of the keys of a shared backend that start with ``prefix``.
+
+    Lets several caches (and several orgs) share one backend without their
+    keys colliding or ``clear`` reaching beyond the view.
+
+    Args:
+        backend: Backend holding the entries.
+        prefix: Prefix added to every key.
+        ttl: Default time-to-live of entries set through the view. None means
+            entries only leave the cache through eviction or invalidation.
+    """
+
+    def __init__(
+        self, backend: CacheBackend, prefix: str, ttl: Optional[float] = None
+    ) -> None:
+        self.backend = backend
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.backend.get(self.prefix + key, default)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.backend.set(self.prefix + key, value, self.ttl if ttl is None else ttl)
+
+    def delete(self, key: str) -> None:
+        self.backend.delete(self.prefix + key)
+
+    def delete_prefix(self, prefix: str) -> int:
+        return self.backend.delete_prefix(self.prefix + prefix)
+
+    def clear(self) -> None:
+        self.backend.delete_prefix(self.prefix)
+
+
+class TTLCache(CacheBackend):
+    """Thread-safe LRU cache whose entries expire after a time-to-live.
+
+    Keys are strings so that related entries can be dropped together with
+    ``delete_prefix`` (e.g. every cached query on one object).
+
+    Args:
+        maxsize: Maximum number of entries; the least recently used entry is
+            evicted when the cache is full.
+        ttl: Default time-to-live in seconds. None means entries only leave
+            the cache through eviction or invalidation.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if missing."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache ``value`` under ``key``, overriding the default TTL if given."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove ``key`` from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove every key starting with ``prefix``; return how many."""
+        with self._lock:
+            keys = [key for key in self._data if key.startswith(prefix)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+_MISSING = object()
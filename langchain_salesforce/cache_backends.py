@@ -0,0 +1,178 @@
+"""Cache backends shared between processes.
+
+A fleet of workers each keeping its own describe and query caches pays for
+the same metadata once per process. ``SQLiteCache`` shares entries between
+the processes of one host through a file; ``RedisCache`` shares them across
+hosts. Values are stored as JSON and expire on wall-clock time.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from importlib import import_module
+from typing import Any, Optional
+
+from langchain_salesforce.cache import CacheBackend
+
+
+class SQLiteCache(CacheBackend):
+    """Cache stored in a SQLite file, shareable by the processes of a host.
+
+    The database runs in WAL mode with memory-mapped reads, so concurrent
+    readers do not block each other or the writer.
+
+    Args:
+        path: Database file; ``":memory:"`` keeps it private to the process.
+        ttl: Default time-to-live in seconds; None keeps entries until they
+            are evicted or invalidated.
+        maxsize: Maximum number of entries, enforced every 100 writes by
+            evicting the oldest entries. None means unbounded.
+        mmap_size: Bytes of the database file mapped into memory.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[float] = None,
+        maxsize: Optional[int] = 100_000,
+        mmap_size: int = 64 * 1024 * 1024,
+    ) -> None:
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._lock = threading.RLock()
+        self._writes = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL, stored_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_entries_stored_at "
+                "ON cache_entries (stored_at)"
+            )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return default
+        value, expires_at = row
+        if expires_at is not None and time.time() >= expires_at:
+            self.delete(key)
+            return default
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires_at, now),
+            )
+            self._writes += 1
+            if self.maxsize is not None and self._writes % 100 == 0:
+                self._conn.execute(
+                    "DELETE FROM cache_entries WHERE key IN (SELECT key FROM "
+                    "cache_entries ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (self.maxsize,),
+                )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> int:
+        # A key range, unlike substr(), is answered from the primary key index;
+        # U+10FFFF sorts after every other character in SQLite's BINARY order
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM cache_entries WHERE key >= ? AND key < ?",
+                (prefix, prefix + "\U0010ffff"),
+            )
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache_entries")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class RedisCache(CacheBackend):
+    """Cache stored in Redis, or any server speaking the Redis protocol.
+
+    Args:
+        client: A ``redis.Redis``-compatible client. It must provide ``get``,
+            ``set`` with ``px``, ``delete`` and ``scan_iter``.
+        ttl: Default time-to-live in seconds; None keeps entries until they
+            are invalidated or evicted by the server's maxmemory policy.
+        key_prefix: Prefix of every key this cache writes.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        ttl: Optional[float] = None,
+        key_prefix: str = "langchain_salesforce:",
+    ) -> None:
+        self.client = client
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> "RedisCache":
+        """Connect with the ``redis`` package, e.g. ``redis://localhost:6379/0``.
+
+        Raises:
+            ImportError: If the ``redis`` package is not installed.
+        """
+        try:
+            redis = import_module("redis")
+        except ImportError as exc:
+            raise ImportError(
+                "RedisCache.from_url requires the redis package: pip install redis"
+            ) from exc
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self.client.get(self.key_prefix + key)
+        return default if value is None else json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        px = max(int(ttl * 1000), 1) if ttl is not None else None
+        self.client.set(self.key_prefix + key, json.dumps(value), px=px)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.key_prefix + key)
+
+    def delete_prefix(self, prefix: str) -> int:
+        # SCAN walks the whole keyspace; fine for invalidation, not hot paths
+        pattern = _escape_glob(self.key_prefix + prefix) + "*"
+        keys = list(self.client.scan_iter(match=pattern, count=500))
+        deleted = 0
+        for start in range(0, len(keys), 500):
+            deleted += self.client.delete(*keys[start : start + 500])
+        return deleted
+
+    def clear(self) -> None:
+        self.delete_prefix("")
+
+
+def _escape_glob(text: str) -> str:
+    """Escape the characters Redis ``MATCH`` patterns treat specially."""
+    return "".join("\\" + char if char in "*?[]\\" else char for char in text)
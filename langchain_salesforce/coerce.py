@@ -0,0 +1,21 @@
+"""Conversion of Salesforce API field values into Python values."""
+
+from datetime import date, datetime
+from typing import Any
+
+_NUMBER_TYPES = frozenset({"double", "currency", "percent"})
+
+
+def coerce_value(value: Any, field_type: str) -> Any:
+    """Convert an API value of a field into its Python type."""
+    if value is None or not isinstance(value, (str, int, float)):
+        return value
+    if field_type == "date":
+        return date.fromisoformat(str(value))
+    if field_type == "datetime":
+        return datetime.strptime(str(value), "%Y-%m-%dT%H:%M:%S.%f%z")
+    if field_type == "int":
+        return int(value)
+    if field_type in _NUMBER_TYPES:
+        return float(value)
+    return value
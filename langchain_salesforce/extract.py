@@ -0,0 +1,309 @@
+"""Bulk query extraction with page post-processing in a process pool.
+
+Turning hundreds of thousands of rows into flat records, Python values and
+JSON Lines or CSV text is CPU work that, on the fetching thread, holds the
+GIL between network round trips. ``QueryExtractor`` fetches result pages on a
+background thread and hands each page to a process pool as soon as it
+arrives, so fetching the next page overlaps with processing the previous
+ones. Processed pages are yielded in query order.
+"""
+
+import contextvars
+import csv
+import io
+import json
+import queue
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import date, datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+from langchain_salesforce.coerce import coerce_value
+from langchain_salesforce.soql import parse_soql
+
+if TYPE_CHECKING:
+    from langchain_salesforce.tools import SalesforceTool
+
+_OUTPUT_FORMATS = ("records", "jsonl", "csv")
+
+_DONE = object()
+
+
+def flatten_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten parent relationships of a record into dotted field paths.
+
+    ``attributes`` entries are dropped, ``{"Owner": {"Name": "Ann"}}``
+    becomes ``{"Owner.Name": "Ann"}`` and child relationship results become
+    lists of flattened records.
+    """
+    flat: Dict[str, Any] = {}
+    for name, value in record.items():
+        if name == "attributes":
+            continue
+        if isinstance(value, dict) and "records" in value:
+            flat[name] = [flatten_record(child) for child in value["records"]]
+        elif isinstance(value, dict):
+            for path, nested in flatten_record(value).items():
+                flat[f"{name}.{path}"] = nested
+        else:
+            flat[name] = value
+    return flat
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return json.dumps(value, default=_json_default)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def process_page(
+    records: List[Dict[str, Any]],
+    output: str = "records",
+    field_types: Optional[Dict[str, str]] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> Tuple[int, Any]:
+    """Post-process one page of query results.
+
+    Runs in worker processes, so it takes and returns only picklable values.
+
+    Args:
+        records: Records of the page as returned by the API.
+        output: ``"records"`` for flattened dicts, ``"jsonl"`` for one JSON
+            document per line or ``"csv"`` for CSV rows without a header.
+        field_types: Lowercased field paths mapped to their describe type;
+            values of these fields are converted to Python types.
+        columns: CSV columns, matched case-insensitively to field paths.
+
+    Returns:
+        The number of records and the processed page.
+    """
+    rows = [flatten_record(record) for record in records]
+    if field_types:
+        for row in rows:
+            for name, value in row.items():
+                field_type = field_types.get(name.lower())
+                if field_type is not None:
+                    row[name] = coerce_value(value, field_type)
+    if output == "jsonl":
+        text = "".join(json.dumps(row, default=_json_default) + "\n" for row in rows)
+        return len(rows), text
+    if output == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            lowered = {name.lower(): value for name, value in row.items()}
+            writer.writerow(
+                [_csv_value(lowered.get(column.lower())) for column in columns or ()]
+            )
+        return len(rows), buffer.getvalue()
+    return len(rows), rows
+
+
+class QueryExtractor:
+    """Stream a large query's results through parallel post-processing.
+
+    Example:
+        .. code-block:: python
+
+            extractor = QueryExtractor(tool, output="csv", processes=4)
+            with open("accounts.csv", "w", newline="") as file:
+                extractor.write(
+                    "SELECT Id, Name, Owner.Name FROM Account", file
+                )
+
+    Args:
+        tool: Tool whose connection fetches the pages.
+        output: ``"records"`` yields lists of flattened records per page,
+            ``"jsonl"`` and ``"csv"`` yield text chunks.
+        processes: Worker processes; None uses one per CPU and 0 processes
+            pages on the fetching thread.
+        coerce_types: Convert date, datetime and number fields of the
+            selected fields to Python types, using the cached describes.
+        max_pending_pages: Pages fetched ahead of the consumer; bounds
+            memory when the consumer is slower than the network.
+        executor: Executor to run post-processing on instead of a pool
+            owned by the extractor, e.g. one shared by several extractors.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        tool: "SalesforceTool",
+        output: str = "records",
+        processes: Optional[int] = None,
+        coerce_types: bool = False,
+        max_pending_pages: int = 8,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if output not in _OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unsupported output: '{output}'. "
+                f"Expected one of: {', '.join(_OUTPUT_FORMATS)}"
+            )
+        if processes is not None and processes < 0:
+            raise ValueError("processes must be a non-negative integer")
+        if max_pending_pages <= 0:
+            raise ValueError("max_pending_pages must be a positive integer")
+        self.tool = tool
+        self.output = output
+        self.processes = processes
+        self.coerce_types = coerce_types
+        self.max_pending_pages = max_pending_pages
+        self._executor = executor
+
+    def _columns(self, query: str) -> List[str]:
+        """Return the flattened field paths selected by ``query``."""
+        parsed = parse_soql(query)
+        columns = []
+        for item in parsed.select:
+            if item.subquery is not None:
+                columns.append(item.subquery.object_name)
+            elif item.is_field:
+                path = item.expression
+                if parsed.alias and path.lower().startswith(parsed.alias.lower() + "."):
+                    path = path[len(parsed.alias) + 1 :]
+                columns.append(path)
+            elif item.alias:
+                columns.append(item.alias)
+        return columns
+
+    def _field_types(self, query: str, columns: Sequence[str]) -> Dict[str, str]:
+        object_name = parse_soql(query).object_name
+        field_types = {}
+        for column in columns:
+            field_type = self.tool._field_type(object_name, column)
+            if field_type is not None:
+                field_types[column.lower()] = field_type
+        return field_types
+
+    def _fetch(
+        self,
+        query: str,
+        include_deleted: bool,
+        submit: Any,
+        pending: "queue.Queue[Any]",
+        stop: threading.Event,
+    ) -> None:
+        """Fetch pages and queue their post-processing until done or stopped."""
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    pending.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            for page in self.tool._iter_query_pages(
+                query, include_deleted=include_deleted, use_cache=False
+            ):
+                if not put(submit(page.get("records", []))):
+                    return
+        except BaseException as exc:  # pylint: disable=broad-except
+            put(exc)
+            return
+        put(_DONE)
+
+    def _pages(self, query: str, include_deleted: bool) -> Iterator[Tuple[int, Any]]:
+        columns: Optional[List[str]] = None
+        field_types: Optional[Dict[str, str]] = None
+        if self.output == "csv" or self.coerce_types:
+            columns = self._columns(query)
+        if self.coerce_types:
+            field_types = self._field_types(query, columns or [])
+
+        executor = self._executor
+        owned = executor is None and self.processes != 0
+        if owned:
+            executor = ProcessPoolExecutor(max_workers=self.processes)
+
+        def submit(records: List[Dict[str, Any]]) -> Any:
+            if executor is None:
+                done: Future = Future()
+                done.set_result(
+                    process_page(records, self.output, field_types, columns)
+                )
+                return done
+            return executor.submit(
+                process_page, records, self.output, field_types, columns
+            )
+
+        if self.output == "csv":
+            header = io.StringIO()
+            csv.writer(header).writerow(columns or [])
+            yield 0, header.getvalue()
+
+        pending: "queue.Queue[Any]" = queue.Queue(maxsize=self.max_pending_pages)
+        stop = threading.Event()
+        # Run in a copy of the caller's context so its deadline applies
+        context = contextvars.copy_context()
+        fetcher = threading.Thread(
+            target=context.run,
+            args=(self._fetch, query, include_deleted, submit, pending, stop),
+            name="salesforce-extract",
+            daemon=True,
+        )
+        fetcher.start()
+        try:
+            while True:
+                item = pending.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item.result()
+        finally:
+            stop.set()
+            fetcher.join()
+            if owned and executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def extract(
+        self, query: str, include_deleted: bool = False
+    ) -> Generator[Any, None, None]:
+        """Yield the processed pages of ``query`` in order.
+
+        Pages are fetched ahead and processed in parallel while the caller
+        consumes earlier ones. With ``output="csv"`` the first chunk is the
+        header row. Closing the iterator early stops fetching.
+
+        Raises:
+            SOQLParseError: If columns are needed (CSV output or type
+                coercion) and the query cannot be parsed.
+        """
+        for _, payload in self._pages(query, include_deleted):
+            yield payload
+
+    def write(self, query: str, file: TextIO, include_deleted: bool = False) -> int:
+        """Write a ``"jsonl"`` or ``"csv"`` extraction to ``file``.
+
+        Returns:
+            The number of records written.
+        """
+        if self.output == "records":
+            raise ValueError("write() requires output='jsonl' or output='csv'")
+        count = 0
+        for page_count, text in self._pages(query, include_deleted):
+            file.write(text)
+            count += page_count
+        return count
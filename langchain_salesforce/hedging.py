@@ -0,0 +1,290 @@
+"""Per-call deadlines and hedged reads.
+
+Salesforce REST latency has a long tail: a few calls take many times the
+median. Deadlines bound how long an operation may wait; they are carried in a
+context variable, so they follow the operation into ``asyncio.to_thread`` and
+LangChain's executors, and they are taken from the run config
+(``config["configurable"]["salesforce_timeout"]``) so an agent's step budget
+reaches the HTTP calls it makes.
+
+Calls run through ``HedgedCaller`` stay on the caller's thread, so they are
+not limited by a pool; their HTTP requests time out at the deadline (see
+``request_timeout``). A hedged read also sends a duplicate of a slow
+idempotent call once it has taken longer than the observed 95th percentile,
+and falls back to the duplicate's answer if the first attempt fails or times
+out. Only a small share of calls are duplicated.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    Optional,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
+
+T = TypeVar("T")
+
+# Key of config["configurable"] holding an operation's timeout in seconds
+TIMEOUT_CONFIG_KEY = "salesforce_timeout"
+
+_deadline: ContextVar[Optional[float]] = ContextVar("salesforce_deadline", default=None)
+# Set while a call runs in HedgedCaller, whose HTTP requests may be abandoned
+_bounded: ContextVar[bool] = ContextVar("salesforce_bounded_call", default=False)
+# Result of a duplicate that was not sent or did not succeed
+_NOT_SENT = object()
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when an operation runs past its deadline."""
+
+
+def config_timeout(config: Optional["RunnableConfig"]) -> Optional[float]:
+    """Return the timeout set in a run config, if any."""
+    if not config:
+        return None
+    timeout = config.get("configurable", {}).get(TIMEOUT_CONFIG_KEY)
+    return None if timeout is None else float(timeout)
+
+
+@contextmanager
+def deadline_scope(timeout: Optional[float]) -> Iterator[Optional[float]]:
+    """Give the calls made in this context ``timeout`` seconds to finish.
+
+    A nested scope can only shorten the deadline of the scope around it.
+    Yields the deadline as a ``time.monotonic()`` value, or None.
+    """
+    current = _deadline.get()
+    if timeout is None:
+        yield current
+        return
+    deadline = time.monotonic() + timeout
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the current deadline, or None without one.
+
+    Raises:
+        DeadlineExceededError: If the deadline has passed.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceededError("Salesforce operation deadline exceeded")
+    return remaining
+
+
+def request_timeout(timeout: Any = None) -> Any:
+    """Cap a ``requests`` timeout at the deadline of the current call.
+
+    Only requests made by calls running in ``HedgedCaller.call`` are capped;
+    other requests, such as writes, are never cut short once sent.
+
+    Args:
+        timeout: Seconds, a ``(connect, read)`` tuple or None.
+
+    Raises:
+        DeadlineExceededError: If the deadline of a capped request has passed.
+    """
+    if not _bounded.get():
+        return timeout
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    if isinstance(timeout, tuple):
+        return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def _run_bounded(func: Callable[[], T]) -> T:
+    token = _bounded.set(True)
+    try:
+        return func()
+    finally:
+        _bounded.reset(token)
+
+
+class LatencyTracker:
+    """Latencies of the most recent calls, for percentile estimates."""
+
+    def __init__(self, window: int = 200) -> None:
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float, min_samples: int = 1) -> Optional[float]:
+        """Return the ``q`` quantile, or None with fewer than ``min_samples``."""
+        with self._lock:
+            if len(self._samples) < max(min_samples, 1):
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class HedgedCaller:
+    """Run calls under the current deadline, hedging slow idempotent ones.
+
+    Calls run inline on the caller's thread, and their HTTP requests time out
+    at the deadline. A hedged call also gets a duplicate on a small thread
+    pool once it has run longer than the ``quantile`` latency of its kind; if
+    the first attempt then fails or times out, the duplicate's answer is used
+    when it arrives before the deadline. A duplicate that is not needed runs
+    to completion and its answer is dropped.
+
+    Args:
+        quantile: Latency quantile after which a duplicate is sent.
+        min_samples: Calls of a kind observed before hedging it.
+        max_workers: Threads sending duplicates; further duplicates wait.
+    """
+
+    def __init__(
+        self, quantile: float = 0.95, min_samples: int = 20, max_workers: int = 16
+    ) -> None:
+        if not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1")
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self._trackers: Dict[str, LatencyTracker] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._counts = {"hedged": 0, "hedge_wins": 0, "deadline_exceeded": 0}
+
+    def call(
+        self,
+        kind: str,
+        func: Callable[[], T],
+        hedge: bool = False,
+        hedge_func: Optional[Callable[[], T]] = None,
+    ) -> T:
+        """Call ``func`` within the current deadline.
+
+        Args:
+            kind: Latency class of the call, e.g. ``"query"``.
+            func: The call; it must be idempotent when ``hedge`` is set.
+            hedge: Send a duplicate if the call is slow.
+            hedge_func: Makes the duplicate call, e.g. over a connection the
+                first attempt does not use; ``func`` by default.
+
+        Raises:
+            DeadlineExceededError: If the call failed after its deadline and no
+                duplicate answered in time.
+        """
+        tracker = self._tracker(kind)
+        remaining = remaining_time()
+        delay = tracker.quantile(self.quantile, self.min_samples) if hedge else None
+        start = time.monotonic()
+        first_done = threading.Event()
+        duplicate: Optional["Future[Any]"] = None
+        if delay is not None and (remaining is None or delay < remaining):
+            # The duplicate runs in a copy of the caller's context, e.g. its
+            # trace span, and is only sent if the first attempt is still out
+            duplicate = self._get_executor().submit(
+                copy_context().run,
+                self._send_duplicate,
+                delay,
+                first_done,
+                hedge_func or func,
+            )
+        try:
+            result = _run_bounded(func)
+        except Exception as exc:
+            first_done.set()
+            if duplicate is not None and not duplicate.cancel():
+                outcome = self._duplicate_result(duplicate, _deadline.get())
+                if outcome is not _NOT_SENT:
+                    self._count("hedge_wins")
+                    tracker.record(time.monotonic() - start)
+                    return outcome
+            deadline = _deadline.get()
+            if deadline is not None and time.monotonic() >= deadline:
+                self._count("deadline_exceeded")
+                raise DeadlineExceededError(
+                    f"Salesforce {kind} call did not finish before its deadline"
+                ) from exc
+            raise
+        first_done.set()
+        tracker.record(time.monotonic() - start)
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return hedging counters and the current hedge delay of each kind."""
+        with self._lock:
+            trackers = dict(self._trackers)
+            counts = dict(self._counts)
+        delays = {
+            kind: tracker.quantile(self.quantile, self.min_samples)
+            for kind, tracker in trackers.items()
+        }
+        return {**counts, "hedge_delays": delays}
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once their calls are done."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _send_duplicate(
+        self, delay: float, first_done: threading.Event, func: Callable[[], T]
+    ) -> Any:
+        """Make the duplicate call unless the first attempt ends within ``delay``."""
+        if first_done.wait(delay):
+            return _NOT_SENT
+        self._count("hedged")
+        return _run_bounded(func)
+
+    @staticmethod
+    def _duplicate_result(duplicate: "Future[Any]", deadline: Optional[float]) -> Any:
+        """Wait until the deadline for a duplicate; ``_NOT_SENT`` if it failed."""
+        timeout = None
+        if deadline is not None:
+            timeout = max(deadline - time.monotonic(), 0.0)
+        done, _ = wait([duplicate], timeout=timeout)
+        if not done or duplicate.exception() is not None:
+            return _NOT_SENT
+        return duplicate.result()
+
+    def _tracker(self, kind: str) -> LatencyTracker:
+        with self._lock:
+            tracker = self._trackers.get(kind)
+            if tracker is None:
+                tracker = self._trackers[kind] = LatencyTracker()
+            return tracker
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="salesforce-hedge",
+                )
+            return self._executor
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
@@ -0,0 +1,527 @@
+"""Local SQLite mirror of selected Salesforce objects.
+
+The mirror keeps a replica of a few hot objects up to date through
+``IncrementalSync`` and answers simple single-object SOQL queries from the
+local database while the replica is fresh enough. Queries it cannot answer
+exactly are reported as unanswerable so that the caller can send them to
+Salesforce instead.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from simple_salesforce.api import DEFAULT_API_VERSION
+
+from langchain_salesforce.soql import (
+    BooleanCondition,
+    Comparison,
+    Condition,
+    Literal,
+    NotCondition,
+    SOQLParseError,
+    SOQLQuery,
+    field_paths,
+    parse_soql,
+)
+from langchain_salesforce.sync import (
+    IncrementalSync,
+    SyncResult,
+    WatermarkStore,
+    _to_soql_datetime,
+)
+
+if TYPE_CHECKING:
+    from langchain_salesforce.tools import SalesforceTool
+
+# Regex for plain (non-relationship) field API names
+_VALID_FIELD_NAME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
+
+_NUMERIC_TYPES = {"int", "double", "currency", "percent", "long"}
+
+_COMPARISON_OPERATORS = {"=", "!=", "<", "<=", ">", ">="}
+
+
+class _SQLiteWatermarkStore(WatermarkStore):
+    """Watermark store kept in the mirror database, next to the data it marks.
+
+    ``set`` only stages the new watermark; ``commit`` writes it inside the
+    transaction that applies the synced rows, so data and watermark can never
+    get out of step.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, lock: threading.RLock) -> None:
+        self._conn = connection
+        self._lock = lock
+        self._pending: Dict[str, str] = {}
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS _mirror_watermarks "
+                "(object_name TEXT PRIMARY KEY, watermark TEXT NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark FROM _mirror_watermarks WHERE object_name = ?",
+                (key,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._pending[key] = value
+
+    def commit(self, key: str) -> None:
+        """Write the staged watermark of ``key`` in the current transaction."""
+        with self._lock:
+            value = self._pending.pop(key, None)
+            if value is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO _mirror_watermarks VALUES (?, ?)",
+                    (key, value),
+                )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._pending.pop(key, None)
+            self._conn.execute(
+                "DELETE FROM _mirror_watermarks WHERE object_name = ?", (key,)
+            )
+
+
+class _UnsupportedQuery(Exception):
+    """Raised internally when a query cannot be answered from the mirror."""
+
+
+class SQLiteMirror:
+    """Replica of selected SObjects in SQLite that can answer simple SOQL.
+
+    Only single-object queries with a plain field SELECT list, WHERE
+    conditions on literals, ORDER BY, LIMIT and OFFSET are answered locally.
+    Relationship fields, aggregates, relative date literals and stale objects
+    make ``query`` return None.
+
+    Example:
+        .. code-block:: python
+
+            mirror = SQLiteMirror(
+                tool,
+                {"Account": ["Name", "Industry"], "User": ["Name", "Email"]},
+                path="mirror.db",
+                max_staleness=300,
+            )
+            mirror.refresh()
+            tool.attach_mirror(mirror)
+
+    Args:
+        tool: Tool used to describe and sync the mirrored objects.
+        objects: Mapping of object name to the fields to mirror. ``Id`` and
+            the watermark field are always mirrored.
+        path: SQLite database path, ``":memory:"`` by default.
+        max_staleness: Seconds after the last refresh during which an object
+            is considered fresh enough to answer queries.
+        watermark_field: Field used to track changes (``SystemModstamp`` or
+            ``LastModifiedDate``).
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        tool: "SalesforceTool",
+        objects: Mapping[str, Sequence[str]],
+        path: str = ":memory:",
+        max_staleness: float = 60.0,
+        watermark_field: str = "SystemModstamp",
+    ) -> None:
+        for object_name, fields in objects.items():
+            tool._validate_object_name(object_name)
+            for field_name in fields:
+                if not _VALID_FIELD_NAME_RE.match(field_name):
+                    raise ValueError(
+                        f"Invalid field '{field_name}' for mirrored object "
+                        f"'{object_name}'. Only plain field names can be mirrored."
+                    )
+        self.tool = tool
+        self.max_staleness = max_staleness
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._watermarks = _SQLiteWatermarkStore(self._conn, self._lock)
+        self._sync = IncrementalSync(
+            tool, self._watermarks, watermark_field=watermark_field
+        )
+        self._requested_fields = {
+            name: list(fields) for name, fields in objects.items()
+        }
+        # object name -> {lower-case field name: (API name, field type)}
+        self._columns: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        self._include_deleted: Dict[str, bool] = {}
+        self._refreshed_at: Dict[str, float] = {}
+        self._invalidated_at: Dict[str, float] = {}
+        # API version of the record URLs, known once the tool has logged in
+        self._api_version: Optional[str] = None
+        self._stop_event: Optional[threading.Event] = None
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    @property
+    def objects(self) -> List[str]:
+        """Names of the mirrored objects."""
+        return list(self._requested_fields)
+
+    def _table(self, object_name: str) -> str:
+        return f'"sobject_{object_name}"'
+
+    def _prepare_object(self, object_name: str) -> None:
+        """Describe the object and (re)create its table if the layout changed."""
+        if object_name in self._columns:
+            return
+        describe = self.tool._execute_describe(object_name)
+        field_types = {
+            f["name"].lower(): (f["name"], f.get("type", "string"))
+            for f in describe.get("fields", [])
+        }
+        wanted = [
+            "Id",
+            self._sync.watermark_field,
+            *self._requested_fields[object_name],
+        ]
+        columns: Dict[str, Tuple[str, str]] = {}
+        for field_name in wanted:
+            if field_name.lower() not in field_types:
+                raise ValueError(
+                    f"Field '{field_name}' not found in object '{object_name}'"
+                )
+            columns[field_name.lower()] = field_types[field_name.lower()]
+
+        definitions = []
+        for api_name, field_type in columns.values():
+            if api_name == "Id":
+                definitions.append('"Id" TEXT PRIMARY KEY')
+            elif field_type in _NUMERIC_TYPES or field_type == "boolean":
+                definitions.append(f'"{api_name}" NUMERIC')
+            else:
+                definitions.append(f'"{api_name}" TEXT COLLATE NOCASE')
+
+        expected = [api_name for api_name, _ in columns.values()]
+        include_deleted = "isdeleted" in field_types
+        with self._lock, self._conn:
+            existing = [
+                row[1]
+                for row in self._conn.execute(
+                    f"PRAGMA table_info({self._table(object_name)})"
+                )
+            ]
+            if existing and existing != expected:
+                self._conn.execute(f"DROP TABLE {self._table(object_name)}")
+                self._sync.reset(object_name, expected, include_deleted)
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._table(object_name)} "
+                f"({', '.join(definitions)})"
+            )
+        self._columns[object_name] = columns
+        self._include_deleted[object_name] = include_deleted
+
+    def _sync_key(self, object_name: str) -> str:
+        return self._sync.state_key(
+            object_name,
+            [api_name for api_name, _ in self._columns[object_name].values()],
+            self._include_deleted[object_name],
+        )
+
+    @staticmethod
+    def _to_sqlite(value: Any, field_type: str) -> Any:
+        if value is None:
+            return None
+        if field_type == "boolean":
+            return int(bool(value))
+        if field_type == "datetime":
+            return _to_soql_datetime(value)
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return value
+
+    @staticmethod
+    def _from_sqlite(value: Any, field_type: str) -> Any:
+        if value is None:
+            return None
+        if field_type == "boolean":
+            return bool(value)
+        if field_type == "datetime":
+            return value[:-1] + "+0000"
+        return value
+
+    def _apply(self, object_name: str, result: SyncResult) -> None:
+        columns = list(self._columns[object_name].values())
+        placeholders = ", ".join("?" for _ in columns)
+        names = ", ".join(f'"{api_name}"' for api_name, _ in columns)
+        rows = [
+            tuple(
+                self._to_sqlite(record.get(api_name), field_type)
+                for api_name, field_type in columns
+            )
+            for record in result.records
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self._table(object_name)} ({names}) "
+                f"VALUES ({placeholders})",
+                rows,
+            )
+            self._conn.executemany(
+                f'DELETE FROM {self._table(object_name)} WHERE "Id" = ?',
+                [(record_id,) for record_id in result.deleted_ids],
+            )
+            self._watermarks.commit(self._sync_key(object_name))
+
+    def refresh(self, object_name: Optional[str] = None) -> Dict[str, SyncResult]:
+        """Pull the changes since the last refresh into the mirror.
+
+        Args:
+            object_name: Refresh only this object. All objects by default.
+
+        Returns:
+            The sync result of every refreshed object.
+        """
+        names = [object_name] if object_name else self.objects
+        results = {}
+        for name in names:
+            if name not in self._requested_fields:
+                raise ValueError(f"Object '{name}' is not mirrored")
+            started = time.monotonic()
+            self._prepare_object(name)
+            fields = [api_name for api_name, _ in self._columns[name].values()]
+            result = self._sync.sync(
+                name, fields, include_deleted=self._include_deleted[name]
+            )
+            self._apply(name, result)
+            with self._lock:
+                # A write during the sync may not be in the synced rows
+                if self._invalidated_at.get(name, 0.0) < started:
+                    self._refreshed_at[name] = time.monotonic()
+            results[name] = result
+        if self._api_version is None:
+            self._api_version = (
+                getattr(self.tool._main_client(), "sf_version", None)
+                or DEFAULT_API_VERSION
+            )
+        return results
+
+    def invalidate(self, object_name: Optional[str] = None) -> None:
+        """Mark an object, or every object, as stale until its next refresh.
+
+        The tool calls this after writing to an object, since the mirror only
+        sees the write once it has been synced.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for name in self._requested_fields:
+                if object_name is None or name.lower() == object_name.lower():
+                    self._refreshed_at.pop(name, None)
+                    self._invalidated_at[name] = now
+
+    def is_fresh(self, object_name: str) -> bool:
+        """Whether ``object_name`` was refreshed within ``max_staleness``."""
+        refreshed_at = self._refreshed_at.get(object_name)
+        if refreshed_at is None:
+            return False
+        return time.monotonic() - refreshed_at <= self.max_staleness
+
+    def start(self, interval: Optional[float] = None) -> None:
+        """Refresh all objects periodically on a background daemon thread.
+
+        Args:
+            interval: Seconds between refreshes. Defaults to half of
+                ``max_staleness`` so the mirror stays fresh.
+        """
+        if self._refresh_thread is not None:
+            return
+        period = interval if interval is not None else self.max_staleness / 2
+        stop_event = threading.Event()
+
+        def _loop() -> None:
+            while not stop_event.is_set():
+                try:
+                    self.refresh()
+                except Exception:  # pylint: disable=broad-except
+                    # Stale objects fall back to the API; retry on next tick
+                    pass
+                stop_event.wait(period)
+
+        self._stop_event = stop_event
+        self._refresh_thread = threading.Thread(
+            target=_loop, name="salesforce-mirror-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refresh thread started by ``start``."""
+        if self._stop_event is not None and self._refresh_thread is not None:
+            self._stop_event.set()
+            self._refresh_thread.join()
+        self._stop_event = None
+        self._refresh_thread = None
+
+    def close(self) -> None:
+        """Stop background refreshes and close the database."""
+        self.stop()
+        with self._lock:
+            self._conn.close()
+
+    def _column(self, object_name: str, field_path: str) -> Tuple[str, str]:
+        column = self._columns[object_name].get(field_path.lower())
+        if column is None:
+            raise _UnsupportedQuery(f"Field '{field_path}' is not mirrored")
+        return column
+
+    def _literal_param(self, literal: Literal, field_type: str) -> Any:
+        if literal.kind == "date_literal":
+            raise _UnsupportedQuery("Relative date literals are evaluated remotely")
+        if literal.kind == "boolean":
+            return int(literal.value)
+        if literal.kind == "datetime":
+            return _to_soql_datetime(literal.value)
+        if field_type == "datetime" and literal.kind == "date":
+            raise _UnsupportedQuery("Date literal compared to a datetime field")
+        return literal.value
+
+    def _translate(
+        self, object_name: str, condition: Condition, params: List[Any]
+    ) -> str:
+        """Translate a WHERE condition into SQL with SOQL null semantics."""
+        if isinstance(condition, BooleanCondition):
+            parts = [
+                self._translate(object_name, c, params) for c in condition.operands
+            ]
+            return "(" + f" {condition.operator} ".join(parts) + ")"
+        if isinstance(condition, NotCondition):
+            inner = self._translate(object_name, condition.operand, params)
+            return f"(NOT IFNULL({inner}, 0))"
+        return self._translate_comparison(object_name, condition, params)
+
+    def _translate_comparison(
+        self, object_name: str, comparison: Comparison, params: List[Any]
+    ) -> str:
+        api_name, field_type = self._column(object_name, comparison.field)
+        column = f'"{api_name}"'
+        operator = comparison.operator
+
+        if isinstance(comparison.value, SOQLQuery):
+            raise _UnsupportedQuery("Semi-joins are evaluated remotely")
+        if isinstance(comparison.value, list):
+            if operator not in ("IN", "NOT IN"):
+                raise _UnsupportedQuery(f"Operator {operator} is evaluated remotely")
+            values = [self._literal_param(v, field_type) for v in comparison.value]
+            if api_name == "Id" and any(len(str(v)) == 15 for v in values):
+                raise _UnsupportedQuery("15-character Ids are evaluated remotely")
+            params.extend(values)
+            placeholders = ", ".join("?" for _ in values)
+            if operator == "IN":
+                return f"{column} IN ({placeholders})"
+            return f"({column} IS NULL OR {column} NOT IN ({placeholders}))"
+
+        literal = comparison.value
+        if literal.kind == "null":
+            if operator == "=":
+                return f"{column} IS NULL"
+            if operator == "!=":
+                return f"{column} IS NOT NULL"
+            raise _UnsupportedQuery(f"Operator {operator} with null")
+
+        value = self._literal_param(literal, field_type)
+        if api_name == "Id" and isinstance(value, str) and len(value) == 15:
+            raise _UnsupportedQuery("15-character Ids are evaluated remotely")
+        params.append(value)
+        if operator == "LIKE":
+            return f"{column} LIKE ? ESCAPE '\\'"
+        if operator == "!=":
+            return f"({column} IS NULL OR {column} != ?)"
+        if operator in _COMPARISON_OPERATORS:
+            return f"{column} {operator} ?"
+        raise _UnsupportedQuery(f"Operator {operator} is evaluated remotely")
+
+    def _build_sql(
+        self, parsed: SOQLQuery
+    ) -> Tuple[str, List[Any], List[Tuple[str, str]]]:
+        object_name = parsed.object_name
+        aliased = parsed.alias or any(item.alias for item in parsed.select)
+        if aliased or parsed.group_by:
+            raise _UnsupportedQuery("Aliases and GROUP BY are evaluated remotely")
+        if not all(item.is_field for item in parsed.select):
+            raise _UnsupportedQuery("Functions are evaluated remotely")
+        selected = [self._column(object_name, path) for path in parsed.fields]
+
+        params: List[Any] = []
+        columns = ", ".join(f'"{api_name}"' for api_name, _ in selected)
+        sql = f"SELECT {columns} FROM {self._table(object_name)}"
+        if parsed.where is not None:
+            sql += " WHERE " + self._translate(object_name, parsed.where, params)
+        if parsed.order_by:
+            terms = []
+            for item in parsed.order_by:
+                column = f'"{self._column(object_name, item.field)[0]}"'
+                # SOQL defaults to NULLS FIRST for ASC and NULLS LAST for DESC,
+                # which matches SQLite ordering; only explicit overrides differ.
+                nulls_first = item.nulls == "FIRST" or (
+                    item.nulls is None and not item.descending
+                )
+                terms.append(f"({column} IS NULL) {'DESC' if nulls_first else 'ASC'}")
+                terms.append(f"{column} {'DESC' if item.descending else 'ASC'}")
+            sql += " ORDER BY " + ", ".join(terms)
+        if parsed.limit is not None or parsed.offset is not None:
+            sql += " LIMIT ?"
+            params.append(parsed.limit if parsed.limit is not None else -1)
+            if parsed.offset is not None:
+                sql += " OFFSET ?"
+                params.append(parsed.offset)
+        return sql, params, selected
+
+    def query(self, query: str) -> Optional[Dict[str, Any]]:
+        """Answer a SOQL query from the mirror.
+
+        Returns:
+            A result shaped like the REST query response, or None when the
+            query references unmirrored data or the object is stale.
+        """
+        try:
+            parsed = parse_soql(query)
+        except SOQLParseError:
+            return None
+        object_name = next(
+            (
+                n
+                for n in self._requested_fields
+                if n.lower() == parsed.object_name.lower()
+            ),
+            None,
+        )
+        if object_name is None or not self.is_fresh(object_name):
+            return None
+        parsed.object_name = object_name
+        try:
+            for path in field_paths(parsed.where):
+                self._column(object_name, path)
+            sql, params, selected = self._build_sql(parsed)
+        except _UnsupportedQuery:
+            return None
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        version = self._api_version or DEFAULT_API_VERSION
+        id_index = next(
+            (i for i, (api_name, _) in enumerate(selected) if api_name == "Id"), None
+        )
+        records = []
+        for row in rows:
+            attributes: Dict[str, Any] = {"type": object_name}
+            if id_index is not None:
+                attributes["url"] = (
+                    f"/services/data/v{version}/sobjects/{object_name}/{row[id_index]}"
+                )
+            record: Dict[str, Any] = {"attributes": attributes}
+            for (api_name, field_type), value in zip(selected, row):
+                record[api_name] = self._from_sqlite(value, field_type)
+            records.append(record)
+        return {"totalSize": len(records), "done": True, "records": records}
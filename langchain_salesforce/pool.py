@@ -0,0 +1,336 @@
+"""Serve several Salesforce orgs from one process.
+
+``SalesforceToolPool`` keeps one ``SalesforceTool`` per org and routes each
+operation to the org named in the tool input or in the run config. Every org
+has its own client (and therefore its own HTTP connection pool and login
+session), its own caches, its own rate limit and its own concurrency limit,
+so a busy org cannot starve the others.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Type, Union, cast
+
+from langchain_core.callbacks import CallbackManagerForToolRun
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool
+from langchain_core.tools.base import ToolCall
+from pydantic import BaseModel, Field, PrivateAttr
+from requests import Session
+
+from langchain_salesforce.hedging import config_timeout, deadline_scope
+from langchain_salesforce.tools import SalesforceQueryInput, SalesforceTool
+
+OrgSpec = Union[SalesforceTool, Mapping[str, Any], Callable[[], SalesforceTool]]
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Args:
+        rate: Tokens added per second.
+        burst: Bucket capacity; defaults to ``rate`` (at least one token).
+        clock: Monotonic clock, replaceable for testing.
+        sleep: Sleep function, replaceable for testing.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        if self.capacity < 1:
+            raise ValueError("burst must be at least 1")
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available.
+
+        Returns:
+            0 if a token was taken, otherwise the seconds until one is.
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated)
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a token; return False if ``timeout`` seconds pass first."""
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            wait = self.try_acquire()
+            if wait == 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining < wait:
+                    return False
+            self._sleep(wait)
+
+
+class _OrgSlot:
+    """Per-org tool, created on first use, and its throughput limits."""
+
+    def __init__(
+        self,
+        org: str,
+        spec: OrgSpec,
+        rate_limit: Optional[float],
+        burst: Optional[int],
+        max_concurrency: Optional[int],
+    ) -> None:
+        self.org = org
+        self.spec = spec
+        self.tool: Optional[SalesforceTool] = (
+            spec if isinstance(spec, SalesforceTool) else None
+        )
+        self.limiter = TokenBucket(rate_limit, burst) if rate_limit else None
+        self.semaphore = (
+            threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        )
+        self.max_concurrency = max_concurrency
+        self.lock = threading.Lock()
+
+    def get_tool(self) -> SalesforceTool:
+        with self.lock:
+            if self.tool is None:
+                if isinstance(self.spec, Mapping):
+                    # Keep orgs sharing a cache backend out of each other's keys
+                    defaults: Dict[str, Any] = {"cache_namespace": self.org}
+                    if self.max_concurrency:
+                        # Applied when the client is created, on first use
+                        defaults["connection_pool_size"] = self.max_concurrency
+                    self.tool = SalesforceTool(**{**defaults, **self.spec})
+                else:
+                    self.tool = cast(Callable[[], SalesforceTool], self.spec)()
+            return self.tool
+
+
+class SalesforceMultiOrgInput(SalesforceQueryInput):
+    """Input schema for operations routed through a multi-org pool."""
+
+    org: Optional[str] = Field(
+        None,
+        description="Key of the Salesforce org to run the operation against",
+    )
+
+
+class SalesforceToolPool(BaseTool):
+    """Route Salesforce operations to one of several orgs.
+
+    Orgs are given as a mapping from org key to either a ready
+    ``SalesforceTool``, the keyword arguments to build one, or a zero-argument
+    factory. Tools built from arguments or factories are created, and log in,
+    on first use and are reused afterwards. Tools built from arguments use the
+    org key as their ``cache_namespace`` unless the arguments give one.
+
+    The org of an operation is taken from the ``org`` key of the input, then
+    from ``config["configurable"][config_key]``, then from ``default_org``.
+
+    Example:
+        .. code-block:: python
+
+            pool = SalesforceToolPool(
+                {
+                    "prod": {"username": ..., "password": ...,
+                             "security_token": ...},
+                    "acme_sandbox": {"username": ..., "password": ...,
+                                     "security_token": ..., "domain": "test"},
+                },
+                default_org="prod",
+                rate_limit=10,
+                max_concurrency=4,
+            )
+            pool.invoke({"operation": "list_objects", "org": "acme_sandbox"})
+    """
+
+    name: str = "salesforce"
+    description: str = (
+        "Tool for interacting with several Salesforce CRM orgs. Can query "
+        "records, describe object schemas, list available objects, get field "
+        "metadata, and perform create/update/delete operations in the org "
+        "given by 'org'."
+    )
+    args_schema: Type[BaseModel] = SalesforceMultiOrgInput
+    default_org: Optional[str] = Field(
+        None, description="Org used when neither the input nor config names one"
+    )
+    config_key: str = Field(
+        "salesforce_org",
+        description="Key of config['configurable'] that names the org",
+    )
+    rate_limit: Optional[float] = Field(
+        None, description="Default operations per second allowed for each org"
+    )
+    burst: Optional[int] = Field(
+        None, description="Default number of back-to-back operations an org may burst"
+    )
+    max_concurrency: Optional[int] = Field(
+        None, description="Default number of concurrent operations per org"
+    )
+    acquire_timeout: Optional[float] = Field(
+        None,
+        description=(
+            "Seconds to wait for an org's rate or concurrency limit before "
+            "failing; None waits indefinitely"
+        ),
+    )
+    _orgs: Dict[str, _OrgSlot] = PrivateAttr(default_factory=dict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def __init__(
+        self, orgs: Optional[Mapping[str, OrgSpec]] = None, **kwargs: Any
+    ) -> None:
+        """Initialize the pool with an optional mapping of orgs."""
+        super().__init__(**kwargs)
+        for org, spec in (orgs or {}).items():
+            self.add_org(org, spec)
+
+    @property
+    def orgs(self) -> List[str]:
+        """Keys of the registered orgs."""
+        with self._lock:
+            return list(self._orgs)
+
+    def add_org(
+        self,
+        org: str,
+        spec: OrgSpec,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        """Register an org, overriding the pool's default limits if given."""
+        if not org:
+            raise ValueError("Org key must be a non-empty string")
+        slot = _OrgSlot(
+            org,
+            spec,
+            rate_limit if rate_limit is not None else self.rate_limit,
+            burst if burst is not None else self.burst,
+            max_concurrency if max_concurrency is not None else self.max_concurrency,
+        )
+        with self._lock:
+            if org in self._orgs:
+                raise ValueError(f"Salesforce org '{org}' is already registered")
+            self._orgs[org] = slot
+
+    def remove_org(self, org: str) -> None:
+        """Unregister an org, send its queued updates and close its session."""
+        with self._lock:
+            slot = self._orgs.pop(org, None)
+        if slot is not None and slot.tool is not None:
+            _close_tool(slot.tool)
+
+    def get_tool(self, org: str) -> SalesforceTool:
+        """Return the tool of ``org``, creating it on first use."""
+        return self._slot(org).get_tool()
+
+    def close(self) -> None:
+        """Send queued updates and close the sessions of every client so far."""
+        with self._lock:
+            tools = [slot.tool for slot in self._orgs.values() if slot.tool]
+        for tool in tools:
+            _close_tool(tool)
+
+    def _slot(self, org: str) -> _OrgSlot:
+        with self._lock:
+            slot = self._orgs.get(org)
+        if slot is None:
+            raise ValueError(f"Unknown Salesforce org: '{org}'")
+        return slot
+
+    def _resolve_org(
+        self, org: Optional[str], config: Optional[RunnableConfig] = None
+    ) -> str:
+        if not org and config:
+            org = config.get("configurable", {}).get(self.config_key)
+        org = org or self.default_org
+        if not org:
+            raise ValueError(
+                "No Salesforce org given: set 'org' in the input, "
+                f"config['configurable']['{self.config_key}'] or default_org"
+            )
+        return org
+
+    def _run(
+        self,
+        operation: str,
+        org: Optional[str] = None,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+        **params: Any,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Execute a Salesforce operation against the given org."""
+        org = self._resolve_org(org)
+        slot = self._slot(org)
+        if slot.limiter is not None and not slot.limiter.acquire(self.acquire_timeout):
+            raise TimeoutError(f"Rate limit of Salesforce org '{org}' exceeded")
+        if slot.semaphore is None:
+            return slot.get_tool()._run(operation, run_manager=run_manager, **params)
+        if not slot.semaphore.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"Salesforce org '{org}' is at maximum concurrency")
+        try:
+            return slot.get_tool()._run(operation, run_manager=run_manager, **params)
+        finally:
+            slot.semaphore.release()
+
+    async def _arun(
+        self,
+        operation: str,
+        org: Optional[str] = None,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+        **params: Any,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Execute a Salesforce operation without blocking the event loop."""
+        # Waiting on an org's limits must not stall other orgs' coroutines
+        return await asyncio.to_thread(self._run, operation, org, run_manager, **params)
+
+    def invoke(
+        self,
+        input: Union[str, Dict[Any, Any], ToolCall],
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run the operation in the org named by the input or config."""
+        input_dict = dict(SalesforceTool._parse_salesforce_input(input))
+        input_dict["org"] = self._resolve_org(input_dict.get("org"), config)
+        with deadline_scope(config_timeout(config)):
+            return self._run(**input_dict)
+
+    async def ainvoke(
+        self,
+        input: Union[str, Dict[Any, Any], ToolCall],
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run the operation asynchronously in the org named by input or config."""
+        input_dict = dict(SalesforceTool._parse_salesforce_input(input))
+        input_dict["org"] = self._resolve_org(input_dict.get("org"), config)
+        with deadline_scope(config_timeout(config)):
+            return await self._arun(**input_dict)
+
+
+def _close_tool(tool: SalesforceTool) -> None:
+    tool.close()
+    if tool._login is not None:
+        # Never logged in
+        return
+    session = getattr(tool._sf, "session", None)
+    if isinstance(session, Session):
+        session.close()
@@ -0,0 +1,340 @@
+"""Opt-in profiling of tool calls.
+
+With a ``Profiler`` attached, every tool call records a tree of timed spans:
+input parsing, parameter validation, login, each HTTP call (split into the
+wait for the response headers and JSON decoding) and output trimming. Calls
+slower than a threshold can also be sampled with cProfile or pyinstrument.
+Traces are kept in memory and export to the Chrome trace format, which
+``chrome://tracing`` and Perfetto open offline.
+
+Spans are carried in a context variable. Without an active profiled call,
+``span()`` costs one context variable lookup, so the instrumentation stays in
+place when profiling is off.
+"""
+
+import io
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    from requests import Response, Session
+
+_SAMPLERS = ("cprofile", "pyinstrument")
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar(
+    "salesforce_span", default=None
+)
+
+_NOOP: ContextManager[None] = nullcontext()
+
+
+@dataclass
+class Span:
+    """A timed phase of a tool call; times are ``time.perf_counter()`` seconds."""
+
+    name: str
+    start: float
+    end: Optional[float] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    children: List["Span"] = field(default_factory=list)
+    thread_id: int = field(default_factory=threading.get_ident)
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds the span took, or None while it is open."""
+        return None if self.end is None else self.end - self.start
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the span tree as JSON-serializable data."""
+        duration = self.duration
+        return {
+            "name": self.name,
+            "duration_ms": None if duration is None else duration * 1000,
+            "attributes": self.attributes,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class _SpanScope:
+    """Context manager that opens a child span of ``parent``."""
+
+    def __init__(self, parent: Span, name: str, attributes: Dict[str, Any]) -> None:
+        self._span = Span(name, 0.0, attributes=attributes)
+        parent.children.append(self._span)
+        self._token: Any = None
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        self._span.start = time.perf_counter()
+        return self._span
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        self._span.end = time.perf_counter()
+        if exc_type is not None:
+            self._span.attributes["error"] = exc_type.__name__
+        _current_span.reset(self._token)
+
+
+def span(name: str, **attributes: Any) -> ContextManager[Optional[Span]]:
+    """Time the enclosed block as a child of the current span, if any."""
+    parent = _current_span.get()
+    if parent is None:
+        return _NOOP
+    return _SpanScope(parent, name, attributes)
+
+
+def current_span() -> Optional[Span]:
+    """Return the innermost open span, or None outside profiled calls."""
+    return _current_span.get()
+
+
+@dataclass
+class CallTrace:
+    """The span tree of one call and, if it was slow, its sampled profile."""
+
+    root: Span
+    profile: Optional[str] = None
+    profile_path: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        return self.root.duration or 0.0
+
+
+class Profiler:
+    """Record span trees of tool calls and sample slow ones.
+
+    Example:
+        .. code-block:: python
+
+            profiler = Profiler(slow_threshold=2.0, output_dir="profiles")
+            tool = SalesforceTool(..., profiler=profiler)
+            ...
+            profiler.export_chrome_trace("trace.json")
+
+    Args:
+        slow_threshold: Calls taking at least this many seconds keep a
+            sampled profile. None disables sampling, which is the cheaper
+            mode: while sampling is on, every call runs under the sampler.
+        sampler: ``"cprofile"`` or ``"pyinstrument"`` (requires the
+            ``pyinstrument`` package).
+        max_traces: Number of most recent calls kept.
+        output_dir: Directory the profiles of slow calls are written to, as
+            ``.prof`` files (cProfile) or ``.html`` files (pyinstrument).
+
+    Raises:
+        ImportError: If ``sampler="pyinstrument"`` and it is not installed.
+    """
+
+    def __init__(
+        self,
+        slow_threshold: Optional[float] = None,
+        sampler: str = "cprofile",
+        max_traces: int = 100,
+        output_dir: Optional[str] = None,
+    ) -> None:
+        if sampler not in _SAMPLERS:
+            raise ValueError(
+                f"Unsupported sampler: '{sampler}'. "
+                f"Expected one of: {', '.join(_SAMPLERS)}"
+            )
+        if max_traces <= 0:
+            raise ValueError("max_traces must be a positive integer")
+        self.slow_threshold = slow_threshold
+        self.sampler = sampler
+        self.output_dir = output_dir
+        self._pyinstrument: Any = None
+        if sampler == "pyinstrument" and slow_threshold is not None:
+            try:
+                self._pyinstrument = import_module("pyinstrument")
+            except ImportError as exc:
+                raise ImportError(
+                    "sampler='pyinstrument' requires the pyinstrument package: "
+                    "pip install pyinstrument"
+                ) from exc
+        if output_dir is not None:
+            os.makedirs(output_dir, exist_ok=True)
+        self._traces: Deque[CallTrace] = deque(maxlen=max_traces)
+        self._lock = threading.Lock()
+        self._sequence = 0
+
+    @contextmanager
+    def call(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Profile the enclosed call; nested calls become child spans."""
+        parent = _current_span.get()
+        if parent is not None:
+            with _SpanScope(parent, name, attributes) as child:
+                yield child
+            return
+        root = Span(name, time.perf_counter(), attributes=attributes)
+        sampler = self._start_sampler()
+        token = _current_span.set(root)
+        try:
+            yield root
+        except BaseException as exc:
+            root.attributes["error"] = type(exc).__name__
+            raise
+        finally:
+            _current_span.reset(token)
+            root.end = time.perf_counter()
+            self._finish(root, sampler)
+
+    def _start_sampler(self) -> Any:
+        if self.slow_threshold is None:
+            return None
+        try:
+            if self._pyinstrument is not None:
+                sampler = self._pyinstrument.Profiler(async_mode="disabled")
+                sampler.start()
+            else:
+                import cProfile
+
+                sampler = cProfile.Profile()
+                sampler.enable()
+        except (RuntimeError, ValueError):
+            # Another profiler is active, e.g. a concurrent sampled call
+            return None
+        return sampler
+
+    def _finish(self, root: Span, sampler: Any) -> None:
+        trace = CallTrace(root)
+        if sampler is not None:
+            if self._pyinstrument is not None:
+                sampler.stop()
+            else:
+                sampler.disable()
+            if trace.duration >= (self.slow_threshold or 0.0):
+                self._keep_profile(trace, sampler)
+        with self._lock:
+            self._traces.append(trace)
+
+    def _keep_profile(self, trace: CallTrace, sampler: Any) -> None:
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+        if self._pyinstrument is not None:
+            trace.profile = sampler.output_text()
+            if self.output_dir is not None:
+                trace.profile_path = self._profile_path(
+                    self.output_dir, trace, sequence, "html"
+                )
+                with open(trace.profile_path, "w", encoding="utf-8") as file:
+                    file.write(sampler.output_html())
+            return
+        report = io.StringIO()
+        import pstats
+
+        pstats.Stats(sampler, stream=report).sort_stats("cumulative").print_stats(30)
+        trace.profile = report.getvalue()
+        if self.output_dir is not None:
+            trace.profile_path = self._profile_path(
+                self.output_dir, trace, sequence, "prof"
+            )
+            sampler.dump_stats(trace.profile_path)
+
+    @staticmethod
+    def _profile_path(
+        directory: str, trace: CallTrace, sequence: int, suffix: str
+    ) -> str:
+        label = trace.root.attributes.get("operation") or trace.root.name
+        return os.path.join(directory, f"{sequence:05d}-{label}.{suffix}")
+
+    def traces(self, slow_only: bool = False) -> List[CallTrace]:
+        """Return the recorded calls, oldest first."""
+        with self._lock:
+            traces = list(self._traces)
+        if slow_only:
+            return [trace for trace in traces if trace.profile is not None]
+        return traces
+
+    def clear(self) -> None:
+        """Drop the recorded calls."""
+        with self._lock:
+            self._traces.clear()
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Return the recorded calls in the Chrome trace event format."""
+        traces = self.traces()
+        origin = min((trace.root.start for trace in traces), default=0.0)
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = []
+
+        def add(current: Span) -> None:
+            end = current.end if current.end is not None else current.start
+            events.append(
+                {
+                    "name": current.name,
+                    "cat": "salesforce",
+                    "ph": "X",
+                    "ts": (current.start - origin) * 1e6,
+                    "dur": (end - current.start) * 1e6,
+                    "pid": pid,
+                    "tid": current.thread_id,
+                    "args": current.attributes,
+                }
+            )
+            for child in current.children:
+                add(child)
+
+        for trace in traces:
+            add(trace.root)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> int:
+        """Write the recorded calls to a Chrome trace JSON file.
+
+        Returns:
+            The number of spans written.
+        """
+        data = self.chrome_trace()
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, default=str)
+        return len(data["traceEvents"])
+
+
+def _trace_response(response: "Response", *args: Any, **kwargs: Any) -> "Response":
+    """requests hook splitting an HTTP span into response wait and decoding."""
+    parent = _current_span.get()
+    if parent is None:
+        return response
+    end = time.perf_counter()
+    parent.children.append(
+        Span(
+            "http_wait",
+            end - response.elapsed.total_seconds(),
+            end,
+            {"method": response.request.method, "status": response.status_code},
+        )
+    )
+    decode = response.json
+
+    def timed_json(**json_kwargs: Any) -> Any:
+        with _SpanScope(parent, "json_decode", {"bytes": len(response.content)}):
+            return decode(**json_kwargs)
+
+    response.json = timed_json  # type: ignore[method-assign]
+    return response
+
+
+def trace_responses(session: "Session") -> None:
+    """Record response waits and JSON decoding of ``session`` in spans."""
+    hooks = session.hooks.setdefault("response", [])
+    if _trace_response not in hooks:
+        hooks.append(_trace_response)
@@ -0,0 +1,171 @@
+"""Record cache behind the ``get_record`` operation.
+
+Agents often read back a record they just created, updated or saw in a
+query result. ``RecordCache`` keeps the field values the tool has seen, per
+(object, Id), so such reads are answered locally, and a read that needs more
+fields fetches only the missing ones. Values are remembered per field with
+the (wall-clock) time they were seen, so fields learned at different times
+expire independently, also when the cache is shared between processes.
+"""
+
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from langchain_salesforce.cache import CacheBackend, TTLCache
+
+_VALID_FIELD_NAME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
+
+_ID_SUFFIX_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ012345"
+
+# Fields Salesforce changes on every write, even when they were not written
+_AUDIT_FIELDS = frozenset({"lastmodifieddate", "lastmodifiedbyid", "systemmodstamp"})
+
+
+def to_id18(record_id: str) -> str:
+    """Return the case-insensitive 18-character form of a record ID."""
+    if len(record_id) != 15:
+        return record_id
+    suffix = ""
+    for start in range(0, 15, 5):
+        bits = sum(
+            1 << position
+            for position, char in enumerate(record_id[start : start + 5])
+            if "A" <= char <= "Z"
+        )
+        suffix += _ID_SUFFIX_CHARS[bits]
+    return record_id + suffix
+
+
+def validate_field_names(fields: Iterable[str]) -> None:
+    """Raise ValueError unless every item is a plain field API name."""
+    for name in fields:
+        if not _VALID_FIELD_NAME_RE.match(name):
+            raise ValueError(f"Invalid field name: '{name}'")
+
+
+class RecordCache:
+    """Thread-safe cache of record field values keyed by (object, Id).
+
+    Each entry is a JSON object: ``values`` maps lowercased field names to
+    ``[API name, value, time seen]`` and ``complete_at`` is when every field
+    of the record was last fetched, or null.
+
+    Args:
+        maxsize: Maximum number of records kept in process.
+        ttl: Seconds a field value stays valid.
+        backend: Where entries are stored; an in-process ``TTLCache`` of
+            ``maxsize`` entries by default.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        backend: Optional[CacheBackend] = None,
+    ) -> None:
+        self.ttl = ttl
+        self._records = backend or TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(object_name: str, record_id: str) -> str:
+        return f"record:{object_name.lower()}:{to_id18(record_id)}"
+
+    def lookup(
+        self, object_name: str, record_id: str, fields: Optional[Sequence[str]]
+    ) -> Tuple[Dict[str, Any], Optional[List[str]]]:
+        """Return the fresh cached values of ``fields`` and the missing ones.
+
+        With ``fields=None`` all fields are asked for; they are returned only
+        if the whole record was fetched recently, otherwise None is returned
+        as the missing fields, meaning the whole record.
+        """
+        entry: Dict[str, Any] = self._records.get(
+            self._key(object_name, record_id)
+        ) or {"values": {}, "complete_at": None}
+        values = entry["values"]
+        cutoff = time.time() - self.ttl
+        if fields is None:
+            complete_at = entry["complete_at"]
+            if complete_at is None or complete_at < cutoff:
+                return {}, None
+            return {name: value for name, value, _ in values.values()}, []
+        found: Dict[str, Any] = {}
+        missing: List[str] = []
+        for name in fields:
+            known = values.get(name.lower())
+            if known is None or known[2] < cutoff:
+                missing.append(name)
+            else:
+                found[known[0]] = known[1]
+        return found, missing
+
+    def merge(
+        self,
+        object_name: str,
+        record_id: str,
+        values: Dict[str, Any],
+        complete: bool = False,
+        written: bool = False,
+    ) -> None:
+        """Remember field values of a record.
+
+        Args:
+            object_name: Object of the record.
+            record_id: ID of the record.
+            values: Field values; ``attributes`` and related records are
+                ignored.
+            complete: Whether ``values`` holds every field of the record.
+            written: Whether the values were just written, which makes the
+                cached audit fields stale.
+        """
+        now = time.time()
+        key = self._key(object_name, record_id)
+        with self._lock:
+            current = self._records.get(key) or {"values": {}, "complete_at": None}
+            known: Dict[str, Tuple[str, Any, float]] = dict(current["values"])
+            complete_at: Optional[float] = current["complete_at"]
+            if written:
+                for name in _AUDIT_FIELDS:
+                    known.pop(name, None)
+                # Formula fields may depend on what was written
+                complete_at = None
+            for name, value in values.items():
+                if name == "attributes" or isinstance(value, dict):
+                    continue
+                known[name.lower()] = (name, value, now)
+            if complete:
+                complete_at = now
+            self._records.set(key, {"values": known, "complete_at": complete_at})
+
+    def remember(self, records: Iterable[Any]) -> None:
+        """Remember the records of a query result, including related ones.
+
+        Only records that carry their type in ``attributes`` and an ``Id``
+        are kept; aggregate rows and partial relationship values are not.
+        """
+        for record in records:
+            if not isinstance(record, dict):
+                continue
+            record_type = (record.get("attributes") or {}).get("type")
+            if record_type and isinstance(record.get("Id"), str):
+                self.merge(record_type, record["Id"], record)
+            for value in record.values():
+                if isinstance(value, dict) and value.get("attributes"):
+                    self.remember([value])
+                elif isinstance(value, dict) and "records" in value:
+                    self.remember(value.get("records") or [])
+
+    def invalidate(
+        self, object_name: Optional[str] = None, record_ids: Sequence[str] = ()
+    ) -> None:
+        """Drop the given records, every record of an object, or everything."""
+        if object_name is None:
+            self._records.clear()
+        elif record_ids:
+            for record_id in record_ids:
+                self._records.delete(self._key(object_name, record_id))
+        else:
+            self._records.delete_prefix(f"record:{object_name.lower()}:")
@@ -0,0 +1,190 @@
+"""Relationship-aware planning for the ``query_related`` tool operation.
+
+Fetching records together with their related records one query per parent
+record costs N+1 round trips. ``plan_related_query`` resolves the requested
+relationship names against the object's describe and turns them into a
+single query: parent relationships become dotted fields and child
+relationships become parent-child subqueries. Salesforce allows 20
+subqueries per query, so further child relationships are fetched with a few
+batched ``IN`` queries on the child object's foreign key. ``RelatedQueryPlan``
+then runs the queries and assembles the record graph.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from langchain_salesforce.soql import SOQLParseError, parse_condition, quote_string
+from langchain_salesforce.sync import _VALID_FIELD_PATH_RE
+
+# Parent-child subqueries allowed in one SOQL query
+MAX_SUBQUERIES = 20
+# Parent Ids per batched IN query, keeping the query URL well below its limit
+IN_BATCH_SIZE = 200
+
+
+@dataclass
+class _BatchedChild:
+    relationship: str
+    object_name: str
+    foreign_key: str
+    fields: List[str]
+
+
+@dataclass
+class RelatedQueryPlan:
+    """Queries that fetch a set of records and their related records."""
+
+    object_name: str
+    root_query: str
+    subqueries: List[str] = field(default_factory=list)
+    batched: List[_BatchedChild] = field(default_factory=list)
+
+    def execute(
+        self,
+        iter_pages: Callable[[str], Iterable[Dict[str, Any]]],
+        query_more: Callable[[str], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Run the plan and return the assembled records.
+
+        Args:
+            iter_pages: Yields every result page of a SOQL query.
+            query_more: Fetches the page at a ``nextRecordsUrl``, used for
+                child subqueries with more records than fit in one page.
+        """
+        queries = [self.root_query]
+        records = _all_records(iter_pages(self.root_query))
+        for record in records:
+            for relationship in self.subqueries:
+                record[relationship] = list(
+                    _child_records(record.get(relationship), query_more)
+                )
+
+        ids = [record["Id"] for record in records]
+        for child in self.batched:
+            grouped: Dict[Optional[str], List[Dict[str, Any]]] = {}
+            for start in range(0, len(ids), IN_BATCH_SIZE):
+                chunk = ids[start : start + IN_BATCH_SIZE]
+                query = (
+                    f"SELECT {', '.join(child.fields)} FROM {child.object_name} "
+                    f"WHERE {child.foreign_key} IN "
+                    f"({', '.join(quote_string(id_) for id_ in chunk)})"
+                )
+                queries.append(query)
+                for child_record in _all_records(iter_pages(query)):
+                    parent_id = child_record.get(child.foreign_key)
+                    grouped.setdefault(parent_id, []).append(child_record)
+            for record in records:
+                record[child.relationship] = grouped.get(record["Id"], [])
+
+        return {
+            "object": self.object_name,
+            "records": [_compact(record) for record in records],
+            "queries": queries,
+        }
+
+
+def plan_related_query(
+    describe: Callable[[str], Dict[str, Any]],
+    object_name: str,
+    fields: Optional[List[str]] = None,
+    relationships: Optional[Mapping[str, List[str]]] = None,
+    where: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> RelatedQueryPlan:
+    """Plan the queries for records of ``object_name`` and their relations.
+
+    Args:
+        describe: Returns the (cached) describe of an object.
+        object_name: Root object; must already be validated.
+        fields: Fields of the root records; ``Id`` is always included.
+        relationships: Relationship names (e.g. ``"Contacts"`` or
+            ``"Owner"``) mapped to the fields to fetch from them.
+        where: Optional SOQL condition on the root records.
+        limit: Maximum number of root records.
+
+    Raises:
+        ValueError: If a field, relationship or condition is invalid.
+    """
+    root_fields = _with_id(fields or [])
+    description = describe(object_name)
+    children = {
+        child["relationshipName"].lower(): child
+        for child in description.get("childRelationships", [])
+        if child.get("relationshipName")
+    }
+    parents = {
+        parent["relationshipName"].lower(): parent
+        for parent in description.get("fields", [])
+        if parent.get("relationshipName")
+    }
+
+    select = list(root_fields)
+    subqueries: List[str] = []
+    batched: List[_BatchedChild] = []
+    for name, rel_fields in (relationships or {}).items():
+        if name.lower() in parents:
+            relationship = parents[name.lower()]["relationshipName"]
+            select += [f"{relationship}.{path}" for path in _with_id(rel_fields)]
+        elif name.lower() in children:
+            child = children[name.lower()]
+            relationship = child["relationshipName"]
+            child_fields = _with_id(rel_fields)
+            if len(subqueries) < MAX_SUBQUERIES:
+                select.append(f"(SELECT {', '.join(child_fields)} FROM {relationship})")
+                subqueries.append(relationship)
+            else:
+                if child["field"] not in child_fields:
+                    child_fields.append(child["field"])
+                batched.append(
+                    _BatchedChild(
+                        relationship,
+                        child["childSObject"],
+                        child["field"],
+                        child_fields,
+                    )
+                )
+        else:
+            raise ValueError(f"Unknown relationship '{name}' on '{object_name}'")
+
+    query = f"SELECT {', '.join(select)} FROM {object_name}"
+    if where:
+        try:
+            parse_condition(where)
+        except SOQLParseError as exc:
+            raise ValueError(f"Invalid where condition: {exc}") from exc
+        query += f" WHERE {where}"
+    if limit is not None:
+        query += f" LIMIT {limit}"
+    return RelatedQueryPlan(object_name, query, subqueries, batched)
+
+
+def _with_id(fields: List[str]) -> List[str]:
+    """Validate field paths and put ``Id`` first."""
+    for path in fields:
+        if not _VALID_FIELD_PATH_RE.match(path):
+            raise ValueError(f"Invalid field path: '{path}'")
+    return ["Id"] + [path for path in fields if path.lower() != "id"]
+
+
+def _all_records(pages: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [dict(record) for page in pages for record in page.get("records", [])]
+
+
+def _child_records(
+    result: Optional[Dict[str, Any]], query_more: Callable[[str], Dict[str, Any]]
+) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a child subquery result, following its pages."""
+    while result:
+        yield from result.get("records", [])
+        if result.get("done", True) or not result.get("nextRecordsUrl"):
+            return
+        result = query_more(result["nextRecordsUrl"])
+
+
+def _compact(value: Any) -> Any:
+    """Drop ``attributes`` blocks from a record and its related records."""
+    if isinstance(value, dict):
+        return {k: _compact(v) for k, v in value.items() if k != "attributes"}
+    if isinstance(value, list):
+        return [_compact(item) for item in value]
+    return value
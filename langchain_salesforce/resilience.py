@@ -0,0 +1,166 @@
+"""Circuit breaking and load shedding for Salesforce calls.
+
+When Salesforce is degraded every call waits for its full timeout, and the
+waiting threads pile up. A ``CircuitBreaker`` counts consecutive failed (or
+too slow) calls; past a threshold it opens and calls fail fast, or are
+served from cache, until a reset timeout has passed. It then lets a few
+probe calls through (half-open) and closes again once one succeeds.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ServiceUnavailableError(RuntimeError):
+    """Raised when a call is rejected locally to protect Salesforce or us."""
+
+
+class CircuitOpenError(ServiceUnavailableError):
+    """Raised when a circuit breaker rejects a call."""
+
+
+class LoadSheddingError(ServiceUnavailableError):
+    """Raised when too many calls are already in flight."""
+
+
+def is_service_failure(exc: BaseException) -> bool:
+    """Return True if ``exc`` signals a degraded service, not a bad request.
+
+    Network errors and timeouts (``requests`` exceptions are ``OSError``
+    subclasses) and HTTP 5xx responses count; errors such as a malformed
+    query or a missing record show that Salesforce is answering.
+    """
+    if isinstance(exc, (OSError, TimeoutError)):
+        return True
+    status = getattr(exc, "status", None)
+    return isinstance(status, int) and status >= 500
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker.
+
+    Args:
+        name: Name reported in errors and metrics.
+        failure_threshold: Consecutive failures that open the circuit.
+        reset_timeout: Seconds the circuit stays open before probing.
+        slow_call_seconds: Calls slower than this count as failures.
+        half_open_max_calls: Probe calls allowed at once while half-open.
+        clock: Monotonic clock, replaceable for testing.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        slow_call_seconds: Optional[float] = None,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be a positive integer")
+        if half_open_max_calls <= 0:
+            raise ValueError("half_open_max_calls must be a positive integer")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.slow_call_seconds = slow_call_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._consecutive_failures = 0
+        self._probes = 0
+        self._counts = {"successes": 0, "failures": 0, "slow_calls": 0, "rejected": 0}
+        self._transitions: Dict[str, int] = {}
+
+    @property
+    def state(self) -> str:
+        """Current state: ``"closed"``, ``"open"`` or ``"half_open"``."""
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may go out now.
+
+        A call that was allowed must be reported with ``record_success``,
+        ``record_failure`` or ``release``.
+        """
+        with self._lock:
+            self._refresh()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return True
+            self._counts["rejected"] += 1
+            return False
+
+    def record_success(self, duration: float = 0.0) -> None:
+        """Report an allowed call that got an answer after ``duration`` s."""
+        if self.slow_call_seconds is not None and duration > self.slow_call_seconds:
+            with self._lock:
+                self._counts["slow_calls"] += 1
+            self.record_failure()
+            return
+        with self._lock:
+            self._release_probe()
+            self._counts["successes"] += 1
+            self._consecutive_failures = 0
+            # Calls admitted before the circuit opened do not close it
+            if self._state == HALF_OPEN:
+                self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        """Report an allowed call that failed."""
+        with self._lock:
+            self._release_probe()
+            self._counts["failures"] += 1
+            self._consecutive_failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED
+                and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self._transition(OPEN)
+
+    def release(self) -> None:
+        """Report an allowed call that never reached Salesforce."""
+        with self._lock:
+            self._release_probe()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return the state, call counters and state transition counts."""
+        with self._lock:
+            self._refresh()
+            return {
+                "name": self.name,
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                **self._counts,
+                "transitions": dict(self._transitions),
+            }
+
+    def _refresh(self) -> None:
+        if (
+            self._state == OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            self._transition(HALF_OPEN)
+
+    def _release_probe(self) -> None:
+        if self._state == HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def _transition(self, state: str) -> None:
+        key = f"{self._state}->{state}"
+        self._transitions[key] = self._transitions.get(key, 0) + 1
+        self._state = state
+        self._probes = 0
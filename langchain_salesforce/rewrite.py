@@ -0,0 +1,202 @@
+"""Rewriting of agent-generated SOQL queries to bound their result size.
+
+LLM-written queries frequently omit LIMIT or select far more fields than the
+task needs. ``QueryRewriter`` enforces a default and maximum LIMIT, caps the
+number of selected fields and, when asked to, expands ``FIELDS(ALL)``-style
+selections into explicit field lists from the object describe, reporting
+every change it makes so the caller can tell the model what happened.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_salesforce.soql import (
+    SelectItem,
+    SOQLParseError,
+    SOQLQuery,
+    parse_soql,
+    to_soql,
+)
+
+# Salesforce rejects FIELDS(ALL) and FIELDS(CUSTOM) without LIMIT <= 200
+_FIELDS_FUNCTION_LIMIT = 200
+
+# Binary fields are fetched one record at a time and are never worth
+# pulling in through an expanded field list
+_EXCLUDED_FIELD_TYPES = {"base64"}
+
+_FIELD_SETS = {"ALL", "CUSTOM", "STANDARD"}
+
+_AGGREGATE_FUNCTIONS = {"AVG", "COUNT", "COUNT_DISTINCT", "MAX", "MIN", "SUM"}
+
+
+@dataclass
+class RewriteResult:
+    """Outcome of rewriting a query.
+
+    Attributes:
+        query: The query to send; the original string when nothing changed.
+        rewrites: Human-readable descriptions of each change made.
+    """
+
+    query: str
+    rewrites: List[str] = field(default_factory=list)
+
+    @property
+    def rewritten(self) -> bool:
+        return bool(self.rewrites)
+
+
+class QueryRewriter:
+    """Bound the LIMIT and SELECT list of SOQL queries.
+
+    Only the outer query is rewritten; subqueries are left as written.
+    Queries the local parser does not understand are returned unchanged.
+
+    Args:
+        describe: Returns the describe of an object; expected to be cached.
+        default_limit: LIMIT added to queries that have none.
+        max_limit: Upper bound for LIMIT; larger limits are reduced and
+            queries without LIMIT get this one when no default is set.
+        max_fields: Maximum number of plain fields in the SELECT list. ``Id``
+            is always kept; the remaining fields keep their order.
+        expand_fields: Replace ``FIELDS(ALL)``, ``FIELDS(STANDARD)`` and
+            ``FIELDS(CUSTOM)`` with the fields they select, so that
+            ``max_fields`` applies to them too. Needs the object describe.
+    """
+
+    def __init__(
+        self,
+        describe: Callable[[str], Dict[str, Any]],
+        default_limit: Optional[int] = None,
+        max_limit: Optional[int] = None,
+        max_fields: Optional[int] = None,
+        expand_fields: bool = False,
+    ) -> None:
+        for name, value in (
+            ("default_limit", default_limit),
+            ("max_limit", max_limit),
+            ("max_fields", max_fields),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be a positive integer")
+        if default_limit and max_limit and default_limit > max_limit:
+            raise ValueError("default_limit must not exceed max_limit")
+        self._describe = describe
+        self.default_limit = default_limit
+        self.max_limit = max_limit
+        self.max_fields = max_fields
+        self.expand_fields = expand_fields
+
+    def rewrite(self, query: str) -> RewriteResult:
+        """Return ``query`` rewritten to respect the configured bounds."""
+        try:
+            parsed = parse_soql(query)
+        except SOQLParseError:
+            return RewriteResult(query)
+
+        rewrites = self._expand_fields(parsed) if self.expand_fields else []
+        rewrites += self._cap_fields(parsed)
+        rewrites += self._bound_limit(parsed)
+        if not rewrites:
+            return RewriteResult(query)
+        return RewriteResult(to_soql(parsed), rewrites)
+
+    def _expand_fields(self, parsed: SOQLQuery) -> List[str]:
+        items = [item for item in parsed.select if item.function == "FIELDS"]
+        if not items:
+            return []
+        from simple_salesforce.exceptions import SalesforceError
+
+        try:
+            describe = self._describe(parsed.object_name)
+        except (SalesforceError, ValueError):
+            # Leave the query alone; Salesforce will report the problem
+            return []
+
+        rewrites = []
+        selected = {name.lower() for name in parsed.fields}
+        select: List[SelectItem] = []
+        for item in parsed.select:
+            kind = item.arguments[0].upper() if len(item.arguments) == 1 else None
+            if item.function != "FIELDS" or kind not in _FIELD_SETS:
+                select.append(item)
+                continue
+            names = [
+                name
+                for name in _field_set(describe, kind)
+                if name.lower() not in selected
+            ]
+            selected.update(name.lower() for name in names)
+            select.extend(SelectItem(expression=name) for name in names)
+            rewrites.append(f"Expanded {item.expression} to {len(names)} fields")
+        parsed.select = select
+        return rewrites
+
+    def _cap_fields(self, parsed: SOQLQuery) -> List[str]:
+        seen = set()
+        select: List[SelectItem] = []
+        duplicates = 0
+        for item in parsed.select:
+            if item.is_field:
+                key = f"{item.expression} {item.alias or ''}".lower()
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+            select.append(item)
+        rewrites = []
+        if duplicates:
+            rewrites.append(f"Removed {duplicates} duplicate fields")
+
+        fields = [item for item in select if item.is_field]
+        if self.max_fields is not None and len(fields) > self.max_fields:
+            keep = {id(item) for item in fields if item.expression.lower() == "id"}
+            for item in fields:
+                if len(keep) >= self.max_fields:
+                    break
+                keep.add(id(item))
+            select = [item for item in select if not item.is_field or id(item) in keep]
+            rewrites.append(
+                f"Selected {len(keep)} of {len(fields)} fields "
+                f"(max_fields={self.max_fields})"
+            )
+        parsed.select = select
+        return rewrites
+
+    def _bound_limit(self, parsed: SOQLQuery) -> List[str]:
+        functions = {item.function for item in parsed.select if item.function}
+        if functions & _AGGREGATE_FUNCTIONS and not parsed.group_by:
+            # Aggregates without GROUP BY return a single row
+            return []
+
+        max_limit = self.max_limit
+        if any(
+            item.function == "FIELDS"
+            and [argument.upper() for argument in item.arguments] != ["STANDARD"]
+            for item in parsed.select
+        ):
+            max_limit = min(max_limit or _FIELDS_FUNCTION_LIMIT, _FIELDS_FUNCTION_LIMIT)
+        if parsed.limit is None:
+            limit = self.default_limit or max_limit
+            if limit is None:
+                return []
+            parsed.limit = min(limit, max_limit) if max_limit else limit
+            return [f"Added LIMIT {parsed.limit}"]
+        if max_limit is not None and parsed.limit > max_limit:
+            original, parsed.limit = parsed.limit, max_limit
+            return [f"Reduced LIMIT {original} to {max_limit}"]
+        return []
+
+
+def _field_set(describe: Dict[str, Any], kind: str) -> List[str]:
+    """Return the field names ``FIELDS(kind)`` selects, ``Id`` and Name first."""
+    names = []
+    for field_meta in describe.get("fields", []):
+        if field_meta.get("type") in _EXCLUDED_FIELD_TYPES:
+            continue
+        custom = bool(field_meta.get("custom"))
+        if kind == "ALL" or (kind == "CUSTOM") == custom:
+            names.append(field_meta["name"])
+    leading = [name for name in ("Id", "Name") if name in names]
+    return leading + [name for name in names if name not in leading]
@@ -0,0 +1,89 @@
+"""SOSL searches for the ``search`` tool operation.
+
+A single SOSL search uses Salesforce's search index across several objects,
+where the equivalent SOQL would be one ``LIKE`` query (and table scan) per
+object. This module builds the SOSL string from a search term and the fields
+to return per object, and turns the response into a compact, ranked list of
+records.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from langchain_salesforce.sync import _VALID_FIELD_PATH_RE
+
+# Characters with a meaning in a SOSL search term; the wildcards * and ? are
+# left alone so that prefix searches such as "Acm*" still work
+_RESERVED_CHARS = frozenset("&|!{}[]()^~:\\\"'+-")
+
+
+def escape_search_term(term: str) -> str:
+    """Escape the reserved characters of a SOSL search term."""
+    return "".join(f"\\{char}" if char in _RESERVED_CHARS else char for char in term)
+
+
+def build_sosl(
+    term: str,
+    returning: Optional[Mapping[str, Sequence[str]]] = None,
+    limit: Optional[int] = None,
+) -> str:
+    """Build a SOSL search over all fields.
+
+    Args:
+        term: Text to search for.
+        returning: Objects to search, mapped to the fields to return for
+            each; an empty field list returns only the record Id. None
+            searches every searchable object.
+        limit: Maximum number of records returned across all objects.
+
+    Raises:
+        ValueError: If the term is blank or a field path is invalid.
+    """
+    if not term or not term.strip():
+        raise ValueError("Search term must not be empty")
+    sosl = f"FIND {{{escape_search_term(term.strip())}}} IN ALL FIELDS"
+    if returning:
+        specs = []
+        for object_name, fields in returning.items():
+            for field_path in fields:
+                if not _VALID_FIELD_PATH_RE.match(field_path):
+                    raise ValueError(f"Invalid field path: '{field_path}'")
+            specs.append(
+                f"{object_name}({', '.join(fields)})" if fields else object_name
+            )
+        sosl += f" RETURNING {', '.join(specs)}"
+    if limit is not None:
+        sosl += f" LIMIT {limit}"
+    return sosl
+
+
+def rank_records(records: List[Dict[str, Any]], term: str) -> List[Dict[str, Any]]:
+    """Compact search records and order them by how well they match ``term``.
+
+    Salesforce orders records by relevance within each object but lists the
+    objects one after another. Records whose values equal the term come
+    first, then values starting with it, then values containing it, then
+    records matching the most words of the term; ties keep the Salesforce
+    order.
+    """
+    phrase = term.replace("*", "").replace("?", "").strip().lower()
+    words = phrase.split()
+    ranked = []
+    for position, record in enumerate(records):
+        fields = {k: v for k, v in record.items() if k != "attributes"}
+        values = [value.lower() for value in fields.values() if isinstance(value, str)]
+        match = max((_match_level(value, phrase) for value in values), default=0)
+        found = sum(any(word in value for value in values) for word in words)
+        compact = {"type": record.get("attributes", {}).get("type"), **fields}
+        ranked.append((-match, -found, position, compact))
+    ranked.sort(key=lambda entry: entry[:3])
+    return [entry[3] for entry in ranked]
+
+
+def _match_level(value: str, phrase: str) -> int:
+    if not phrase:
+        return 0
+    if value == phrase:
+        return 3
+    if value.startswith(phrase):
+        return 2
+    return 1 if phrase in value else 0
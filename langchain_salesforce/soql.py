@@ -0,0 +1,571 @@
+"""Lightweight SOQL parser.
+
+Parses the subset of SOQL that is useful to inspect locally (select list
+with parent-child subqueries, single FROM object, WHERE conditions with
+semi-joins, GROUP BY, ORDER BY, LIMIT and OFFSET) into a small syntax tree.
+Anything outside that subset raises ``SOQLParseError`` so that callers can
+fall back to sending the query to Salesforce untouched. ``to_soql`` turns a
+(possibly modified) syntax tree back into a query string.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Union
+
+
+class SOQLParseError(ValueError):
+    """Raised when a SOQL string cannot be parsed."""
+
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<ws>\s+)
+  | (?P<string>'(?:[^'\\]|\\.)*')
+  | (?P<datetime>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2}))
+  | (?P<date>\d{4}-\d{2}-\d{2}(?![\w:]))
+  | (?P<number>[+-]?\d+(?:\.\d+)?(?![\w.]))
+  | (?P<ident>[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)
+  | (?P<op><=|>=|!=|<>|=|<|>)
+  | (?P<punct>[(),:])
+    """,
+    re.VERBOSE,
+)
+
+_STRING_ESCAPES = {
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "b": "\b",
+    "f": "\f",
+    '"': '"',
+    "'": "'",
+    "\\": "\\",
+    # LIKE wildcards keep their escape so they stay literal characters
+    "%": "\\%",
+    "_": "\\_",
+}
+
+_CLAUSE_KEYWORDS = {
+    "SELECT",
+    "FROM",
+    "WHERE",
+    "WITH",
+    "GROUP",
+    "HAVING",
+    "ORDER",
+    "LIMIT",
+    "OFFSET",
+    "FOR",
+    "UPDATE",
+    "USING",
+}
+
+
+@dataclass
+class Token:
+    """A lexical SOQL token."""
+
+    kind: str
+    text: str
+
+    @property
+    def upper(self) -> str:
+        return self.text.upper()
+
+
+@dataclass
+class Literal:
+    """A literal value in a WHERE condition.
+
+    ``kind`` is one of ``string``, ``number``, ``boolean``, ``null``, ``date``,
+    ``datetime`` or ``date_literal`` (relative literals such as ``TODAY`` or
+    ``LAST_N_DAYS:7``). ``text`` keeps the original SOQL spelling.
+    """
+
+    kind: str
+    value: Any
+    text: str
+
+
+@dataclass
+class Comparison:
+    """A ``field <operator> value`` condition."""
+
+    field: str
+    operator: str
+    value: Union[Literal, List[Literal], "SOQLQuery"]
+
+
+@dataclass
+class BooleanCondition:
+    """Conditions joined with ``AND`` or ``OR``."""
+
+    operator: str
+    operands: List["Condition"]
+
+
+@dataclass
+class NotCondition:
+    """A negated condition."""
+
+    operand: "Condition"
+
+
+Condition = Union[Comparison, BooleanCondition, NotCondition]
+
+
+@dataclass
+class SelectItem:
+    """An entry of the SELECT list: a field path, function call or subquery."""
+
+    expression: str
+    function: Optional[str] = None
+    arguments: List[str] = field(default_factory=list)
+    alias: Optional[str] = None
+    subquery: Optional["SOQLQuery"] = None
+
+    @property
+    def is_field(self) -> bool:
+        return self.function is None and self.subquery is None
+
+
+@dataclass
+class OrderItem:
+    """An ORDER BY entry."""
+
+    field: str
+    descending: bool = False
+    nulls: Optional[str] = None
+
+
+@dataclass
+class SOQLQuery:
+    """Parsed representation of a SOQL query."""
+
+    select: List[SelectItem]
+    object_name: str
+    alias: Optional[str] = None
+    where: Optional[Condition] = None
+    group_by: List[str] = field(default_factory=list)
+    order_by: List[OrderItem] = field(default_factory=list)
+    limit: Optional[int] = None
+    offset: Optional[int] = None
+
+    @property
+    def fields(self) -> List[str]:
+        """Plain field paths of the SELECT list."""
+        return [item.expression for item in self.select if item.is_field]
+
+    @property
+    def child_queries(self) -> List["SOQLQuery"]:
+        """Parent-child subqueries of the SELECT list."""
+        return [item.subquery for item in self.select if item.subquery]
+
+    @property
+    def semi_joins(self) -> List["SOQLQuery"]:
+        """Subqueries used as ``IN``/``NOT IN`` values in the WHERE clause."""
+        return _semi_joins(self.where)
+
+    @property
+    def subqueries(self) -> List["SOQLQuery"]:
+        """Every nested query: child subqueries and semi-joins."""
+        return self.child_queries + self.semi_joins
+
+
+def _tokenize(query: str) -> List[Token]:
+    tokens = []
+    pos = 0
+    while pos < len(query):
+        match = _TOKEN_RE.match(query, pos)
+        if match is None:
+            raise SOQLParseError(
+                f"Unexpected character at position {pos}: '{query[pos]}'"
+            )
+        kind = match.lastgroup or ""
+        if kind != "ws":
+            tokens.append(Token(kind, match.group()))
+        pos = match.end()
+    return tokens
+
+
+def _unescape_string(text: str) -> str:
+    body = text[1:-1]
+    out = []
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char == "\\" and i + 1 < len(body):
+            escaped = body[i + 1]
+            if escaped not in _STRING_ESCAPES:
+                raise SOQLParseError(f"Invalid escape sequence: '\\{escaped}'")
+            out.append(_STRING_ESCAPES[escaped])
+            i += 2
+        else:
+            out.append(char)
+            i += 1
+    return "".join(out)
+
+
+def _semi_joins(condition: Optional[Condition]) -> List[SOQLQuery]:
+    if condition is None:
+        return []
+    if isinstance(condition, Comparison):
+        value = condition.value
+        return [value] if isinstance(value, SOQLQuery) else []
+    if isinstance(condition, NotCondition):
+        return _semi_joins(condition.operand)
+    nested = []
+    for operand in condition.operands:
+        nested.extend(_semi_joins(operand))
+    return nested
+
+
+def field_paths(condition: Optional[Condition]) -> List[str]:
+    """Return every field path referenced by a WHERE condition."""
+    if condition is None:
+        return []
+    if isinstance(condition, Comparison):
+        return [condition.field]
+    if isinstance(condition, NotCondition):
+        return field_paths(condition.operand)
+    paths = []
+    for operand in condition.operands:
+        paths.extend(field_paths(operand))
+    return paths
+
+
+class _Parser:
+    """Recursive-descent parser over a token list."""
+
+    def __init__(self, query: str) -> None:
+        self.tokens = _tokenize(query)
+        self.pos = 0
+
+    def _peek(self, offset: int = 0) -> Optional[Token]:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def _next(self) -> Token:
+        token = self._peek()
+        if token is None:
+            raise SOQLParseError("Unexpected end of query")
+        self.pos += 1
+        return token
+
+    def _at_keyword(self, *keywords: str) -> bool:
+        token = self._peek()
+        return token is not None and token.kind == "ident" and token.upper in keywords
+
+    def _accept_keyword(self, *keywords: str) -> Optional[str]:
+        if self._at_keyword(*keywords):
+            return self._next().upper
+        return None
+
+    def _expect_keyword(self, keyword: str) -> None:
+        if self._accept_keyword(keyword) is None:
+            token = self._peek()
+            found = token.text if token else "end of query"
+            raise SOQLParseError(f"Expected {keyword}, found '{found}'")
+
+    def _accept_punct(self, char: str) -> bool:
+        token = self._peek()
+        if token is not None and token.kind == "punct" and token.text == char:
+            self.pos += 1
+            return True
+        return False
+
+    def _expect_punct(self, char: str) -> None:
+        if not self._accept_punct(char):
+            token = self._peek()
+            found = token.text if token else "end of query"
+            raise SOQLParseError(f"Expected '{char}', found '{found}'")
+
+    def _identifier(self) -> str:
+        token = self._next()
+        if token.kind != "ident":
+            raise SOQLParseError(f"Expected identifier, found '{token.text}'")
+        return token.text
+
+    def _integer(self) -> int:
+        token = self._next()
+        if token.kind != "number" or not token.text.isdigit():
+            raise SOQLParseError(f"Expected integer, found '{token.text}'")
+        return int(token.text)
+
+    def parse(self) -> SOQLQuery:
+        query = self._query()
+        token = self._peek()
+        if token is not None:
+            raise SOQLParseError(f"Unsupported SOQL syntax near '{token.text}'")
+        return query
+
+    def _subquery(self) -> SOQLQuery:
+        """Parse a parenthesized query; the opening parenthesis is consumed."""
+        query = self._query()
+        self._expect_punct(")")
+        return query
+
+    def _query(self) -> SOQLQuery:
+        self._expect_keyword("SELECT")
+        select = self._select_list()
+        self._expect_keyword("FROM")
+        object_name = self._identifier()
+        if "." in object_name:
+            raise SOQLParseError(f"Invalid object name: '{object_name}'")
+        query = SOQLQuery(select=select, object_name=object_name)
+
+        token = self._peek()
+        if token is not None and token.kind == "ident":
+            if token.upper not in _CLAUSE_KEYWORDS:
+                query.alias = self._identifier()
+
+        if self._accept_keyword("WHERE"):
+            query.where = self._or_condition()
+        if self._accept_keyword("GROUP"):
+            self._expect_keyword("BY")
+            query.group_by = self._identifier_list()
+        if self._accept_keyword("ORDER"):
+            self._expect_keyword("BY")
+            query.order_by = self._order_list()
+        if self._accept_keyword("LIMIT"):
+            query.limit = self._integer()
+        if self._accept_keyword("OFFSET"):
+            query.offset = self._integer()
+        return query
+
+    def _select_list(self) -> List[SelectItem]:
+        items = [self._select_item()]
+        while self._accept_punct(","):
+            items.append(self._select_item())
+        return items
+
+    def _select_item(self) -> SelectItem:
+        if self._accept_punct("("):
+            subquery = self._subquery()
+            return SelectItem(
+                expression=f"(SELECT ... FROM {subquery.object_name})",
+                subquery=subquery,
+            )
+        name = self._identifier()
+        if name.upper() == "TYPEOF":
+            raise SOQLParseError("TYPEOF is not supported")
+        if not self._accept_punct("("):
+            item = SelectItem(expression=name)
+        else:
+            arguments = []
+            if not self._accept_punct(")"):
+                arguments.append(self._identifier())
+                while self._accept_punct(","):
+                    arguments.append(self._identifier())
+                self._expect_punct(")")
+            item = SelectItem(
+                expression=f"{name}({', '.join(arguments)})",
+                function=name.upper(),
+                arguments=arguments,
+            )
+        token = self._peek()
+        if token is not None and token.kind == "ident":
+            if token.upper not in _CLAUSE_KEYWORDS:
+                item.alias = self._identifier()
+        return item
+
+    def _identifier_list(self) -> List[str]:
+        names = [self._identifier()]
+        while self._accept_punct(","):
+            names.append(self._identifier())
+        return names
+
+    def _order_list(self) -> List[OrderItem]:
+        items = []
+        while True:
+            item = OrderItem(field=self._identifier())
+            direction = self._accept_keyword("ASC", "DESC")
+            item.descending = direction == "DESC"
+            if self._accept_keyword("NULLS"):
+                nulls = self._accept_keyword("FIRST", "LAST")
+                if nulls is None:
+                    raise SOQLParseError("Expected FIRST or LAST after NULLS")
+                item.nulls = nulls
+            items.append(item)
+            if not self._accept_punct(","):
+                return items
+
+    def _or_condition(self) -> Condition:
+        operands = [self._and_condition()]
+        while self._accept_keyword("OR"):
+            operands.append(self._and_condition())
+        if len(operands) == 1:
+            return operands[0]
+        return BooleanCondition("OR", operands)
+
+    def _and_condition(self) -> Condition:
+        operands = [self._unary_condition()]
+        while self._accept_keyword("AND"):
+            operands.append(self._unary_condition())
+        if len(operands) == 1:
+            return operands[0]
+        return BooleanCondition("AND", operands)
+
+    def _unary_condition(self) -> Condition:
+        if self._accept_keyword("NOT"):
+            return NotCondition(self._unary_condition())
+        if self._accept_punct("("):
+            condition = self._or_condition()
+            self._expect_punct(")")
+            return condition
+        return self._comparison()
+
+    def _comparison(self) -> Comparison:
+        field_path = self._identifier()
+        token = self._peek()
+        if token is not None and token.kind == "punct" and token.text == "(":
+            raise SOQLParseError("Functions in WHERE conditions are not supported")
+
+        operator = self._operator()
+        value: Union[Literal, List[Literal], SOQLQuery]
+        if operator in ("IN", "NOT IN", "INCLUDES", "EXCLUDES"):
+            self._expect_punct("(")
+            if operator in ("IN", "NOT IN") and self._at_keyword("SELECT"):
+                return Comparison(field_path, operator, self._subquery())
+            value = [self._literal()]
+            while self._accept_punct(","):
+                value.append(self._literal())
+            self._expect_punct(")")
+        else:
+            value = self._literal()
+        return Comparison(field=field_path, operator=operator, value=value)
+
+    def _operator(self) -> str:
+        token = self._next()
+        if token.kind == "op":
+            return "!=" if token.text == "<>" else token.text
+        if token.kind == "ident":
+            if token.upper in ("LIKE", "IN", "INCLUDES", "EXCLUDES"):
+                return token.upper
+            if token.upper == "NOT" and self._accept_keyword("IN"):
+                return "NOT IN"
+        raise SOQLParseError(f"Expected comparison operator, found '{token.text}'")
+
+    def _literal(self) -> Literal:
+        token = self._next()
+        if token.kind == "string":
+            return Literal("string", _unescape_string(token.text), token.text)
+        if token.kind == "number":
+            value: Union[int, float]
+            value = float(token.text) if "." in token.text else int(token.text)
+            return Literal("number", value, token.text)
+        if token.kind in ("date", "datetime"):
+            return Literal(token.kind, token.text, token.text)
+        if token.kind == "ident":
+            if token.upper in ("TRUE", "FALSE"):
+                return Literal("boolean", token.upper == "TRUE", token.text)
+            if token.upper == "NULL":
+                return Literal("null", None, token.text)
+            if self._accept_punct(":"):
+                amount = self._integer()
+                text = f"{token.text}:{amount}"
+                return Literal("date_literal", (token.upper, amount), text)
+            return Literal("date_literal", (token.upper, None), token.text)
+        raise SOQLParseError(f"Expected literal value, found '{token.text}'")
+
+
+def parse_soql(query: str) -> SOQLQuery:
+    """Parse a SOQL query string.
+
+    Raises:
+        SOQLParseError: If the query is malformed or uses syntax outside the
+            supported subset.
+    """
+    return _Parser(query).parse()
+
+
+def parse_condition(condition: str) -> Condition:
+    """Parse a standalone WHERE condition, such as ``"Amount > 0"``.
+
+    Raises:
+        SOQLParseError: If the condition is malformed or followed by other
+            clauses (GROUP BY, ORDER BY, LIMIT, ...).
+    """
+    parsed = parse_soql(f"SELECT Id FROM SObject WHERE {condition}")
+    if (
+        parsed.where is None
+        or parsed.group_by
+        or parsed.order_by
+        or parsed.limit is not None
+        or parsed.offset is not None
+    ):
+        raise SOQLParseError("Expected a condition without other clauses")
+    return parsed.where
+
+
+_STRING_QUOTES = {
+    "\\": "\\\\",
+    "'": "\\'",
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+    "\b": "\\b",
+    "\f": "\\f",
+}
+
+
+def quote_string(value: str) -> str:
+    """Return ``value`` as a quoted and escaped SOQL string literal."""
+    return "'" + "".join(_STRING_QUOTES.get(char, char) for char in value) + "'"
+
+
+def _condition_to_soql(condition: Condition, nested: bool = False) -> str:
+    if isinstance(condition, Comparison):
+        value = condition.value
+        if isinstance(value, SOQLQuery):
+            text = f"({to_soql(value)})"
+        elif isinstance(value, list):
+            text = f"({', '.join(item.text for item in value)})"
+        else:
+            text = value.text
+        return f"{condition.field} {condition.operator} {text}"
+    if isinstance(condition, NotCondition):
+        return f"NOT {_condition_to_soql(condition.operand, nested=True)}"
+    joined = f" {condition.operator} ".join(
+        _condition_to_soql(operand, nested=True) for operand in condition.operands
+    )
+    return f"({joined})" if nested else joined
+
+
+def _select_item_to_soql(item: SelectItem) -> str:
+    if item.subquery is not None:
+        return f"({to_soql(item.subquery)})"
+    if item.alias:
+        return f"{item.expression} {item.alias}"
+    return item.expression
+
+
+def to_soql(query: SOQLQuery) -> str:
+    """Serialize a parsed query back into a SOQL string.
+
+    Literals keep their original spelling, so ``to_soql(parse_soql(q))`` is
+    equivalent to ``q`` up to whitespace, keyword case and parentheses.
+    """
+    parts = [
+        "SELECT " + ", ".join(_select_item_to_soql(item) for item in query.select),
+        f"FROM {query.object_name}",
+    ]
+    if query.alias:
+        parts.append(query.alias)
+    if query.where is not None:
+        parts.append(f"WHERE {_condition_to_soql(query.where)}")
+    if query.group_by:
+        parts.append(f"GROUP BY {', '.join(query.group_by)}")
+    if query.order_by:
+        orders = []
+        for order in query.order_by:
+            text = order.field + (" DESC" if order.descending else "")
+            if order.nulls:
+                text += f" NULLS {order.nulls}"
+            orders.append(text)
+        parts.append(f"ORDER BY {', '.join(orders)}")
+    if query.limit is not None:
+        parts.append(f"LIMIT {query.limit}")
+    if query.offset is not None:
+        parts.append(f"OFFSET {query.offset}")
+    return " ".join(parts)
@@ -0,0 +1,152 @@
+"""Spooling of large query results to disk.
+
+A query returning hundreds of thousands of records would otherwise be held
+in memory as one list of dicts per caller, so a worker serving a few such
+queries at once grows by gigabytes. Spooled results are written page by page
+to a compact JSON Lines file in the temporary directory and handed back as a
+``SpooledResult``, which reads the records lazily through a memory map. Only
+one result page is held in memory at a time while spooling, and the file is
+deleted when the handle is closed or garbage collected.
+"""
+
+import json
+import mmap
+import os
+import tempfile
+import weakref
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+class SpooledResult:
+    """Handle to query results spooled to a JSON Lines file.
+
+    Iterating the handle yields the records in query order, decoding one
+    line at a time from a memory map of the file, so the records are never
+    all in memory. Closing the handle deletes the file.
+
+    Attributes:
+        path: The JSON Lines file, one record per line.
+        query: The SOQL query the records answer.
+        total_size: ``totalSize`` reported by Salesforce.
+        record_count: Number of records in the file.
+        size_bytes: Size of the file.
+        field_counts: Top-level fields mapped to how many records have a
+            non-null value for them.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        path: str,
+        query: str,
+        total_size: int,
+        record_count: int,
+        size_bytes: int,
+        field_counts: Dict[str, int],
+    ) -> None:
+        self.path = path
+        self.query = query
+        self.total_size = total_size
+        self.record_count = record_count
+        self.size_bytes = size_bytes
+        self.field_counts = field_counts
+        self._finalizer = weakref.finalize(self, _remove, path)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if self.closed:
+            raise ValueError("Spooled result is closed")
+        if self.size_bytes == 0:
+            return
+        with open(self.path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for line in iter(mapped.readline, b""):
+                    yield json.loads(line)
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def __enter__(self) -> "SpooledResult":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    def close(self) -> None:
+        """Delete the spool file."""
+        self._finalizer()
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the summary statistics of the spooled result."""
+        return {
+            "spooled": True,
+            "query": self.query,
+            "totalSize": self.total_size,
+            "record_count": self.record_count,
+            "size_bytes": self.size_bytes,
+            "path": self.path,
+            "field_counts": self.field_counts,
+        }
+
+    def __str__(self) -> str:
+        return json.dumps(self.summary())
+
+    def __repr__(self) -> str:
+        return (
+            f"SpooledResult(path={self.path!r}, record_count={self.record_count}, "
+            f"size_bytes={self.size_bytes})"
+        )
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def spool_pages(
+    query: str,
+    pages: Iterable[Dict[str, Any]],
+    directory: Optional[str] = None,
+) -> SpooledResult:
+    """Write the records of query result pages to a new spool file.
+
+    Args:
+        query: The query the pages answer.
+        pages: Result pages; each is released once written.
+        directory: Directory of the spool file; the system temporary
+            directory by default.
+    """
+    handle, path = tempfile.mkstemp(
+        prefix="salesforce-query-", suffix=".jsonl", dir=directory
+    )
+    total_size = 0
+    record_count = 0
+    field_counts: Dict[str, int] = {}
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as file:
+            for page in pages:
+                total_size = page.get("totalSize", total_size)
+                records: List[Dict[str, Any]] = page.get("records") or []
+                for record in records:
+                    file.write(json.dumps(record, separators=(",", ":")))
+                    file.write("\n")
+                    for name, value in record.items():
+                        if name != "attributes":
+                            count = field_counts.get(name, 0)
+                            field_counts[name] = count + (value is not None)
+                record_count += len(records)
+    except BaseException:
+        _remove(path)
+        raise
+    return SpooledResult(
+        path,
+        query,
+        total_size,
+        record_count,
+        os.path.getsize(path),
+        field_counts,
+    )
@@ -0,0 +1,433 @@
+"""Change event subscriber for precise cache invalidation.
+
+``ChangeEventSubscriber`` listens to Change Data Capture (``/data/...``) or
+PushTopic (``/topic/...``) channels and invalidates the query and describe
+caches of a ``SalesforceTool`` - and refreshes an attached ``SQLiteMirror`` -
+as soon as the underlying records change, instead of waiting for a TTL.
+
+Events are read from an ``EventSource``. ``CometDEventSource`` talks to the
+Streaming API over CometD long polling; ``QueueEventSource`` is fed in-process
+and is used for tests or to bridge events received by other means (e.g. a
+Pub/Sub API gRPC client).
+"""
+
+import logging
+import queue
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
+
+import requests
+from simple_salesforce.api import DEFAULT_API_VERSION
+
+from langchain_salesforce.sync import WatermarkStore
+
+if TYPE_CHECKING:
+    from langchain_salesforce.mirror import SQLiteMirror
+    from langchain_salesforce.tools import SalesforceTool
+
+logger = logging.getLogger(__name__)
+
+# Replay id meaning "only new events" in the Streaming API replay extension
+_REPLAY_NEW_EVENTS = -1
+
+_PUSH_TOPIC_CHANGE_TYPES = {
+    "created": "CREATE",
+    "updated": "UPDATE",
+    "deleted": "DELETE",
+    "undeleted": "UNDELETE",
+}
+
+
+@dataclass
+class ChangeEvent:
+    """A record change decoded from a streaming message."""
+
+    channel: str
+    object_name: Optional[str]
+    change_type: str
+    record_ids: List[str] = field(default_factory=list)
+    changed_fields: List[str] = field(default_factory=list)
+    replay_id: Optional[int] = None
+
+    @property
+    def is_gap(self) -> bool:
+        """Whether this is a gap/overflow event without full change details."""
+        return self.change_type.startswith("GAP_")
+
+
+def parse_change_event(
+    message: Dict[str, Any], topic_objects: Optional[Dict[str, str]] = None
+) -> Optional[ChangeEvent]:
+    """Decode a Bayeux data message into a ``ChangeEvent``.
+
+    Args:
+        message: Message with ``channel`` and ``data`` keys.
+        topic_objects: Mapping of PushTopic name to the SObject it watches,
+            since PushTopic payloads do not carry the object name.
+
+    Returns:
+        The decoded event, or None for channels that are not change events.
+    """
+    channel = message.get("channel", "")
+    data = message.get("data") or {}
+    replay_id = (data.get("event") or {}).get("replayId")
+
+    if channel.startswith("/data/"):
+        payload = data.get("payload") or {}
+        header = payload.get("ChangeEventHeader") or {}
+        return ChangeEvent(
+            channel=channel,
+            object_name=header.get("entityName"),
+            change_type=header.get("changeType", "UPDATE"),
+            record_ids=list(header.get("recordIds") or []),
+            changed_fields=list(header.get("changedFields") or []),
+            replay_id=replay_id,
+        )
+
+    if channel.startswith("/topic/"):
+        topic = channel[len("/topic/") :]
+        event_type = (data.get("event") or {}).get("type", "updated")
+        sobject = data.get("sobject") or {}
+        return ChangeEvent(
+            channel=channel,
+            object_name=(topic_objects or {}).get(topic),
+            change_type=_PUSH_TOPIC_CHANGE_TYPES.get(event_type, "UPDATE"),
+            record_ids=[sobject["Id"]] if sobject.get("Id") else [],
+            changed_fields=[name for name in sobject if name != "Id"],
+            replay_id=replay_id,
+        )
+    return None
+
+
+class EventSource(ABC):
+    """A stream of Bayeux messages from Salesforce."""
+
+    @abstractmethod
+    def subscribe(self, channels: Dict[str, int]) -> None:
+        """Subscribe to channels, each starting after the given replay id."""
+
+    @abstractmethod
+    def poll(self) -> List[Dict[str, Any]]:
+        """Block until messages arrive (or a timeout passes) and return them."""
+
+    def close(self) -> None:
+        """Release any connection held by the source."""
+
+
+class QueueEventSource(EventSource):
+    """In-process event source fed through ``put``.
+
+    Useful in tests and to forward events decoded by another client, such as
+    a Pub/Sub API subscriber, into ``ChangeEventSubscriber``.
+    """
+
+    def __init__(self, poll_timeout: float = 1.0) -> None:
+        self.poll_timeout = poll_timeout
+        self.subscriptions: Dict[str, int] = {}
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+
+    def put(self, message: Dict[str, Any]) -> None:
+        """Enqueue a Bayeux message."""
+        self._queue.put(message)
+
+    def subscribe(self, channels: Dict[str, int]) -> None:
+        self.subscriptions.update(channels)
+
+    def poll(self) -> List[Dict[str, Any]]:
+        try:
+            messages = [self._queue.get(timeout=self.poll_timeout)]
+        except queue.Empty:
+            return []
+        while True:
+            try:
+                messages.append(self._queue.get_nowait())
+            except queue.Empty:
+                return messages
+
+
+class CometDEventSource(EventSource):
+    """Streaming API client using CometD (Bayeux) long polling.
+
+    Args:
+        session_id: OAuth access token / session id.
+        instance: Salesforce instance host, e.g. ``na1.salesforce.com``.
+        api_version: API version used for the ``/cometd/<version>`` endpoint.
+        session: Optional requests session; cookies set during the handshake
+            must be kept between calls, so a dedicated session is used by
+            default.
+        timeout: HTTP timeout in seconds, longer than the server's 110 second
+            long-poll window.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        session_id: str,
+        instance: str,
+        api_version: str = DEFAULT_API_VERSION,
+        session: Optional[requests.Session] = None,
+        timeout: float = 120.0,
+    ) -> None:
+        self.endpoint = f"https://{instance}/cometd/{api_version}"
+        self.timeout = timeout
+        self._session = session or requests.Session()
+        self._headers = {
+            "Authorization": f"Bearer {session_id}",
+            "Content-Type": "application/json",
+        }
+        self._client_id: Optional[str] = None
+        self._channels: Dict[str, int] = {}
+
+    @classmethod
+    def from_tool(cls, tool: "SalesforceTool") -> "CometDEventSource":
+        """Create a source reusing the session of a tool's Salesforce client."""
+        client = tool._main_client()
+        return cls(
+            session_id=client.session_id,
+            instance=client.sf_instance,
+            api_version=client.sf_version or DEFAULT_API_VERSION,
+        )
+
+    def _post(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        response = self._session.post(
+            self.endpoint, json=messages, headers=self._headers, timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _handshake(self) -> None:
+        replies = self._post(
+            [
+                {
+                    "channel": "/meta/handshake",
+                    "version": "1.0",
+                    "supportedConnectionTypes": ["long-polling"],
+                    "ext": {"replay": True},
+                }
+            ]
+        )
+        reply = replies[0]
+        if not reply.get("successful"):
+            raise ConnectionError(f"CometD handshake failed: {reply.get('error')}")
+        self._client_id = reply["clientId"]
+        for channel, replay_id in self._channels.items():
+            self._subscribe_channel(channel, replay_id)
+
+    def _subscribe_channel(self, channel: str, replay_id: int) -> None:
+        replies = self._post(
+            [
+                {
+                    "channel": "/meta/subscribe",
+                    "clientId": self._client_id,
+                    "subscription": channel,
+                    "ext": {"replay": {channel: replay_id}},
+                }
+            ]
+        )
+        reply = replies[0]
+        if not reply.get("successful"):
+            raise ConnectionError(
+                f"Subscription to '{channel}' failed: {reply.get('error')}"
+            )
+
+    def subscribe(self, channels: Dict[str, int]) -> None:
+        self._channels.update(channels)
+        if self._client_id is None:
+            self._handshake()
+            return
+        for channel, replay_id in channels.items():
+            self._subscribe_channel(channel, replay_id)
+
+    def track_replay(self, channel: str, replay_id: int) -> None:
+        """Resume ``channel`` after ``replay_id`` on the next re-handshake."""
+        if channel in self._channels:
+            self._channels[channel] = replay_id
+
+    def poll(self) -> List[Dict[str, Any]]:
+        if self._client_id is None:
+            self._handshake()
+        replies = self._post(
+            [
+                {
+                    "channel": "/meta/connect",
+                    "clientId": self._client_id,
+                    "connectionType": "long-polling",
+                }
+            ]
+        )
+        messages = []
+        for reply in replies:
+            if reply.get("channel") == "/meta/connect":
+                advice = reply.get("advice") or {}
+                if not reply.get("successful") or advice.get("reconnect") == (
+                    "handshake"
+                ):
+                    # Re-handshake on the next poll, resuming from replay ids
+                    self._client_id = None
+            else:
+                messages.append(reply)
+        return messages
+
+    def close(self) -> None:
+        if self._client_id is not None:
+            try:
+                self._post(
+                    [{"channel": "/meta/disconnect", "clientId": self._client_id}]
+                )
+            finally:
+                self._client_id = None
+
+
+class ChangeEventSubscriber:
+    """Apply streaming change events to a tool's caches and local mirror.
+
+    For every record change the subscriber drops the cached queries of the
+    changed object and refreshes the mirror, if any. Events that mention a
+    field missing from the cached describe drop that describe, since the
+    object schema has changed. Gap events and stream failures invalidate
+    conservatively so cached data is never trusted past a lost event.
+
+    Example:
+        .. code-block:: python
+
+            subscriber = ChangeEventSubscriber(
+                tool,
+                CometDEventSource.from_tool(tool),
+                channels=["/data/AccountChangeEvent"],
+                mirror=mirror,
+            )
+            subscriber.start()
+
+    Args:
+        tool: Tool whose caches are invalidated.
+        source: Where streaming messages are read from.
+        channels: CDC or PushTopic channels to subscribe to.
+        mirror: Optional mirror to refresh when mirrored objects change.
+        topic_objects: Mapping of PushTopic name to the SObject it watches.
+        replay_store: Optional store persisting the last replay id of each
+            channel, so a restarted subscriber resumes without missing events.
+        on_event: Optional callback invoked with each decoded event.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        tool: "SalesforceTool",
+        source: EventSource,
+        channels: Sequence[str],
+        mirror: Optional["SQLiteMirror"] = None,
+        topic_objects: Optional[Dict[str, str]] = None,
+        replay_store: Optional[WatermarkStore] = None,
+        on_event: Optional[Callable[[ChangeEvent], None]] = None,
+    ) -> None:
+        if not channels:
+            raise ValueError("At least one channel is required")
+        self.tool = tool
+        self.source = source
+        self.channels = list(channels)
+        self.mirror = mirror
+        self.topic_objects = topic_objects or {}
+        self.replay_store = replay_store
+        self.on_event = on_event
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _replay_ids(self) -> Dict[str, int]:
+        replay_ids = {}
+        for channel in self.channels:
+            stored = self.replay_store.get(channel) if self.replay_store else None
+            replay_ids[channel] = int(stored) if stored else _REPLAY_NEW_EVENTS
+        return replay_ids
+
+    def invalidate_all(self) -> None:
+        """Drop every cached query and record and mark mirrored objects stale."""
+        self.tool.invalidate_queries()
+        self.tool.invalidate_records()
+        if self.mirror is not None:
+            for object_name in self.mirror.objects:
+                self.mirror.invalidate(object_name)
+
+    def _schema_changed(self, event: ChangeEvent) -> bool:
+        if event.object_name is None or not event.changed_fields:
+            return False
+        describe = self.tool._describe_cache.get(
+            f"describe:{event.object_name.lower()}"
+        )
+        if describe is None:
+            return False
+        known = {f.get("name", "").lower() for f in describe.get("fields", [])}
+        # Compound fields (e.g. Name.FirstName) report their parent in describe
+        return any(
+            name.split(".")[0].lower() not in known for name in event.changed_fields
+        )
+
+    def handle(self, message: Dict[str, Any]) -> Optional[ChangeEvent]:
+        """Apply a single Bayeux message and return the decoded event."""
+        event = parse_change_event(message, self.topic_objects)
+        if event is None:
+            return None
+
+        if event.object_name is None:
+            self.invalidate_all()
+        else:
+            if self._schema_changed(event):
+                self.tool.invalidate_describe(event.object_name)
+            self.tool.invalidate_queries(event.object_name)
+            # Gap events may not list every changed record
+            record_ids = () if event.is_gap else event.record_ids
+            self.tool.invalidate_records(event.object_name, record_ids)
+            if self.mirror is not None and event.object_name in self.mirror.objects:
+                self.mirror.invalidate(event.object_name)
+                try:
+                    self.mirror.refresh(event.object_name)
+                except Exception:  # pylint: disable=broad-except
+                    # Stays stale, so queries fall back to the API
+                    logger.exception("Mirror refresh of %s failed", event.object_name)
+
+        if event.replay_id is not None:
+            if self.replay_store is not None:
+                self.replay_store.set(event.channel, str(event.replay_id))
+            if isinstance(self.source, CometDEventSource):
+                self.source.track_replay(event.channel, event.replay_id)
+        if self.on_event is not None:
+            self.on_event(event)
+        return event
+
+    def run_once(self) -> List[ChangeEvent]:
+        """Poll the source once and apply the messages received."""
+        events = []
+        for message in self.source.poll():
+            event = self.handle(message)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def start(self, retry_interval: float = 5.0) -> None:
+        """Subscribe and process events on a background daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self.source.subscribe(self._replay_ids())
+
+        def _loop() -> None:
+            while not self._stop_event.is_set():
+                try:
+                    self.run_once()
+                except Exception:  # pylint: disable=broad-except
+                    # Events may have been lost while disconnected
+                    logger.exception("Change event stream failed, invalidating")
+                    self.invalidate_all()
+                    self._stop_event.wait(retry_interval)
+
+        self._thread = threading.Thread(
+            target=_loop, name="salesforce-change-events", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread and close the source."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.source.close()
@@ -1,14 +1,86 @@
 """Salesforce tools for interacting with Salesforce CRM."""
 
+import asyncio
+import atexit
+import json
 import re
-from typing import Any, Callable, Dict, List, Optional, Type, Union, cast
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import partial
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from langchain_core.callbacks import CallbackManagerForToolRun
 from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import get_config_list, get_executor_for_config
 from langchain_core.tools import BaseTool
 from langchain_core.tools.base import ToolCall
 from pydantic import BaseModel, Field, PrivateAttr
-from simple_salesforce import Salesforce
+
+from langchain_salesforce.aggregate import (
+    MAX_GROUPS_PER_QUERY,
+    AggregateQuery,
+    resolve_field_type,
+)
+from langchain_salesforce.budget import OutputBudget
+from langchain_salesforce.cache import CacheBackend, ScopedCache, TTLCache
+from langchain_salesforce.hedging import (
+    HedgedCaller,
+    config_timeout,
+    deadline_scope,
+    remaining_time,
+)
+from langchain_salesforce.profiling import Profiler, span
+from langchain_salesforce.records import (
+    RecordCache,
+    to_id18,
+    validate_field_names,
+)
+from langchain_salesforce.related import plan_related_query
+from langchain_salesforce.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    LoadSheddingError,
+    is_service_failure,
+)
+from langchain_salesforce.rewrite import QueryRewriter
+from langchain_salesforce.search import build_sosl, rank_records
+from langchain_salesforce.soql import SOQLParseError, field_paths, parse_soql
+from langchain_salesforce.spool import SpooledResult, spool_pages
+from langchain_salesforce.typed import RecordSchema, record_schema
+from langchain_salesforce.validation import (
+    RecordValidator,
+    SOQLValidationError,
+    SOQLValidator,
+)
+from langchain_salesforce.writes import WriteBehindBuffer
+
+if TYPE_CHECKING:
+    # simple_salesforce (and the SOAP stack it pulls in) is imported on first
+    # login rather than with the package, to keep cold starts short
+    from simple_salesforce import Salesforce
+
+    from langchain_salesforce.mirror import SQLiteMirror
 
 # Regex for valid Salesforce object API names (alphanumeric + underscores,
 # must start with a letter, may end with __c, __r, __e, etc.)
@@ -17,6 +89,79 @@ _VALID_OBJECT_NAME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
 # Regex for valid Salesforce record IDs (15 or 18 alphanumeric characters)
 _VALID_RECORD_ID_RE = re.compile(r"^[A-Za-z0-9]{15}(?:[A-Za-z0-9]{3})?$")
 
+# Records per sObject Collections call and subrequests per composite call
+_COLLECTIONS_BATCH_SIZE = 200
+_COMPOSITE_BATCH_SIZE = 25
+
+# Operation name -> handler method, and the parameters each operation needs.
+# Built once at import time and never mutated, so concurrent calls share them
+# without locking.
+_OPERATIONS: Mapping[str, str] = MappingProxyType(
+    {
+        "query": "_execute_query_operation",
+        "describe": "_execute_describe",
+        "list_objects": "_execute_list_objects",
+        "create": "_execute_create",
+        "update": "_execute_update",
+        "delete": "_execute_delete",
+        "get_field_metadata": "_execute_get_field_metadata",
+        "fetch_more": "_execute_fetch_more",
+        "aggregate": "_execute_aggregate",
+        "search": "_execute_search",
+        "query_related": "_execute_query_related",
+        "get_record": "_execute_get_record",
+    }
+)
+
+_REQUIRED_PARAMS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "query": ("query",),
+        "describe": ("object_name",),
+        "list_objects": (),
+        "create": ("object_name", "record_data"),
+        "update": ("object_name", "record_id", "record_data"),
+        "delete": ("object_name", "record_id"),
+        "get_field_metadata": ("object_name", "field_name"),
+        "fetch_more": ("cursor",),
+        "aggregate": ("object_name",),
+        "search": ("search_term",),
+        "query_related": ("object_name",),
+        "get_record": ("object_name", "record_id"),
+    }
+)
+
+# Lifetime of the generation tokens that scope cached queries; a token that
+# expires or is evicted only turns the entries under it into misses
+_GENERATION_TTL = 24 * 3600.0
+
+# Operations that write; every other operation is a read that may be served
+# from cache while the circuit breaker is open
+_WRITE_OPERATIONS = frozenset({"create", "update", "delete"})
+
+_PARAM_ERRORS: Mapping[str, str] = MappingProxyType(
+    {
+        "query": "Query string is required for 'query' operation",
+        "describe": "Object name is required for 'describe' operation",
+        "create": "Object name and record data required for 'create' operation",
+        "update": "Object name, record ID, and data required for 'update' operation",
+        "delete": "Object name and record ID required for 'delete' operation",
+        "get_field_metadata": (
+            "Object name and field name required for 'get_field_metadata' operation"
+        ),
+        "fetch_more": "Cursor is required for 'fetch_more' operation",
+        "aggregate": "Object name is required for 'aggregate' operation",
+        "search": "Search term is required for 'search' operation",
+        "query_related": "Object name is required for 'query_related' operation",
+        "get_record": "Object name and record ID required for 'get_record' operation",
+    }
+)
+
+
+def _salesforce_login(**kwargs: Any) -> "Salesforce":
+    from simple_salesforce import Salesforce
+
+    return Salesforce(**kwargs)
+
 
 class SalesforceQueryInput(BaseModel):
     """Input schema for Salesforce query operations."""
@@ -26,7 +171,12 @@ class SalesforceQueryInput(BaseModel):
         description=(
             "The operation to perform: 'query' (SOQL query), 'describe' "
             "(get object schema), 'list_objects' (get available objects), "
-            "'create', 'update', 'delete', or 'get_field_metadata'"
+            "'create', 'update', 'delete', 'get_field_metadata', 'aggregate' "
+            "(grouped counts and totals computed by Salesforce), 'search' (SOSL "
+            "text search across objects), 'query_related' (records with their "
+            "parent and child records in one call), 'get_record' (fields of one "
+            "record by ID, answered from cache when possible), or 'fetch_more' "
+            "(next slice of a truncated result)"
         ),
     )
     object_name: Optional[str] = Field(
@@ -40,11 +190,91 @@ class SalesforceQueryInput(BaseModel):
         None, description="Data for create/update operations as key-value pairs"
     )
     record_id: Optional[str] = Field(
-        None, description="Salesforce record ID for update/delete operations"
+        None,
+        description="Salesforce record ID for update/delete/get_record operations",
     )
     field_name: Optional[str] = Field(
         None, description="The field name for 'get_field_metadata' operation"
     )
+    cursor: Optional[str] = Field(
+        None,
+        description="Cursor of a truncated result, for the 'fetch_more' operation",
+    )
+    group_by: Optional[List[str]] = Field(
+        None, description="Fields to group by for the 'aggregate' operation"
+    )
+    aggregates: Optional[List[str]] = Field(
+        None,
+        description=(
+            "Aggregate functions for the 'aggregate' operation, e.g. "
+            "['COUNT(Id)', 'SUM(Amount)']; defaults to COUNT(Id)"
+        ),
+    )
+    where: Optional[str] = Field(
+        None,
+        description=(
+            "SOQL condition restricting the records of an 'aggregate' or the "
+            "root records of 'query_related'"
+        ),
+    )
+    fields: Optional[List[str]] = Field(
+        None,
+        description=(
+            "Fields of the root records for 'query_related', or of the record "
+            "for 'get_record' (all fields when omitted)"
+        ),
+    )
+    relationships: Optional[Dict[str, List[str]]] = Field(
+        None,
+        description=(
+            "Relationship names mapped to the fields to fetch from them for "
+            "'query_related', e.g. {'Contacts': ['Name'], 'Owner': ['Name']}"
+        ),
+    )
+    search_term: Optional[str] = Field(
+        None, description="Text to find for the 'search' operation"
+    )
+    returning: Optional[Dict[str, List[str]]] = Field(
+        None,
+        description=(
+            "Objects to search with the fields to return for each, e.g. "
+            "{'Account': ['Name'], 'Contact': ['Name', 'Email']}; defaults to "
+            "all searchable objects"
+        ),
+    )
+
+
+@dataclass
+class WarmUp:
+    """Handle on a warm-up started by ``SalesforceTool.warm_up``.
+
+    Attributes:
+        describes: Future of each object describe being prefetched.
+        queries: Future of each query result being prefetched.
+    """
+
+    describes: Dict[str, "Future[Any]"] = field(default_factory=dict)
+    queries: Dict[str, "Future[Any]"] = field(default_factory=dict)
+
+    def _futures(self) -> List["Future[Any]"]:
+        return list(self.describes.values()) + list(self.queries.values())
+
+    def done(self) -> bool:
+        """Return True once every prefetch has finished."""
+        return all(future.done() for future in self._futures())
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the prefetches; return False if ``timeout`` expired first."""
+        _, not_done = wait(self._futures(), timeout=timeout)
+        return not not_done
+
+    def errors(self) -> Dict[str, BaseException]:
+        """Return the failed prefetches of the finished ones, by object or query."""
+        failed: Dict[str, BaseException] = {}
+        for key, future in list(self.describes.items()) + list(self.queries.items()):
+            if future.done() and future.exception() is not None:
+                failed[key] = cast(BaseException, future.exception())
+        return failed
 
 
 class SalesforceTool(BaseTool):
@@ -97,11 +327,251 @@ class SalesforceTool(BaseTool):
     name: str = "salesforce"
     description: str = (
         "Tool for interacting with Salesforce CRM. Can query records, describe "
-        "object schemas, list available objects, get field metadata, and perform "
-        "create/update/delete operations."
+        "object schemas, list available objects, get field metadata, search text "
+        "across objects, fetch records with their related records, compute "
+        "grouped aggregates, and perform create/update/delete operations."
     )
     args_schema: Type[BaseModel] = SalesforceQueryInput
-    _sf: Salesforce = PrivateAttr()
+    describe_cache_ttl: float = Field(
+        300.0,
+        description="Seconds to cache object describes; 0 disables caching",
+    )
+    query_cache_ttl: float = Field(
+        0.0,
+        description="Seconds to cache query results; 0 (default) disables caching",
+    )
+    record_cache_ttl: float = Field(
+        0.0,
+        description=(
+            "Seconds to remember record fields seen in query results and "
+            "writes, for 'get_record'; 0 (default) disables the record cache"
+        ),
+    )
+    cache_maxsize: int = Field(
+        1024, description="Maximum number of entries kept in each cache"
+    )
+    cache_backend: Optional[CacheBackend] = Field(
+        None,
+        exclude=True,
+        description=(
+            "Shared storage for the describe, query and record caches, e.g. "
+            "a SQLiteCache or RedisCache; in-process caches by default"
+        ),
+    )
+    cache_namespace: str = Field(
+        "salesforce",
+        description=(
+            "Prefix of this tool's keys in cache_backend; give each org its "
+            "own namespace when orgs share a backend"
+        ),
+    )
+    validate_queries: bool = Field(
+        False,
+        description=(
+            "Check object and field names of SOQL queries against the cached "
+            "describe before sending them"
+        ),
+    )
+    validate_records: bool = Field(
+        False,
+        description=(
+            "Check record data of creates and updates against the cached "
+            "describe, and coerce dates and numbers, before sending it"
+        ),
+    )
+    query_default_limit: Optional[int] = Field(
+        None, description="LIMIT added to agent queries that do not have one"
+    )
+    query_max_limit: Optional[int] = Field(
+        None, description="Upper bound enforced on the LIMIT of agent queries"
+    )
+    query_max_fields: Optional[int] = Field(
+        None, description="Maximum number of fields selected by agent queries"
+    )
+    query_expand_fields: bool = Field(
+        False,
+        description=(
+            "Expand FIELDS(ALL) style selections of agent queries into explicit "
+            "field lists from the describe, so query_max_fields caps them too"
+        ),
+    )
+    output_budget: Optional[int] = Field(
+        None,
+        description=(
+            "Maximum size of a result; larger results are truncated and return "
+            "a cursor for 'fetch_more'. None (default) returns full results"
+        ),
+    )
+    output_budget_unit: Literal["tokens", "bytes"] = Field(
+        "tokens",
+        description=(
+            "Unit of output_budget: estimated tokens (4 characters each) or "
+            "bytes of JSON"
+        ),
+    )
+    cursor_ttl: float = Field(
+        600.0, description="Seconds a 'fetch_more' cursor stays valid"
+    )
+    search_cache_ttl: float = Field(
+        30.0, description="Seconds to cache search results; 0 disables caching"
+    )
+    search_max_results: int = Field(
+        50, description="Maximum number of records returned by a 'search'"
+    )
+    related_max_records: int = Field(
+        200, description="Maximum number of root records of a 'query_related'"
+    )
+    aggregate_max_groups: int = Field(
+        10000,
+        description=(
+            "Maximum number of groups an 'aggregate' returns; results with "
+            "more groups are marked incomplete"
+        ),
+    )
+    write_behind: bool = Field(
+        False,
+        description=(
+            "Queue 'update' operations and send them in batches, merging "
+            "updates of the same record; see write_buffer"
+        ),
+    )
+    write_behind_max_records: int = Field(
+        200, description="Pending records that trigger a write-behind flush"
+    )
+    write_behind_interval: float = Field(
+        1.0, description="Seconds a write-behind update waits at most"
+    )
+    circuit_breaker: bool = Field(
+        False,
+        description=(
+            "Fail fast, or answer reads from cache, after repeated failures "
+            "of Salesforce calls; reads and writes have separate breakers"
+        ),
+    )
+    breaker_failure_threshold: int = Field(
+        5, description="Consecutive failed calls that open a circuit breaker"
+    )
+    breaker_reset_timeout: float = Field(
+        30.0, description="Seconds an open circuit breaker waits before probing"
+    )
+    breaker_slow_call_seconds: Optional[float] = Field(
+        None, description="Calls slower than this count as circuit breaker failures"
+    )
+    max_in_flight: Optional[int] = Field(
+        None,
+        description=(
+            "Maximum number of concurrent operations; further operations are "
+            "rejected with LoadSheddingError instead of queuing"
+        ),
+    )
+    operation_timeout: Optional[float] = Field(
+        None,
+        description=(
+            "Seconds an operation may take; config['configurable']"
+            "['salesforce_timeout'] can set a shorter deadline per call"
+        ),
+    )
+    hedge_reads: bool = Field(
+        False,
+        description=(
+            "Send a duplicate of a slow query, describe or list_objects call "
+            "and use its answer if the first request fails or times out"
+        ),
+    )
+    hedge_quantile: float = Field(
+        0.95, description="Latency quantile after which a read is hedged"
+    )
+    hedge_min_samples: int = Field(
+        20, description="Calls of a kind observed before reads of it are hedged"
+    )
+    hedge_max_workers: int = Field(
+        16, description="Threads sending hedged duplicates; reads run inline"
+    )
+    compress_requests: bool = Field(
+        False,
+        description="Gzip request bodies of at least compress_min_size bytes",
+    )
+    compress_min_size: int = Field(
+        1024, description="Smallest request body, in bytes, that is compressed"
+    )
+    connection_pool_size: Optional[int] = Field(
+        None,
+        description=(
+            "Connections each HTTP session keeps open to Salesforce; requests' "
+            "default of 10 when unset"
+        ),
+    )
+    conditional_requests: bool = Field(
+        False,
+        description=(
+            "Revalidate expired describes with If-None-Match/If-Modified-Since, "
+            "so unchanged metadata costs a 304 instead of the full payload"
+        ),
+    )
+    auth_mode: Literal["eager", "lazy", "background"] = Field(
+        "eager",
+        description=(
+            "When to log in: 'eager' in the constructor, 'lazy' on the first "
+            "operation, or 'background' in a thread started by the constructor"
+        ),
+    )
+    thread_local_clients: bool = Field(
+        False,
+        description=(
+            "Give every thread its own Salesforce client and HTTP session, "
+            "sharing the login session, instead of one shared client"
+        ),
+    )
+    spool_threshold: Optional[int] = Field(
+        None,
+        description=(
+            "Write query results of more than this many records to a temporary "
+            "JSON Lines file and return a SpooledResult handle instead of the "
+            "records; None (default) keeps every result in memory"
+        ),
+    )
+    spool_dir: Optional[str] = Field(
+        None, description="Directory of spool files; the temporary directory if unset"
+    )
+    typed_records: bool = Field(
+        False,
+        description=(
+            "Return query records as compact typed records, slotted dataclasses "
+            "generated from the SELECT list and the describes, instead of dicts"
+        ),
+    )
+    profiler: Optional[Profiler] = Field(
+        None,
+        exclude=True,
+        description="Records a span tree of every call and samples slow calls",
+    )
+    _sf: "Salesforce" = PrivateAttr()
+    # Pending login; cleared once _sf is set
+    _login: Optional[Callable[[], "Salesforce"]] = PrivateAttr(default=None)
+    _login_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _inflight: Dict[str, "Future[Any]"] = PrivateAttr(default_factory=dict)
+    _inflight_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _local: threading.local = PrivateAttr(default_factory=threading.local)
+    # Clients of hedge attempts, per hedging worker thread
+    _hedge_local: threading.local = PrivateAttr(default_factory=threading.local)
+    _mirror: Optional["SQLiteMirror"] = PrivateAttr(default=None)
+    _describe_cache: CacheBackend = PrivateAttr()
+    _query_cache: CacheBackend = PrivateAttr()
+    _record_cache: Optional[RecordCache] = PrivateAttr(default=None)
+    _soql_validator: SOQLValidator = PrivateAttr()
+    _record_validator: RecordValidator = PrivateAttr()
+    _query_rewriter: Optional[QueryRewriter] = PrivateAttr(default=None)
+    _output_budget: Optional[OutputBudget] = PrivateAttr(default=None)
+    _write_buffer: Optional[WriteBehindBuffer] = PrivateAttr(default=None)
+    _breakers: Dict[str, CircuitBreaker] = PrivateAttr(default_factory=dict)
+    _load_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _calls_in_flight: int = PrivateAttr(default=0)
+    _shed_calls: int = PrivateAttr(default=0)
+    _hedger: HedgedCaller = PrivateAttr()
+    # Describes with their ETag/Last-Modified validators, for conditional GETs
+    _validators: CacheBackend = PrivateAttr()
+    # Typed record classes per query; classes cannot go in a shared backend
+    _record_schemas: TTLCache = PrivateAttr()
 
     def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
@@ -109,16 +579,92 @@ class SalesforceTool(BaseTool):
         password: str,
         security_token: str,
         domain: str = "login",
-        salesforce_client: Optional[Salesforce] = None,
+        salesforce_client: Optional["Salesforce"] = None,
+        **kwargs: Any,
     ) -> None:
         """Initialize Salesforce connection."""
-        super().__init__()
-        self._sf = salesforce_client or Salesforce(
+        super().__init__(**kwargs)
+        self._describe_cache = self._make_cache("describe", self.describe_cache_ttl)
+        self._query_cache = self._make_cache("query", self.query_cache_ttl)
+        self._validators = self._make_cache("validators", None)
+        self._record_schemas = TTLCache(
+            maxsize=self.cache_maxsize, ttl=self.describe_cache_ttl or None
+        )
+        if self.record_cache_ttl > 0:
+            self._record_cache = RecordCache(
+                self.cache_maxsize,
+                self.record_cache_ttl,
+                backend=self._make_cache("record", self.record_cache_ttl),
+            )
+        self._soql_validator = SOQLValidator(
+            self._describe_object,
+            lambda: [sobject["name"] for sobject in self._execute_list_objects()],
+        )
+        self._record_validator = RecordValidator(self._describe_object)
+        self._hedger = HedgedCaller(
+            self.hedge_quantile, self.hedge_min_samples, self.hedge_max_workers
+        )
+        if (
+            self.query_default_limit is not None
+            or self.query_max_limit is not None
+            or self.query_max_fields is not None
+            or self.query_expand_fields
+        ):
+            self._query_rewriter = QueryRewriter(
+                self._describe_object,
+                default_limit=self.query_default_limit,
+                max_limit=self.query_max_limit,
+                max_fields=self.query_max_fields,
+                expand_fields=self.query_expand_fields,
+            )
+        if self.output_budget is not None:
+            self._output_budget = OutputBudget(
+                self.output_budget,
+                unit=self.output_budget_unit,
+                cursor_ttl=self.cursor_ttl,
+                maxsize=self.cache_maxsize,
+            )
+        if self.circuit_breaker:
+            self._breakers = {
+                name: CircuitBreaker(
+                    name,
+                    failure_threshold=self.breaker_failure_threshold,
+                    reset_timeout=self.breaker_reset_timeout,
+                    slow_call_seconds=self.breaker_slow_call_seconds,
+                )
+                for name in ("read", "write")
+            }
+        if self.write_behind:
+            self._write_buffer = WriteBehindBuffer(
+                self,
+                max_records=self.write_behind_max_records,
+                flush_interval=self.write_behind_interval,
+            )
+            # Queued updates would otherwise be lost when the process exits
+            atexit.register(self.close)
+        if salesforce_client is not None:
+            self._sf = salesforce_client
+            self._configure_session(salesforce_client)
+            return
+        self._login = partial(
+            _salesforce_login,
             username=username,
             password=password,
             security_token=security_token,
             domain=domain,
         )
+        if self.auth_mode == "eager":
+            self._main_client()
+        elif self.auth_mode == "background":
+            threading.Thread(
+                target=self._background_login, name="salesforce-login", daemon=True
+            ).start()
+
+    def _make_cache(self, name: str, ttl: Optional[float]) -> CacheBackend:
+        """Return one of the tool's caches, in process or in cache_backend."""
+        if self.cache_backend is None:
+            return TTLCache(maxsize=self.cache_maxsize, ttl=ttl)
+        return ScopedCache(self.cache_backend, f"{self.cache_namespace}:{name}:", ttl)
 
     @staticmethod
     def _validate_object_name(object_name: str) -> None:
@@ -148,31 +694,709 @@ class SalesforceTool(BaseTool):
                 "Record IDs must be 15 or 18 alphanumeric characters."
             )
 
+    def _main_client(self) -> "Salesforce":
+        """Return the shared Salesforce client, logging in if not done yet.
+
+        Concurrent callers wait for a single login; a failed login raises
+        here and is retried by the next call.
+        """
+        if self._login is not None:
+            with self._login_lock, span("login"):
+                if self._login is not None:
+                    self._sf = self._login()
+                    self._configure_session(self._sf)
+                    self._login = None
+        return self._sf
+
+    def _remote(
+        self, kind: str, call: Callable[["Salesforce"], Any], hedge: bool = False
+    ) -> Any:
+        """Make a client call within the deadline of the current operation.
+
+        Idempotent reads pass ``hedge=True`` to be hedged when
+        ``hedge_reads`` is set.
+        """
+        client = self._client()
+        with span("http", kind=kind):
+            return self._hedger.call(
+                kind,
+                partial(call, client),
+                hedge and self.hedge_reads,
+                lambda: call(self._hedge_client()),
+            )
+
+    def _hedge_client(self) -> "Salesforce":
+        """Return the client of hedge attempts on the calling worker thread.
+
+        A hedge runs while the attempt it duplicates is still on the wire,
+        so it gets a client with its own ``requests.Session``.
+        """
+        client = getattr(self._hedge_local, "sf", None)
+        if client is None:
+            client = self._hedge_local.sf = self._clone_client(self._main_client())
+        return client
+
+    def _query_more(self, url: str, include_deleted: bool = False) -> Dict[str, Any]:
+        """Fetch the query result page at a ``nextRecordsUrl``."""
+        page = self._remote(
+            "query_more",
+            lambda sf: sf.query_more(
+                url, identifier_is_url=True, include_deleted=include_deleted
+            ),
+            hedge=True,
+        )
+        if not include_deleted:
+            self._remember_records(page)
+        return page
+
+    def _remember_records(self, result: Any) -> None:
+        """Add the records of a query result page to the record cache."""
+        if self._record_cache is not None and isinstance(result, dict):
+            self._record_cache.remember(result.get("records") or [])
+
+    def _configure_session(self, client: "Salesforce") -> None:
+        """Apply deadlines and the transport and profiling options to a session."""
+        from requests import Session
+
+        session = getattr(client, "session", None)
+        if not isinstance(session, Session):
+            return
+        from langchain_salesforce.transport import enable_deadline_timeouts
+
+        enable_deadline_timeouts(session)
+        if self.compress_requests:
+            from langchain_salesforce.transport import enable_compression
+
+            enable_compression(
+                session, self.compress_min_size, self.connection_pool_size
+            )
+        elif self.connection_pool_size:
+            from requests.adapters import HTTPAdapter
+
+            adapter = HTTPAdapter(pool_maxsize=self.connection_pool_size)
+            session.mount("https://", adapter)
+        if self.profiler is not None:
+            from langchain_salesforce.profiling import trace_responses
+
+            trace_responses(session)
+
+    def _fetch_metadata(
+        self, kind: str, path: str, call: Callable[["Salesforce"], Any]
+    ) -> Any:
+        """Fetch a describe, conditionally when ``conditional_requests`` is set."""
+        if not self.conditional_requests:
+            return self._remote(kind, call, hedge=True)
+        from langchain_salesforce.transport import conditional_get
+
+        return self._remote(
+            kind,
+            lambda sf: conditional_get(sf, path, self._validators, name=kind),
+            hedge=True,
+        )
+
+    def _background_login(self) -> None:
+        try:
+            self._main_client()
+        except Exception:  # pylint: disable=broad-except
+            # Raised again by the retry on the first operation
+            pass
+
+    def _client(self) -> "Salesforce":
+        """Return the Salesforce client for the calling thread.
+
+        With ``thread_local_clients`` each thread lazily gets a clone of the
+        main client that reuses its session ID but has its own
+        ``requests.Session``, so connection pools and cookies are never
+        shared between threads.
+
+        Raises:
+            CircuitOpenError: If called for a read that the open circuit
+                breaker only allows to be answered from cache.
+        """
+        if getattr(self._local, "cache_only", False):
+            raise CircuitOpenError(
+                "Salesforce circuit breaker is open and the result is not cached"
+            )
+        self._local.client_used = True
+        main = self._main_client()
+        if not self.thread_local_clients:
+            return main
+        client = getattr(self._local, "sf", None)
+        if client is None:
+            client = self._local.sf = self._clone_client(main)
+        return client
+
+    def _clone_client(self, main: "Salesforce") -> "Salesforce":
+        """Return a client sharing the login of ``main`` with its own session."""
+        from requests import Session
+        from simple_salesforce import Salesforce
+
+        client = Salesforce(
+            session_id=main.session_id,
+            instance=main.sf_instance,
+            version=main.sf_version,
+            proxies=getattr(main, "proxies", None),
+            session=Session(),
+        )
+        self._configure_session(client)
+        return client
+
     def _get_sf_object(self, object_name: str) -> Any:
         """Safely get a Salesforce SObject type by name after validation."""
         self._validate_object_name(object_name)
-        return getattr(self._sf, object_name)
+        return getattr(self._client(), object_name)
+
+    @property
+    def write_buffer(self) -> Optional[WriteBehindBuffer]:
+        """Buffer of queued updates when ``write_behind`` is enabled."""
+        return self._write_buffer
+
+    def close(self) -> None:
+        """Send queued write-behind updates and stop the flush thread.
+
+        Called at interpreter exit for tools with ``write_behind``; later
+        'update' operations fail.
+        """
+        if self._write_buffer is not None:
+            atexit.unregister(self.close)
+            self._write_buffer.close()
+
+    def attach_mirror(self, mirror: Optional["SQLiteMirror"]) -> None:
+        """Answer simple queries from a local mirror when it is fresh.
+
+        Pass None to detach the current mirror.
+        """
+        self._mirror = mirror
+
+    def invalidate_describe(self, object_name: Optional[str] = None) -> None:
+        """Drop cached describes for one object, or all of them.
+
+        The global describe used by 'list_objects' is dropped as well, since
+        an object schema change may add or remove objects.
+        """
+        # Record classes may span several objects, so all of them go
+        self._record_schemas.clear()
+        if object_name is None:
+            self._describe_cache.clear()
+            return
+        self._describe_cache.delete(f"describe:{object_name.lower()}")
+        self._describe_cache.delete("describe_global")
+
+    def invalidate_records(
+        self, object_name: Optional[str] = None, record_ids: Sequence[str] = ()
+    ) -> None:
+        """Drop cached records: some of an object, all of it, or everything."""
+        if self._record_cache is not None:
+            self._record_cache.invalidate(object_name, record_ids)
+
+    def invalidate_queries(self, object_name: Optional[str] = None) -> None:
+        """Drop cached query results for one object, or all of them.
+
+        Search results span objects, so they are dropped either way. An
+        attached mirror stops answering queries of the object until its
+        next refresh.
+        """
+        if self._mirror is not None:
+            self._mirror.invalidate(object_name)
+        if self.query_cache_ttl <= 0 and self.search_cache_ttl <= 0:
+            return  # nothing was cached
+        if object_name is None:
+            self._query_cache.clear()
+            return
+        # Entries live under a generation token; dropping the token orphans
+        # them in O(1) instead of scanning the cache for their keys
+        if self.query_cache_ttl > 0:
+            self._query_cache.delete(f"generation:query:{object_name.lower()}")
+        if self.search_cache_ttl > 0:
+            self._query_cache.delete("generation:search")
+
+    def _cache_generation(self, scope: str) -> str:
+        """Return the current generation token of a group of cached queries.
+
+        The token is created on first use and replaced after invalidation,
+        in the query cache itself so that all processes sharing a cache
+        backend see the same generation.
+        """
+        key = f"generation:{scope}"
+        generation = self._query_cache.get(key)
+        if generation is None:
+            generation = uuid.uuid4().hex[:16]
+            self._query_cache.set(key, generation, ttl=_GENERATION_TTL)
+        return generation
+
+    def _query_cache_key(self, query: str) -> Optional[str]:
+        """Return the cache key of a query, or None if it cannot be cached.
+
+        Only single-object queries the SOQL parser understands are cached, so
+        that writes to the queried object can invalidate the entry. Queries
+        reading parent fields (``Account.Name``) are not cached either, since
+        writes to the parent object would not invalidate them.
+        """
+        try:
+            parsed = parse_soql(query)
+        except SOQLParseError:
+            return None
+        if parsed.subqueries:
+            return None
+        paths = [
+            path
+            for item in parsed.select
+            for path in ([item.expression] if item.is_field else item.arguments)
+        ]
+        paths += field_paths(parsed.where) + parsed.group_by
+        paths += [item.field for item in parsed.order_by]
+        prefix = f"{parsed.alias.lower()}." if parsed.alias else None
+        for path in paths:
+            if prefix and path.lower().startswith(prefix):
+                path = path[len(prefix) :]
+            if "." in path:
+                return None
+        object_name = parsed.object_name.lower()
+        generation = self._cache_generation(f"query:{object_name}")
+        return f"query:{object_name}:{generation}:{query}"
+
+    def _single_flight(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Call ``fetch`` once for all threads concurrently asking for ``key``.
+
+        Callers arriving while a fetch is in flight wait for its result (or
+        exception) instead of repeating the round trip.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+        try:
+            result = fetch()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+        future.set_result(result)
+        return result
+
+    def _describe_object(self, object_name: str) -> Dict[str, Any]:
+        """Return the describe of an object, served from cache when possible."""
+        self._validate_object_name(object_name)
+        cache_key = f"describe:{object_name.lower()}"
+        if self.describe_cache_ttl > 0:
+            cached = self._describe_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        def fetch() -> Dict[str, Any]:
+            result = self._fetch_metadata(
+                "describe",
+                f"sobjects/{object_name}/describe",
+                lambda sf: getattr(sf, object_name).describe(),
+            )
+            if self.describe_cache_ttl > 0:
+                self._describe_cache.set(cache_key, result)
+            return result
+
+        return self._single_flight(cache_key, fetch)
+
+    def _execute_query(
+        self,
+        query: str,
+        include_deleted: bool = False,
+        use_cache: bool = True,
+        rewrite: bool = True,
+        spool: bool = True,
+        **kwargs: Any,
+    ) -> Union[Dict[str, Any], SpooledResult]:
+        """Execute a SOQL query operation.
+
+        When ``include_deleted`` is true the query is sent to the ``queryAll``
+        endpoint so that deleted and archived records are returned as well.
+        ``use_cache=False`` bypasses any local copy of the data and
+        ``rewrite=False`` sends the query without LIMIT or field bounds.
+        With ``spool_threshold`` set, larger results are fetched in full and
+        spooled to disk unless ``spool=False``.
+        """
+        if rewrite and self._query_rewriter is not None:
+            rewritten = self._query_rewriter.rewrite(query)
+            if rewritten.rewritten:
+                spooled_or_page = self._execute_query(
+                    rewritten.query,
+                    include_deleted=include_deleted,
+                    use_cache=use_cache,
+                    rewrite=False,
+                    spool=spool,
+                )
+                if isinstance(spooled_or_page, SpooledResult):
+                    return spooled_or_page
+                result = dict(spooled_or_page)
+                result["rewritten_query"] = rewritten.query
+                result["rewrites"] = rewritten.rewrites
+                return result
+        cache_key = None
+        if use_cache and not include_deleted:
+            if self._mirror is not None:
+                mirrored = self._mirror.query(query)
+                if mirrored is not None:
+                    return mirrored
+            if self.query_cache_ttl > 0:
+                cache_key = self._query_cache_key(query)
+                cached = self._query_cache.get(cache_key) if cache_key else None
+                if cached is not None:
+                    return cached
+        if self.validate_queries:
+            issues = self._soql_validator.validate(query)
+            if issues:
+                raise SOQLValidationError(issues)
+        if include_deleted:
+            result = self._remote(
+                "query", lambda sf: sf.query(query, include_deleted=True), hedge=True
+            )
+            return self._spool_if_large(query, result, True) if spool else result
+        if cache_key is None:
+            result = self._remote("query", lambda sf: sf.query(query), hedge=True)
+            self._remember_records(result)
+            return self._spool_if_large(query, result, False) if spool else result
+
+        def fetch() -> Union[Dict[str, Any], SpooledResult]:
+            result = self._remote("query", lambda sf: sf.query(query), hedge=True)
+            self._remember_records(result)
+            if spool:
+                spooled = self._spool_if_large(query, result, False)
+                if isinstance(spooled, SpooledResult):
+                    return spooled
+            self._query_cache.set(cast(str, cache_key), result)
+            return result
+
+        return self._single_flight(cache_key, fetch)
 
-    def _execute_query(self, query: str, **kwargs: Any) -> Dict[str, Any]:
-        """Execute a SOQL query operation."""
-        return self._sf.query(query)
+    def _execute_query_operation(
+        self, query: str, **kwargs: Any
+    ) -> Union[Dict[str, Any], SpooledResult]:
+        """Execute the 'query' operation, with typed records if enabled.
+
+        The record classes are generated before the query is sent. Queries
+        outside the subset ``parse_soql`` understands return dict records.
+        """
+        schema = self._record_schema(query) if self.typed_records else None
+        result = self._execute_query(query, **kwargs)
+        if schema is None or not isinstance(result, dict):
+            return result
+        if "rewritten_query" in result:
+            # Rewriting may have bounded the SELECT list
+            schema = self._record_schema(result["rewritten_query"]) or schema
+        self._remember_schema(result, schema)
+        with span("typed_records"):
+            return {**result, "records": schema.build_all(result.get("records", []))}
+
+    def _remember_schema(self, page: Dict[str, Any], schema: RecordSchema) -> None:
+        """Keep ``schema`` for the page after ``page``, fetched by 'fetch_more'."""
+        if not page.get("done", True) and page.get("nextRecordsUrl"):
+            self._record_schemas.set(f"next:{page['nextRecordsUrl']}", schema)
+
+    def _fetch_more_page(self, url: str) -> Dict[str, Any]:
+        """Fetch the page at a ``nextRecordsUrl``, typed like the first page."""
+        page = self._query_more(url)
+        schema = self._record_schemas.get(f"next:{url}")
+        if not schema:
+            return page
+        self._remember_schema(page, schema)
+        with span("typed_records"):
+            return {**page, "records": schema.build_all(page.get("records", []))}
+
+    def _record_schema(self, query: str) -> Optional[RecordSchema]:
+        """Return the typed record classes of ``query``, generating them once.
+
+        Returns None if the query cannot be parsed.
+        """
+        schema = self._record_schemas.get(query)
+        if schema is None:
+            try:
+                schema = record_schema(query, self._describe_object)
+            except SOQLParseError:
+                schema = False  # remembered so the query is not parsed again
+            self._record_schemas.set(query, schema)
+        return schema or None
+
+    def _spool_if_large(
+        self, query: str, page: Dict[str, Any], include_deleted: bool
+    ) -> Union[Dict[str, Any], SpooledResult]:
+        """Spool a result of more than ``spool_threshold`` records to disk.
+
+        A complete page is sized by its records, since ``totalSize`` of
+        ``SELECT COUNT()`` is the count and not a number of records.
+        """
+        if self.spool_threshold is None:
+            return page
+        if page.get("done", True):
+            size = len(page.get("records") or [])
+        else:
+            size = page.get("totalSize", 0)
+        if size <= self.spool_threshold:
+            return page
+        with span("spool"):
+            return spool_pages(
+                query, self._follow_pages(page, include_deleted), self.spool_dir
+            )
+
+    def warm_up(
+        self,
+        objects: Sequence[str] = (),
+        queries: Sequence[str] = (),
+        background: bool = True,
+        max_workers: int = 4,
+    ) -> WarmUp:
+        """Prefetch describes and query results into the tool's caches.
+
+        Meant for the start of an agent session whose objects and queries
+        are known up front: the prefetches run concurrently (logging in
+        first if the login was deferred), so the first tool calls are served
+        from cache. A call that arrives while its prefetch is in flight waits
+        for that prefetch instead of repeating the round trip. Failed
+        prefetches are reported through ``WarmUp.errors()`` and otherwise
+        ignored.
+
+        Args:
+            objects: Objects whose describes to cache.
+            queries: SOQL queries whose results to cache; requires
+                ``query_cache_ttl > 0``.
+            background: Return immediately instead of waiting for the
+                prefetches to finish.
+            max_workers: Maximum number of concurrent requests.
+
+        Raises:
+            ValueError: If queries are given while query caching is disabled.
+        """
+        if queries and self.query_cache_ttl <= 0:
+            raise ValueError("Warming up queries requires query_cache_ttl > 0")
+        handle = WarmUp()
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="salesforce-warm-up"
+        )
+        if self.validate_queries and queries:
+            # The validator checks object names against the global describe
+            executor.submit(self._execute_list_objects)
+        for object_name in objects:
+            handle.describes[object_name] = executor.submit(
+                self._describe_object, object_name
+            )
+        for query in queries:
+            handle.queries[query] = executor.submit(self._execute_query, query)
+        executor.shutdown(wait=not background)
+        return handle
+
+    def _iter_query_pages(
+        self, query: str, include_deleted: bool = False, use_cache: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield every result page of a SOQL query, following nextRecordsUrl."""
+        page = self._execute_query(
+            query,
+            include_deleted=include_deleted,
+            use_cache=use_cache,
+            rewrite=False,
+            spool=False,
+        )
+        yield from self._follow_pages(cast(Dict[str, Any], page), include_deleted)
+
+    def _follow_pages(
+        self, page: Dict[str, Any], include_deleted: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield ``page`` and the pages after it."""
+        yield page
+        while not page.get("done", True) and page.get("nextRecordsUrl"):
+            page = self._query_more(page["nextRecordsUrl"], include_deleted)
+            yield page
 
     def _execute_describe(self, object_name: str, **kwargs: Any) -> Dict[str, Any]:
         """Execute a describe operation for an object."""
-        return self._get_sf_object(object_name).describe()
+        return self._describe_object(object_name)
 
     def _execute_list_objects(self, **kwargs: Any) -> List[Dict[str, Any]]:
         """Execute a list objects operation."""
-        result = self._sf.describe()
+        if self.describe_cache_ttl > 0:
+            cached = self._describe_cache.get("describe_global")
+            if cached is not None:
+                return cached
+        result = self._fetch_metadata(
+            "list_objects", "sobjects", lambda sf: sf.describe()
+        )
         if not isinstance(result, dict) or "sobjects" not in result:
             raise ValueError("Invalid response from Salesforce describe() call")
+        if self.describe_cache_ttl > 0:
+            self._describe_cache.set("describe_global", result["sobjects"])
         return result["sobjects"]
 
+    def _execute_fetch_more(self, cursor: str, **kwargs: Any) -> Any:
+        """Return the next slice of a result truncated by the output budget."""
+        if self._output_budget is None:
+            raise ValueError("'fetch_more' requires an output_budget")
+        return self._output_budget.fetch_more(cursor, self._fetch_more_page)
+
+    def _execute_aggregate(
+        self,
+        object_name: str,
+        group_by: Optional[List[str]] = None,
+        aggregates: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Execute an aggregate operation and return its groups as a table.
+
+        Salesforce returns at most 2,000 groups per aggregate query, so full
+        pages are followed by keyset queries on the grouping fields until all
+        groups, or ``aggregate_max_groups`` of them, are fetched.
+        """
+        self._validate_object_name(object_name)
+        aggregate = AggregateQuery(object_name, group_by or (), aggregates or (), where)
+        rows: List[List[Any]] = []
+        after = None
+        complete = True
+        while True:
+            page = self._execute_query(
+                aggregate.soql(after, partial(self._field_type, object_name)),
+                rewrite=False,
+                spool=False,
+            )
+            records = cast(Dict[str, Any], page).get("records", [])
+            rows.extend(aggregate.row(record) for record in records)
+            if not aggregate.group_by or len(records) < MAX_GROUPS_PER_QUERY:
+                break
+            if len(rows) >= self.aggregate_max_groups:
+                complete = False
+                break
+            after = rows[-1][: len(aggregate.group_by)]
+        if len(rows) > self.aggregate_max_groups:
+            rows = rows[: self.aggregate_max_groups]
+            complete = False
+        return {
+            "object": object_name,
+            "columns": aggregate.columns,
+            "rows": rows,
+            "group_count": len(rows),
+            "complete": complete,
+        }
+
+    def _execute_get_record(
+        self,
+        object_name: str,
+        record_id: str,
+        fields: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Execute a get_record operation.
+
+        Fields found in the record cache are not fetched again; the rest are
+        retrieved with one call asking for just those fields.
+        """
+        self._validate_object_name(object_name)
+        self._validate_record_id(record_id)
+        if fields is not None:
+            validate_field_names(fields)
+            fields = [name for name in fields if name.lower() != "id"]
+        cache = self._record_cache
+        found: Dict[str, Any] = {}
+        missing: Optional[List[str]] = fields
+        if cache is not None:
+            found, missing = cache.lookup(object_name, record_id, fields)
+        if missing is None or missing:
+            request = (
+                {} if missing is None else {"params": {"fields": ",".join(missing)}}
+            )
+            record = self._remote(
+                "get_record",
+                lambda sf: getattr(sf, object_name).get(record_id, **request),
+                hedge=True,
+            )
+            if cache is not None:
+                cache.merge(object_name, record_id, record, complete=missing is None)
+            found.update(
+                (name, value) for name, value in record.items() if name != "attributes"
+            )
+        result: Dict[str, Any] = {"Id": found.pop("Id", to_id18(record_id))}
+        if fields is None:
+            result.update(found)
+            return result
+        canonical = {name.lower(): name for name in found}
+        for name in fields:
+            key = canonical.get(name.lower(), name)
+            result[key] = found.get(key)
+        return result
+
+    def _execute_query_related(
+        self,
+        object_name: str,
+        fields: Optional[List[str]] = None,
+        relationships: Optional[Dict[str, List[str]]] = None,
+        where: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Fetch records with their related records and return the graph.
+
+        Relationship names are resolved from the cached describe; parents
+        and up to 20 child relationships are fetched in one query, any
+        further child relationships with batched ``IN`` queries.
+        """
+        self._validate_object_name(object_name)
+        plan = plan_related_query(
+            self._describe_object,
+            object_name,
+            fields,
+            relationships,
+            where,
+            self.related_max_records,
+        )
+        return plan.execute(
+            self._iter_query_pages,
+            self._query_more,
+        )
+
+    def _execute_search(
+        self,
+        search_term: str,
+        returning: Optional[Dict[str, List[str]]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Execute a SOSL search and return the records ranked by match."""
+        for object_name in returning or {}:
+            self._validate_object_name(object_name)
+        sosl = build_sosl(search_term, returning, self.search_max_results)
+        cache_key = f"search:{sosl}"
+        if self.search_cache_ttl > 0:
+            cache_key = f"search:{self._cache_generation('search')}:{sosl}"
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        def fetch() -> Dict[str, Any]:
+            response = self._remote("search", lambda sf: sf.search(sosl)) or {}
+            records = rank_records(response.get("searchRecords", []), search_term)
+            result = {"records": records, "count": len(records)}
+            if self.search_cache_ttl > 0:
+                self._query_cache.set(cache_key, result, ttl=self.search_cache_ttl)
+            return result
+
+        return self._single_flight(cache_key, fetch)
+
+    def _field_type(self, object_name: str, path: str) -> Optional[str]:
+        """Return the type of a field path, following relationship names."""
+        return resolve_field_type(self._describe_object, object_name, path)
+
     def _execute_create(
         self, object_name: str, record_data: Dict[str, Any], **kwargs: Any
     ) -> Dict[str, Any]:
         """Execute a create operation."""
-        return self._get_sf_object(object_name).create(record_data)
+        if self.validate_records:
+            record_data = self._record_validator.coerce(
+                object_name, record_data, "create"
+            )
+        result = self._get_sf_object(object_name).create(record_data)
+        self.invalidate_queries(object_name)
+        if self._record_cache is not None and result.get("id"):
+            self._record_cache.merge(
+                object_name, result["id"], record_data, written=True
+            )
+        return result
 
     def _execute_update(
         self,
@@ -181,25 +1405,55 @@ class SalesforceTool(BaseTool):
         record_data: Dict[str, Any],
         **kwargs: Any,
     ) -> Dict[str, Any]:
-        """Execute an update operation."""
+        """Execute an update operation.
+
+        With ``write_behind`` the update is queued and the result only
+        confirms that; ``write_buffer.update`` returns a future instead.
+        """
         self._validate_record_id(record_id)
-        return self._get_sf_object(object_name).update(record_id, record_data)
+        if self.validate_records:
+            record_data = self._record_validator.coerce(
+                object_name, record_data, "update"
+            )
+        if self._write_buffer is not None:
+            # Not written yet, and the write may still fail
+            self.invalidate_records(object_name, [record_id])
+            self._write_buffer.update(object_name, record_id, record_data)
+            return {"id": record_id, "queued": True}
+        try:
+            result = self._get_sf_object(object_name).update(record_id, record_data)
+        except Exception:
+            self.invalidate_records(object_name, [record_id])
+            raise
+        self.invalidate_queries(object_name)
+        if self._record_cache is not None:
+            self._record_cache.merge(object_name, record_id, record_data, written=True)
+        return result
 
     def _execute_delete(
         self, object_name: str, record_id: str, **kwargs: Any
     ) -> Dict[str, Any]:
         """Execute a delete operation."""
         self._validate_record_id(record_id)
-        return self._get_sf_object(object_name).delete(record_id)
+        try:
+            result = self._get_sf_object(object_name).delete(record_id)
+        finally:
+            self.invalidate_records(object_name, [record_id])
+        self.invalidate_queries(object_name)
+        return result
 
     def _execute_get_field_metadata(
         self, object_name: str, field_name: str, **kwargs: Any
     ) -> Dict[str, Any]:
         """Execute a get field metadata operation."""
-        # Get the full object description
-        object_description = self._get_sf_object(object_name).describe()
+        object_description = self._describe_object(object_name)
+        return self._find_field(object_description, object_name, field_name)
 
-        # Find the specific field in the fields list
+    @staticmethod
+    def _find_field(
+        object_description: Dict[str, Any], object_name: str, field_name: str
+    ) -> Dict[str, Any]:
+        """Return the metadata of one field from an object describe."""
         fields = object_description.get("fields", [])
         field_metadata = next(
             (field for field in fields if field.get("name") == field_name), None
@@ -213,43 +1467,20 @@ class SalesforceTool(BaseTool):
 
     def _validate_operation_params(self, operation: str, **params: Any) -> None:
         """Validate required parameters for each operation."""
-        validations = {
-            "query": lambda: params.get("query") is not None,
-            "describe": lambda: params.get("object_name") is not None,
-            "list_objects": lambda: True,
-            "create": lambda: params.get("object_name") and params.get("record_data"),
-            "update": lambda: (
-                params.get("object_name")
-                and params.get("record_id")
-                and params.get("record_data")
-            ),
-            "delete": lambda: params.get("object_name") and params.get("record_id"),
-            "get_field_metadata": lambda: (
-                params.get("object_name") and params.get("field_name")
-            ),
-        }
-
-        error_messages = {
-            "query": "Query string is required for 'query' operation",
-            "describe": "Object name is required for 'describe' operation",
-            "create": "Object name and record data required for 'create' operation",
-            "update": (
-                "Object name, record ID, and data required for 'update' operation"
-            ),
-            "delete": "Object name and record ID required for 'delete' operation",
-            "get_field_metadata": (
-                "Object name and field name required for 'get_field_metadata' operation"
-            ),
-        }
-
-        if operation not in validations:
+        required = _REQUIRED_PARAMS.get(operation)
+        if required is None:
             raise ValueError(f"Unsupported operation: {operation}")
+        values = [params.get(name) for name in required]
+        if operation in ("query", "describe"):
+            valid = all(value is not None for value in values)
+        else:
+            valid = all(values)
+        if not valid:
+            raise ValueError(_PARAM_ERRORS[operation])
 
-        if not validations[operation]():
-            raise ValueError(error_messages[operation])
-
+    @staticmethod
     def _parse_salesforce_input(
-        self, input: Union[str, Dict[Any, Any], ToolCall]
+        input: Union[str, Dict[Any, Any], ToolCall],
     ) -> Dict[str, Any]:
         """Parse and validate input from various formats."""
         if input is None:
@@ -282,35 +1513,127 @@ class SalesforceTool(BaseTool):
         record_id: Optional[str] = None,
         field_name: Optional[str] = None,
         run_manager: Optional[CallbackManagerForToolRun] = None,
+        cursor: Optional[str] = None,
+        group_by: Optional[List[str]] = None,
+        aggregates: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        relationships: Optional[Dict[str, List[str]]] = None,
+        search_term: Optional[str] = None,
+        returning: Optional[Dict[str, List[str]]] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """Execute Salesforce operation."""
         # Suppress unused-argument warning for run_manager
         _ = run_manager
 
-        # Operation dispatch dictionary
-        operations: Dict[
-            str, Callable[..., Union[Dict[str, Any], List[Dict[str, Any]]]]
-        ] = {
-            "query": self._execute_query,
-            "describe": self._execute_describe,
-            "list_objects": self._execute_list_objects,
-            "create": self._execute_create,
-            "update": self._execute_update,
-            "delete": self._execute_delete,
-            "get_field_metadata": self._execute_get_field_metadata,
-        }
-
         params = {
             "object_name": object_name,
             "query": query,
             "record_data": record_data,
             "record_id": record_id,
             "field_name": field_name,
+            "cursor": cursor,
+            "group_by": group_by,
+            "aggregates": aggregates,
+            "where": where,
+            "fields": fields,
+            "relationships": relationships,
+            "search_term": search_term,
+            "returning": returning,
         }
 
-        self._validate_operation_params(operation, **params)
-        operation_func = operations[operation]
-        return operation_func(**params)
+        with self._profiled("run", operation=operation):
+            with span("validate_params"):
+                self._validate_operation_params(operation, **params)
+            operation_func = getattr(self, _OPERATIONS[operation])
+            with deadline_scope(self.operation_timeout), span("execute"):
+                remaining_time()  # fail before starting when already too late
+                if self._breakers or self.max_in_flight is not None:
+                    result = self._guarded_call(operation, operation_func, params)
+                else:
+                    result = operation_func(**params)
+            if self._output_budget is not None and operation != "fetch_more":
+                with span("output_budget"):
+                    result = self._output_budget.apply(result)
+            return result
+
+    def _profiled(self, name: str, **attributes: Any) -> ContextManager[Any]:
+        """Profile the enclosed call when a profiler is attached."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.call(name, **attributes)
+
+    def _guarded_call(
+        self, operation: str, func: Callable[..., Any], params: Dict[str, Any]
+    ) -> Any:
+        """Run an operation under the in-flight limit and circuit breaker."""
+        with self._load_lock:
+            if (
+                self.max_in_flight is not None
+                and self._calls_in_flight >= self.max_in_flight
+            ):
+                self._shed_calls += 1
+                raise LoadSheddingError(
+                    f"{self.max_in_flight} Salesforce operations already in flight"
+                )
+            self._calls_in_flight += 1
+        try:
+            kind = "write" if operation in _WRITE_OPERATIONS else "read"
+            breaker = self._breakers.get(kind)
+            if breaker is None:
+                return func(**params)
+            if not breaker.allow():
+                if kind == "write":
+                    raise CircuitOpenError("Salesforce write circuit breaker is open")
+                self._local.cache_only = True
+                try:
+                    return func(**params)
+                finally:
+                    self._local.cache_only = False
+            return self._call_with_breaker(breaker, func, params)
+        finally:
+            with self._load_lock:
+                self._calls_in_flight -= 1
+
+    def _call_with_breaker(
+        self,
+        breaker: CircuitBreaker,
+        func: Callable[..., Any],
+        params: Dict[str, Any],
+    ) -> Any:
+        """Run an admitted call and report its outcome to the breaker.
+
+        Calls answered from cache without touching the client say nothing
+        about Salesforce's health and are not counted.
+        """
+        self._local.client_used = False
+        start = time.monotonic()
+        try:
+            result = func(**params)
+        except Exception as exc:
+            if not self._local.client_used:
+                breaker.release()
+            elif is_service_failure(exc):
+                breaker.record_failure()
+            else:
+                breaker.record_success(time.monotonic() - start)
+            raise
+        if self._local.client_used:
+            breaker.record_success(time.monotonic() - start)
+        else:
+            breaker.release()
+        return result
+
+    def resilience_metrics(self) -> Dict[str, Any]:
+        """Return circuit breaker states, load shedding and hedging counters."""
+        with self._load_lock:
+            load = {
+                "in_flight": self._calls_in_flight,
+                "max_in_flight": self.max_in_flight,
+                "shed": self._shed_calls,
+            }
+        breakers = {name: b.metrics() for name, b in self._breakers.items()}
+        return {"breakers": breakers, **load, "hedging": self._hedger.metrics()}
 
     # pylint: disable=arguments-differ,too-many-arguments,too-many-positional-arguments
     async def _arun(
@@ -322,6 +1645,14 @@ class SalesforceTool(BaseTool):
         record_id: Optional[str] = None,
         field_name: Optional[str] = None,
         run_manager: Optional[CallbackManagerForToolRun] = None,
+        cursor: Optional[str] = None,
+        group_by: Optional[List[str]] = None,
+        aggregates: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        relationships: Optional[Dict[str, List[str]]] = None,
+        search_term: Optional[str] = None,
+        returning: Optional[Dict[str, List[str]]] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """Async implementation of Salesforce operations."""
         # Simple-salesforce doesn't have native async support,
@@ -334,6 +1665,14 @@ class SalesforceTool(BaseTool):
             record_id,
             field_name,
             run_manager,
+            cursor,
+            group_by,
+            aggregates,
+            where,
+            fields,
+            relationships,
+            search_term,
+            returning,
         )
 
     def invoke(
@@ -342,9 +1681,12 @@ class SalesforceTool(BaseTool):
         config: Optional[RunnableConfig] = None,
         **kwargs: Any,
     ) -> Any:
-        """Run the tool."""
-        input_dict = self._parse_salesforce_input(input)
-        return self._run(**input_dict)
+        """Run the tool within the deadline set in ``config``, if any."""
+        with self._profiled("invoke"):
+            with span("parse_input"):
+                input_dict = self._parse_salesforce_input(input)
+            with deadline_scope(config_timeout(config)):
+                return self._run(**input_dict)
 
     async def ainvoke(
         self,
@@ -352,6 +1694,230 @@ class SalesforceTool(BaseTool):
         config: Optional[RunnableConfig] = None,
         **kwargs: Any,
     ) -> Any:
-        """Run the tool asynchronously."""
-        input_dict = self._parse_salesforce_input(input)
-        return await self._arun(**input_dict)
+        """Run the tool asynchronously within the deadline set in ``config``."""
+        with self._profiled("invoke"):
+            with span("parse_input"):
+                input_dict = self._parse_salesforce_input(input)
+            with deadline_scope(config_timeout(config)):
+                return await self._arun(**input_dict)
+
+    def batch(  # type: ignore[override]
+        self,
+        inputs: List[Union[str, Dict[Any, Any], ToolCall]],
+        config: Optional[Union[RunnableConfig, List[RunnableConfig]]] = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """Run many operations, grouping the ones Salesforce can batch.
+
+        ``create`` operations on the same object are sent together through
+        the sObject Collections API (200 records per call), and describes,
+        including the ones ``get_field_metadata`` needs, through composite
+        requests (25 per call). The groups and all other operations run on a
+        thread pool bounded by ``config["max_concurrency"]``.
+
+        Results are returned in input order and failures are per item: with
+        ``return_exceptions=True`` the exception takes the item's place,
+        otherwise the first failure is raised once the whole batch has run.
+        """
+        if not inputs:
+            return []
+        results: List[Any] = [None] * len(inputs)
+        creates: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        describes: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        singles: List[Tuple[int, Dict[str, Any]]] = []
+        for index, item in enumerate(inputs):
+            try:
+                params = dict(self._parse_salesforce_input(item))
+                self._validate_operation_params(**params)
+                operation = params["operation"]
+                if operation in ("create", "describe", "get_field_metadata"):
+                    self._validate_object_name(params["object_name"])
+                if operation == "create" and self.validate_records:
+                    params["record_data"] = self._record_validator.coerce(
+                        params["object_name"], params["record_data"], "create"
+                    )
+            except ValueError as exc:
+                results[index] = exc
+                continue
+            if operation == "create":
+                group = creates.setdefault(params["object_name"], [])
+                group.append((index, params))
+            elif operation in ("describe", "get_field_metadata"):
+                group = describes.setdefault(params["object_name"].lower(), [])
+                group.append((index, params))
+            else:
+                singles.append((index, params))
+
+        tasks: List[Callable[[], List[Tuple[int, Any]]]] = []
+        for object_name, items in creates.items():
+            for start in range(0, len(items), _COLLECTIONS_BATCH_SIZE):
+                chunk = items[start : start + _COLLECTIONS_BATCH_SIZE]
+                tasks.append(partial(self._batch_create, object_name, chunk))
+        uncached = []
+        for key, items in describes.items():
+            cached = (
+                self._describe_cache.get(f"describe:{key}")
+                if self.describe_cache_ttl > 0
+                else None
+            )
+            if cached is None:
+                uncached.append(items)
+            else:
+                for index, params in items:
+                    results[index] = self._describe_result(params, cached)
+        for start in range(0, len(uncached), _COMPOSITE_BATCH_SIZE):
+            groups = uncached[start : start + _COMPOSITE_BATCH_SIZE]
+            tasks.append(partial(self._batch_describe, groups))
+        for index, params in singles:
+            tasks.append(partial(self._batch_single, index, params))
+
+        configs = get_config_list(config, len(inputs))
+        with (
+            deadline_scope(config_timeout(configs[0])),
+            get_executor_for_config(configs[0]) as executor,
+        ):
+            futures: List[Future] = [executor.submit(task) for task in tasks]
+            for future in futures:
+                for index, result in future.result():
+                    results[index] = result
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+
+    async def abatch(  # type: ignore[override]
+        self,
+        inputs: List[Union[str, Dict[Any, Any], ToolCall]],
+        config: Optional[Union[RunnableConfig, List[RunnableConfig]]] = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """Run many operations asynchronously; see ``batch``."""
+        return await asyncio.to_thread(
+            self.batch, inputs, config, return_exceptions=return_exceptions
+        )
+
+    def _batch_single(
+        self, index: int, params: Dict[str, Any]
+    ) -> List[Tuple[int, Any]]:
+        """Run one operation of a batch, capturing its failure."""
+        try:
+            return [(index, self._run(**params))]
+        except Exception as exc:  # reported in the item's place
+            return [(index, exc)]
+
+    def _batch_create(
+        self, object_name: str, items: Sequence[Tuple[int, Dict[str, Any]]]
+    ) -> List[Tuple[int, Any]]:
+        """Create up to 200 records of one object with one Collections call."""
+        body = {
+            "allOrNone": False,
+            "records": [
+                {"attributes": {"type": object_name}, **params["record_data"]}
+                for _, params in items
+            ],
+        }
+        try:
+            response = self._client().restful(
+                "composite/sobjects", method="POST", data=json.dumps(body)
+            )
+        except Exception as exc:  # every record of the call failed
+            return [(index, exc) for index, _ in items]
+        finally:
+            self.invalidate_queries(object_name)
+
+        outcomes = list(response or [])
+        results: List[Tuple[int, Any]] = []
+        for position, (index, _) in enumerate(items):
+            outcome = outcomes[position] if position < len(outcomes) else None
+            if outcome is not None and outcome.get("success"):
+                if self._record_cache is not None and outcome.get("id"):
+                    self._record_cache.merge(
+                        object_name,
+                        outcome["id"],
+                        items[position][1]["record_data"],
+                        written=True,
+                    )
+                results.append((index, outcome))
+                continue
+            errors = outcome.get("errors", []) if outcome else []
+            message = "; ".join(error.get("message", "") for error in errors)
+            results.append(
+                (
+                    index,
+                    ValueError(
+                        f"Failed to create {object_name} record: "
+                        f"{message or 'no result returned'}"
+                    ),
+                )
+            )
+        return results
+
+    def _batch_describe(
+        self, groups: Sequence[Sequence[Tuple[int, Dict[str, Any]]]]
+    ) -> List[Tuple[int, Any]]:
+        """Describe up to 25 objects with one composite request.
+
+        Each group holds the batch items that need the same object's describe.
+        """
+        from simple_salesforce.api import DEFAULT_API_VERSION
+
+        client = self._client()
+        version = getattr(client, "sf_version", None) or DEFAULT_API_VERSION
+        names = [items[0][1]["object_name"] for items in groups]
+        body = {
+            "allOrNone": False,
+            "compositeRequest": [
+                {
+                    "method": "GET",
+                    "url": f"/services/data/v{version}/sobjects/{name}/describe",
+                    "referenceId": f"describe{position}",
+                }
+                for position, name in enumerate(names)
+            ],
+        }
+        try:
+            response = client.restful("composite", method="POST", data=json.dumps(body))
+        except Exception as exc:  # every describe of the call failed
+            return [(index, exc) for items in groups for index, _ in items]
+
+        by_reference = {
+            sub.get("referenceId"): sub
+            for sub in (response or {}).get("compositeResponse", [])
+        }
+        results: List[Tuple[int, Any]] = []
+        for position, (name, items) in enumerate(zip(names, groups)):
+            sub = by_reference.get(f"describe{position}") or {}
+            if sub.get("httpStatusCode") == 200:
+                describe = sub["body"]
+                if self.describe_cache_ttl > 0:
+                    self._describe_cache.set(f"describe:{name.lower()}", describe)
+                results.extend(
+                    (index, self._describe_result(params, describe))
+                    for index, params in items
+                )
+                continue
+            failure = sub.get("body")
+            errors = failure if isinstance(failure, list) else []
+            message = "; ".join(error.get("message", "") for error in errors)
+            error = ValueError(
+                f"Failed to describe '{name}': {message or 'no result returned'}"
+            )
+            results.extend((index, error) for index, _ in items)
+        return results
+
+    def _describe_result(self, params: Dict[str, Any], describe: Dict[str, Any]) -> Any:
+        """Answer a batched describe or get_field_metadata item."""
+        if params["operation"] == "describe":
+            return describe
+        try:
+            return self._find_field(
+                describe, params["object_name"], params["field_name"]
+            )
+        except ValueError as exc:
+            return exc
@@ -0,0 +1,133 @@
+"""HTTP transport tuning: compressed request bodies, conditional GETs, timeouts.
+
+``requests`` already asks for gzip-compressed responses, but request bodies
+(sObject Collections writes, composite requests) are sent as plain JSON.
+``CompressingAdapter`` gzips request bodies above a size threshold.
+
+Describes rarely change, yet each one is a large payload. ``conditional_get``
+remembers the ``ETag`` and ``Last-Modified`` validators of a response and
+sends them back as ``If-None-Match`` / ``If-Modified-Since``; Salesforce then
+answers ``304 Not Modified`` without a body and the stored copy is reused.
+
+``enable_deadline_timeouts`` passes the time left before an operation's
+deadline to ``requests`` as the timeout of the reads it makes.
+"""
+
+import gzip
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from requests.adapters import HTTPAdapter
+
+from langchain_salesforce.cache import CacheBackend
+from langchain_salesforce.hedging import request_timeout
+
+if TYPE_CHECKING:
+    from requests import PreparedRequest, Response, Session
+    from simple_salesforce import Salesforce
+
+# Bodies smaller than this are not worth the CPU of compressing them
+DEFAULT_MIN_COMPRESS_SIZE = 1024
+
+
+class CompressingAdapter(HTTPAdapter):
+    """HTTP adapter that gzips request bodies of at least ``min_size`` bytes.
+
+    Args:
+        min_size: Smallest body, in bytes, that is compressed.
+        **kwargs: Passed to ``HTTPAdapter`` (e.g. ``pool_maxsize``).
+    """
+
+    def __init__(self, min_size: int = DEFAULT_MIN_COMPRESS_SIZE, **kwargs: Any):
+        self.min_size = min_size
+        super().__init__(**kwargs)
+
+    def send(  # type: ignore[override]
+        self, request: "PreparedRequest", *args: Any, **kwargs: Any
+    ) -> "Response":
+        body = request.body
+        if (
+            body is not None
+            and isinstance(body, (str, bytes))
+            and len(body) >= self.min_size
+            and "Content-Encoding" not in request.headers
+        ):
+            raw = body.encode("utf-8") if isinstance(body, str) else body
+            request.body = gzip.compress(raw, compresslevel=5)
+            request.headers["Content-Encoding"] = "gzip"
+            request.headers["Content-Length"] = str(len(request.body))
+        return super().send(request, *args, **kwargs)
+
+
+def enable_compression(
+    session: "Session",
+    min_size: int = DEFAULT_MIN_COMPRESS_SIZE,
+    pool_maxsize: Optional[int] = None,
+) -> None:
+    """Compress request bodies and accept compressed responses on ``session``."""
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    kwargs = {} if pool_maxsize is None else {"pool_maxsize": pool_maxsize}
+    session.mount("https://", CompressingAdapter(min_size, **kwargs))
+
+
+def enable_deadline_timeouts(session: "Session") -> None:
+    """Time out requests of ``session`` at the deadline of the calling read.
+
+    ``simple_salesforce`` sends requests without a timeout, so a read that
+    its caller stopped waiting for would otherwise hold its thread and
+    connection until the server answers. See ``hedging.request_timeout``.
+    """
+    send = session.request
+    if getattr(send, "_deadline_timeouts", False):
+        return
+
+    @wraps(send)
+    def request(method: str, url: str, **kwargs: Any) -> "Response":
+        kwargs["timeout"] = request_timeout(kwargs.get("timeout"))
+        return send(method, url, **kwargs)
+
+    request._deadline_timeouts = True  # type: ignore[attr-defined]
+    session.request = request  # type: ignore[assignment,method-assign]
+
+
+def conditional_get(
+    client: "Salesforce", path: str, store: CacheBackend, name: str = ""
+) -> Any:
+    """GET a REST resource, revalidating a stored copy if there is one.
+
+    Args:
+        client: Logged-in Salesforce client.
+        path: Resource path relative to the client's ``base_url``, e.g.
+            ``"sobjects/Account/describe"``.
+        store: Cache of response bodies with their ``etag`` and
+            ``last_modified`` validators, keyed by path.
+        name: Resource name used in error messages.
+
+    Returns:
+        The decoded JSON body, fresh or reused after a 304.
+    """
+    from simple_salesforce.exceptions import SalesforceGeneralError
+
+    stored: Optional[Dict[str, Any]] = store.get(path)
+    headers: Dict[str, str] = {}
+    if stored is not None:
+        if stored["etag"]:
+            headers["If-None-Match"] = stored["etag"]
+        if stored["last_modified"]:
+            headers["If-Modified-Since"] = stored["last_modified"]
+    try:
+        response = client._call_salesforce(
+            "GET", f"{client.base_url}{path}", name=name, headers=headers
+        )
+    except SalesforceGeneralError as exc:
+        # simple_salesforce treats every status >= 300 as an error
+        if exc.status == 304 and stored is not None:
+            store.set(path, stored)  # mark as recently used
+            return stored["body"]
+        raise
+    body = response.json()
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        store.set(path, {"body": body, "etag": etag, "last_modified": last_modified})
+    return body
@@ -0,0 +1,219 @@
+"""Compact typed records generated per query.
+
+API records are dicts, each with a nested ``attributes`` dict, which costs
+hundreds of bytes per row on top of the values. ``record_schema`` generates
+a dataclass with ``__slots__`` per object of a query, with one attribute per
+selected field named and typed after the object's describe. Instances take
+little more than the values themselves, attribute access is a slot lookup,
+and date, datetime and number fields hold Python values.
+
+Parent relationships become nested records (``row.Owner.Name``) and child
+subqueries lists of records of the child object.
+"""
+
+import keyword
+from dataclasses import fields, make_dataclass
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from langchain_salesforce.coerce import coerce_value
+from langchain_salesforce.soql import SOQLQuery, parse_soql
+
+# Functions whose result is returned under the name of the field they wrap
+_VALUE_FUNCTIONS = frozenset({"tolabel", "format", "convertcurrency"})
+
+_COERCED_TYPES = frozenset({"date", "datetime", "int", "double", "currency", "percent"})
+
+Describe = Callable[[str], Dict[str, Any]]
+# Select list of one object: leaf fields (None), parents and child subqueries
+_Tree = Dict[str, Union[None, "_Tree", SOQLQuery]]
+
+
+class TypedRecord:
+    """Base class of the generated record classes."""
+
+    __slots__ = ()
+    # Field API names, in attribute order
+    _api_names: ClassVar[Tuple[str, ...]] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a dict keyed by field API names."""
+        result: Dict[str, Any] = {}
+        for item, api_name in zip(fields(self), self._api_names):  # type: ignore[arg-type]
+            value = getattr(self, item.name)
+            if isinstance(value, TypedRecord):
+                value = value.to_dict()
+            elif isinstance(value, list):
+                value = [
+                    v.to_dict() if isinstance(v, TypedRecord) else v for v in value
+                ]
+            result[api_name] = value
+        return result
+
+
+class RecordSchema:
+    """Builds typed records of one record class from API records.
+
+    Attributes:
+        record_class: The generated dataclass.
+        object_name: Object of the records, or None if it is not known
+            (e.g. a polymorphic parent).
+    """
+
+    def __init__(
+        self,
+        record_class: type,
+        object_name: Optional[str],
+        columns: Sequence[Tuple[str, Optional[Callable[[Any], Any]]]],
+    ) -> None:
+        self.record_class = record_class
+        self.object_name = object_name
+        self._columns = list(columns)
+
+    @property
+    def field_names(self) -> List[str]:
+        """API names of the fields, in attribute order."""
+        return [key for key, _ in self._columns]
+
+    def build(self, record: Dict[str, Any]) -> Any:
+        """Return ``record`` as an instance of the record class."""
+        get = record.get
+        return self.record_class(
+            *[
+                get(key) if convert is None else convert(get(key))
+                for key, convert in self._columns
+            ]
+        )
+
+    def build_all(self, records: Sequence[Dict[str, Any]]) -> List[Any]:
+        """Return a list of typed records."""
+        return [self.build(record) for record in records]
+
+    def _build_parent(self, value: Any) -> Any:
+        return None if value is None else self.build(value)
+
+    def _build_children(self, value: Any) -> List[Any]:
+        return self.build_all((value or {}).get("records") or [])
+
+
+def _select_tree(query: SOQLQuery) -> _Tree:
+    """Nest the SELECT list of ``query`` by relationship."""
+    tree: _Tree = {}
+    expressions = 0
+    alias_prefix = f"{query.alias}." if query.alias else None
+    for item in query.select:
+        if item.subquery is not None:
+            tree[item.subquery.object_name] = item.subquery
+            continue
+        if item.is_field or (
+            item.alias is None
+            and (item.function or "").lower() in _VALUE_FUNCTIONS
+            and item.arguments
+        ):
+            path = item.expression if item.is_field else item.arguments[0]
+        elif item.alias is not None:
+            path = item.alias
+        else:
+            if not item.arguments:  # COUNT() only sets totalSize
+                continue
+            path = f"expr{expressions}"
+            expressions += 1
+        if alias_prefix and path.lower().startswith(alias_prefix.lower()):
+            path = path[len(alias_prefix) :]
+        node = tree
+        *parents, name = path.split(".")
+        for parent in parents:
+            child = node.get(parent)
+            if not isinstance(child, dict):
+                child = node[parent] = {}
+            node = child
+        node.setdefault(name, None)
+    return tree
+
+
+def _schema(
+    object_name: Optional[str], tree: _Tree, describe: Describe
+) -> RecordSchema:
+    meta = describe(object_name) if object_name else {}
+    field_list = meta.get("fields", [])
+    by_name = {f["name"].lower(): f for f in field_list}
+    by_relationship = {
+        f["relationshipName"].lower(): f
+        for f in field_list
+        if f.get("relationshipName")
+    }
+    children = {
+        c["relationshipName"].lower(): c
+        for c in meta.get("childRelationships", [])
+        if c.get("relationshipName")
+    }
+    columns: List[Tuple[str, Optional[Callable[[Any], Any]]]] = []
+    attributes: List[str] = []
+    seen = set()
+    for name, node in tree.items():
+        if name.lower() in seen:
+            continue
+        seen.add(name.lower())
+        convert: Optional[Callable[[Any], Any]] = None
+        if isinstance(node, SOQLQuery):
+            relationship = children.get(name.lower())
+            key = relationship["relationshipName"] if relationship else name
+            child = _schema(
+                relationship["childSObject"] if relationship else None,
+                _select_tree(node),
+                describe,
+            )
+            convert = child._build_children
+        elif isinstance(node, dict):
+            reference = by_relationship.get(name.lower())
+            key = reference["relationshipName"] if reference else name
+            targets = (reference or {}).get("referenceTo") or []
+            parent = _schema(targets[0] if len(targets) == 1 else None, node, describe)
+            convert = parent._build_parent
+        else:
+            field = by_name.get(name.lower())
+            key = field["name"] if field else name
+            field_type = (field or {}).get("type")
+            if field_type in _COERCED_TYPES:
+                convert = _converter(field_type)
+        attribute = f"{key}_" if keyword.iskeyword(key) else key
+        columns.append((key, convert))
+        attributes.append(attribute)
+    record_class = make_dataclass(
+        f"{object_name or ''}Record",
+        [(attribute, Any) for attribute in attributes],
+        bases=(TypedRecord,),
+        namespace={
+            "__slots__": tuple(attributes),
+            "_api_names": tuple(key for key, _ in columns),
+        },
+    )
+    return RecordSchema(record_class, object_name, columns)
+
+
+def _converter(field_type: str) -> Callable[[Any], Any]:
+    return lambda value: coerce_value(value, field_type)
+
+
+def record_schema(query: str, describe: Describe) -> RecordSchema:
+    """Generate the record classes for the results of ``query``.
+
+    Args:
+        query: SOQL query whose SELECT list defines the fields.
+        describe: Returns the describe of an object, e.g. the tool's cached
+            ``_describe_object``.
+
+    Raises:
+        SOQLParseError: If the query cannot be parsed.
+    """
+    parsed = parse_soql(query)
+    return _schema(parsed.object_name, _select_tree(parsed), describe)
@@ -0,0 +1,437 @@
+"""Local validation of SOQL queries and record data against cached describes.
+
+Misspelled objects, fields and relationship names are caught before the
+query is sent, with close matches suggested, so that an agent can correct
+its query without paying for a round trip that ends in MALFORMED_QUERY or
+INVALID_FIELD. Record data for creates and updates is checked the same way
+(unknown, read-only and missing required fields, types, lengths and
+restricted picklist values), and dates and numbers are coerced into the
+form the API expects.
+"""
+
+import difflib
+import math
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from langchain_salesforce.soql import (
+    SOQLParseError,
+    SOQLQuery,
+    field_paths,
+    parse_soql,
+)
+
+# Functions whose arguments are not field paths
+_NON_FIELD_FUNCTIONS = {"FIELDS"}
+
+
+@dataclass
+class SOQLIssue:
+    """A problem found in a SOQL query, with suggested replacements."""
+
+    message: str
+    suggestions: List[str] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        if not self.suggestions:
+            return self.message
+        return f"{self.message} Did you mean: {', '.join(self.suggestions)}?"
+
+
+class SOQLValidationError(ValueError):
+    """Raised when a SOQL query references unknown objects or fields."""
+
+    def __init__(self, issues: List[SOQLIssue]) -> None:
+        self.issues = issues
+        super().__init__("Invalid SOQL query: " + " ".join(str(i) for i in issues))
+
+
+def _suggest(name: str, candidates: Iterable[str]) -> List[str]:
+    by_lower = {candidate.lower(): candidate for candidate in candidates}
+    matches = difflib.get_close_matches(name.lower(), list(by_lower), n=3, cutoff=0.6)
+    return [by_lower[match] for match in matches]
+
+
+class _SchemaIndex:
+    """Case-insensitive lookup of fields and relationships of one object."""
+
+    def __init__(self, object_name: str, describe: Dict[str, Any]) -> None:
+        self.name = describe.get("name") or object_name
+        self.fields: Dict[str, Dict[str, Any]] = {}
+        self.parents: Dict[str, Dict[str, Any]] = {}
+        for field_meta in describe.get("fields", []):
+            self.fields[field_meta["name"].lower()] = field_meta
+            relationship = field_meta.get("relationshipName")
+            if relationship:
+                self.parents[relationship.lower()] = field_meta
+        self.children: Dict[str, Dict[str, Any]] = {
+            child["relationshipName"].lower(): child
+            for child in describe.get("childRelationships", [])
+            if child.get("relationshipName")
+        }
+
+
+class SOQLValidator:
+    """Check SOQL queries against object describes.
+
+    Args:
+        describe: Returns the describe of an object; expected to be cached.
+        object_names: Returns the names of all queryable objects; expected to
+            be cached. When None, object names are checked through
+            ``describe`` only.
+    """
+
+    def __init__(
+        self,
+        describe: Callable[[str], Dict[str, Any]],
+        object_names: Optional[Callable[[], Iterable[str]]] = None,
+    ) -> None:
+        self._describe = describe
+        self._object_names = object_names
+
+    def validate(self, query: str) -> List[SOQLIssue]:
+        """Return the problems found in ``query``.
+
+        Queries using syntax the local parser does not understand are not
+        checked and yield no issues; Salesforce remains the final authority.
+        """
+        try:
+            parsed = parse_soql(query)
+        except SOQLParseError:
+            return []
+        return _QueryCheck(self._describe).check(parsed, self._object_names)
+
+
+class _QueryCheck:
+    """State of a single validation run (schema indexes built on demand)."""
+
+    def __init__(self, describe: Callable[[str], Dict[str, Any]]) -> None:
+        self._describe = describe
+        self._indexes: Dict[str, _SchemaIndex] = {}
+
+    def _index(self, object_name: str) -> _SchemaIndex:
+        key = object_name.lower()
+        if key not in self._indexes:
+            describe = self._describe(object_name)
+            self._indexes[key] = _SchemaIndex(object_name, describe)
+        return self._indexes[key]
+
+    def check(
+        self,
+        parsed: SOQLQuery,
+        object_names: Optional[Callable[[], Iterable[str]]] = None,
+        object_name: Optional[str] = None,
+    ) -> List[SOQLIssue]:
+        """Check ``parsed``; ``object_name`` overrides its FROM target."""
+        target = object_name or parsed.object_name
+        if object_names is not None:
+            names = list(object_names())
+            canonical = {n.lower(): n for n in names}
+            if target.lower() not in canonical:
+                return [
+                    SOQLIssue(
+                        f"Object '{target}' does not exist.", _suggest(target, names)
+                    )
+                ]
+            target = canonical[target.lower()]
+        index = self._index(target)
+        issues: List[SOQLIssue] = []
+        for item in parsed.select:
+            if item.subquery is not None:
+                issues.extend(self._check_child_query(index, item.subquery))
+            elif item.is_field:
+                issues.extend(self._check_path(index, item.expression, parsed.alias))
+            elif item.function not in _NON_FIELD_FUNCTIONS:
+                for argument in item.arguments:
+                    issues.extend(self._check_path(index, argument, parsed.alias))
+
+        paths = field_paths(parsed.where) + parsed.group_by
+        paths.extend(order.field for order in parsed.order_by)
+        for path in paths:
+            issues.extend(self._check_path(index, path, parsed.alias))
+        for semi_join in parsed.semi_joins:
+            issues.extend(self.check(semi_join, object_names))
+        return issues
+
+    def _check_child_query(
+        self, parent: _SchemaIndex, subquery: SOQLQuery
+    ) -> List[SOQLIssue]:
+        relationship = parent.children.get(subquery.object_name.lower())
+        if relationship is None:
+            return [
+                SOQLIssue(
+                    f"Child relationship '{subquery.object_name}' does not exist "
+                    f"on '{parent.name}'.",
+                    _suggest(
+                        subquery.object_name,
+                        [c["relationshipName"] for c in parent.children.values()],
+                    ),
+                )
+            ]
+        return self.check(subquery, object_name=relationship["childSObject"])
+
+    def _check_path(
+        self, index: _SchemaIndex, path: str, alias: Optional[str]
+    ) -> List[SOQLIssue]:
+        parts = path.split(".")
+        if alias and len(parts) > 1 and parts[0].lower() == alias.lower():
+            parts = parts[1:]
+
+        current = index
+        for part in parts[:-1]:
+            reference = current.parents.get(part.lower())
+            if reference is None:
+                return [
+                    SOQLIssue(
+                        f"Relationship '{part}' does not exist on '{current.name}'.",
+                        _suggest(
+                            part,
+                            [f["relationshipName"] for f in current.parents.values()],
+                        ),
+                    )
+                ]
+            targets = reference.get("referenceTo") or []
+            if len(targets) != 1:
+                # Polymorphic lookups resolve to a Name object at query time
+                return []
+            current = self._index(targets[0])
+
+        last = parts[-1]
+        if last.lower() in current.fields:
+            return []
+        return [
+            SOQLIssue(
+                f"Field '{last}' does not exist on '{current.name}'.",
+                _suggest(last, [f["name"] for f in current.fields.values()]),
+            )
+        ]
+
+
+# Field types whose values are sent as strings
+_STRING_TYPES = {
+    "string",
+    "textarea",
+    "email",
+    "phone",
+    "url",
+    "picklist",
+    "multipicklist",
+    "combobox",
+    "encryptedstring",
+}
+_NUMBER_TYPES = {"double", "currency", "percent"}
+_ID_TYPES = {"id", "reference"}
+_RECORD_ID_RE = re.compile(r"^[a-zA-Z0-9]{15}(?:[a-zA-Z0-9]{3})?$")
+# Number with well-formed thousands separators, e.g. 1,234,567.89
+_THOUSANDS_RE = re.compile(r"^[+-]?\d{1,3}(?:,\d{3})+(?:\.\d+)?$")
+# UTC offset without a colon, as the API returns it (e.g. +0000)
+_COMPACT_OFFSET_RE = re.compile(r"([+-]\d{2})(\d{2})$")
+
+
+@dataclass
+class RecordIssue(SOQLIssue):
+    """A problem found in record data, with suggested replacements."""
+
+
+class _InvalidValue(ValueError):
+    def __init__(self, message: str, suggestions: Optional[List[str]] = None) -> None:
+        super().__init__(message)
+        self.suggestions = suggestions or []
+
+
+class RecordValidationError(ValueError):
+    """Raised when record data does not match the object's fields."""
+
+    def __init__(self, object_name: str, issues: List[RecordIssue]) -> None:
+        self.issues = issues
+        super().__init__(
+            f"Invalid {object_name} record data: " + " ".join(str(i) for i in issues)
+        )
+
+
+class RecordValidator:
+    """Check and coerce record data against object describes.
+
+    Args:
+        describe: Returns the describe of an object; expected to be cached.
+    """
+
+    def __init__(self, describe: Callable[[str], Dict[str, Any]]) -> None:
+        self._describe = describe
+
+    def check(
+        self, object_name: str, record_data: Dict[str, Any], operation: str
+    ) -> Tuple[Dict[str, Any], List[RecordIssue]]:
+        """Return the coerced record data and the problems found in it.
+
+        Args:
+            object_name: Object the record belongs to.
+            record_data: Field values to write.
+            operation: ``"create"`` or ``"update"``.
+        """
+        index = _SchemaIndex(object_name, self._describe(object_name))
+        access = "createable" if operation == "create" else "updateable"
+        coerced: Dict[str, Any] = {}
+        failed: Set[str] = set()
+        issues: List[RecordIssue] = []
+        for name, value in record_data.items():
+            meta = index.fields.get(name.lower())
+            if meta is None:
+                issues.append(
+                    RecordIssue(
+                        f"Field '{name}' does not exist on '{index.name}'.",
+                        _suggest(name, [f["name"] for f in index.fields.values()]),
+                    )
+                )
+                continue
+            if not meta.get(access, True):
+                issues.append(RecordIssue(f"Field '{meta['name']}' is not {access}."))
+                continue
+            try:
+                coerced[meta["name"]] = _coerce(meta, value)
+            except _InvalidValue as exc:
+                failed.add(meta["name"])
+                issues.append(
+                    RecordIssue(f"Field '{meta['name']}' {exc}.", exc.suggestions)
+                )
+
+        if operation == "create":
+            missing = [
+                meta["name"]
+                for meta in index.fields.values()
+                if meta.get("createable")
+                and not meta.get("nillable", True)
+                and not meta.get("defaultedOnCreate")
+                and meta.get("type") != "boolean"
+                and meta["name"] not in coerced
+                and meta["name"] not in failed
+            ]
+            if missing:
+                issues.append(
+                    RecordIssue(f"Required fields are missing: {', '.join(missing)}.")
+                )
+        return coerced, issues
+
+    def coerce(
+        self, object_name: str, record_data: Dict[str, Any], operation: str
+    ) -> Dict[str, Any]:
+        """Return the coerced record data.
+
+        Raises:
+            RecordValidationError: If any problem is found.
+        """
+        coerced, issues = self.check(object_name, record_data, operation)
+        if issues:
+            raise RecordValidationError(object_name, issues)
+        return coerced
+
+
+def _coerce(meta: Dict[str, Any], value: Any) -> Any:
+    """Return ``value`` in the form the API expects for the field."""
+    if value is None:
+        if not meta.get("nillable", True):
+            raise _InvalidValue("cannot be null")
+        return None
+    field_type = meta.get("type")
+    if field_type == "boolean":
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.lower() in ("true", "false"):
+            return value.lower() == "true"
+        raise _InvalidValue(f"expects a boolean, got {value!r}")
+    if field_type == "int":
+        number = _to_number(value)
+        if number != int(number):
+            raise _InvalidValue(f"expects an integer, got {value!r}")
+        return int(number)
+    if field_type in _NUMBER_TYPES:
+        return _to_number(value)
+    if field_type == "date":
+        return _to_date(value)
+    if field_type == "datetime":
+        return _to_datetime(value)
+    if field_type in _ID_TYPES:
+        if not isinstance(value, str) or not _RECORD_ID_RE.match(value):
+            raise _InvalidValue(f"expects a record ID, got {value!r}")
+        return value
+    if field_type in _STRING_TYPES:
+        if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+            raise _InvalidValue(f"expects a string, got {value!r}")
+        text = str(value)
+        length = meta.get("length") or 0
+        if length and len(text) > length:
+            raise _InvalidValue(f"is longer than {length} characters")
+        if meta.get("restrictedPicklist"):
+            _check_picklist(meta, text)
+        return text
+    return value
+
+
+def _to_number(value: Any) -> float:
+    if isinstance(value, bool):
+        raise _InvalidValue(f"expects a number, got {value!r}")
+    number: Optional[float] = None
+    if isinstance(value, (int, float)):
+        number = value
+    elif isinstance(value, str):
+        text = value.strip()
+        if _THOUSANDS_RE.match(text):
+            text = text.replace(",", "")
+        try:
+            number = float(text)
+        except ValueError:
+            pass
+    if number is None or not math.isfinite(number):
+        raise _InvalidValue(f"expects a number, got {value!r}")
+    return number
+
+
+def _to_date(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value.strip()).isoformat()
+        except ValueError:
+            pass
+    raise _InvalidValue(f"expects a date (YYYY-MM-DD), got {value!r}")
+
+
+def _to_datetime(value: Any) -> str:
+    if isinstance(value, str):
+        # fromisoformat only accepts +HH:MM offsets before Python 3.11
+        text = _COMPACT_OFFSET_RE.sub(r"\1:\2", value.strip().replace("Z", "+00:00"))
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            raise _InvalidValue(
+                f"expects an ISO 8601 datetime, got {value!r}"
+            ) from None
+    elif isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, date):
+        parsed = datetime(value.year, value.month, value.day)
+    else:
+        raise _InvalidValue(f"expects an ISO 8601 datetime, got {value!r}")
+    if parsed.tzinfo is None:
+        # Naive datetimes are taken as UTC, like the API does
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _check_picklist(meta: Dict[str, Any], text: str) -> None:
+    allowed = [
+        entry["value"]
+        for entry in meta.get("picklistValues", [])
+        if entry.get("active", True)
+    ]
+    values = text.split(";") if meta.get("type") == "multipicklist" else [text]
+    for value in values:
+        if value not in allowed:
+            raise _InvalidValue(
+                f"has no picklist value '{value}'", _suggest(value, allowed)
+            )
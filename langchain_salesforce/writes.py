@@ -0,0 +1,244 @@
+"""Write-behind buffering of record updates.
+
+Bursts of small updates to the same records (an agent setting one field at a
+time, a workflow touching a record on every step) each cost a round trip.
+``WriteBehindBuffer`` queues updates instead, merges the fields written to
+the same record, and sends the merged updates through the sObject
+Collections API, 200 records per call, once enough records are pending or
+the oldest pending update has waited long enough. Every update gets a
+future that resolves with that record's outcome.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
+
+from langchain_salesforce.records import to_id18
+
+if TYPE_CHECKING:
+    from langchain_salesforce.tools import SalesforceTool
+
+logger = logging.getLogger(__name__)
+
+# Records per sObject Collections call
+_COLLECTIONS_BATCH_SIZE = 200
+
+
+@dataclass
+class _PendingWrite:
+    """Merged fields of one record and the futures of the merged updates."""
+
+    fields: Dict[str, Any] = field(default_factory=dict)
+    futures: List["Future[Dict[str, Any]]"] = field(default_factory=list)
+
+
+class WriteBehindBuffer:
+    """Coalesce record updates and send them in batches.
+
+    Updates are sent from a background thread when ``max_records`` records
+    are pending or ``flush_interval`` seconds after the first pending update,
+    whichever comes first; ``flush`` sends them right away. Updates of one
+    record are always sent in the order they were made. Queries do not see
+    pending updates until they are flushed.
+
+    Example:
+        .. code-block:: python
+
+            with WriteBehindBuffer(tool, flush_interval=0.5) as buffer:
+                for step in steps:
+                    buffer.update("Case", case_id, {"Status__c": step})
+                done = buffer.update("Case", case_id, {"Status": "Closed"})
+            done.result()  # {"id": case_id, "success": True, "errors": []}
+
+    Args:
+        tool: Tool whose client sends the updates.
+        max_records: Pending records that trigger a flush.
+        flush_interval: Seconds a pending update waits at most before it is
+            sent.
+    """
+
+    def __init__(
+        self,
+        tool: "SalesforceTool",
+        max_records: int = _COLLECTIONS_BATCH_SIZE,
+        flush_interval: float = 1.0,
+    ) -> None:
+        if max_records <= 0:
+            raise ValueError("max_records must be a positive integer")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        self.tool = tool
+        self.max_records = max_records
+        self.flush_interval = flush_interval
+        self._pending: "OrderedDict[Tuple[str, str], _PendingWrite]" = OrderedDict()
+        self._first_pending: Optional[float] = None
+        self._closed = False
+        self._condition = threading.Condition()
+        # Serializes sends so that updates of a record are applied in order
+        self._send_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="salesforce-write-behind", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        """Number of records with unsent updates."""
+        with self._condition:
+            return len(self._pending)
+
+    def update(
+        self, object_name: str, record_id: str, record_data: Dict[str, Any]
+    ) -> "Future[Dict[str, Any]]":
+        """Queue an update; fields written twice keep the latest value.
+
+        Returns:
+            Future resolving with the Salesforce result of the record's
+            update, or raising the reason it failed.
+
+        Raises:
+            ValueError: If the buffer is closed or the object name or record
+                ID is invalid.
+        """
+        self.tool._validate_object_name(object_name)
+        self.tool._validate_record_id(record_id)
+        future: "Future[Dict[str, Any]]" = Future()
+        with self._condition:
+            if self._closed:
+                raise ValueError("Write-behind buffer is closed")
+            pending = self._pending.setdefault(
+                (object_name, to_id18(record_id)), _PendingWrite()
+            )
+            pending.fields.update(record_data)
+            pending.futures.append(future)
+            if self._first_pending is None:
+                self._first_pending = time.monotonic()
+            self._condition.notify()
+        return future
+
+    def flush(self) -> None:
+        """Send every pending update and wait for the results."""
+        with self._send_lock:
+            with self._condition:
+                batch, self._pending = self._pending, OrderedDict()
+                self._first_pending = None
+            self._send(batch)
+
+    async def aflush(self) -> None:
+        """Send every pending update without blocking the event loop."""
+        await asyncio.to_thread(self.flush)
+
+    def close(self) -> None:
+        """Flush pending updates and stop the background thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self.flush()
+
+    def __enter__(self) -> "WriteBehindBuffer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._due():
+                    if self._closed:
+                        return
+                    timeout = None
+                    if self._first_pending is not None:
+                        elapsed = time.monotonic() - self._first_pending
+                        timeout = self.flush_interval - elapsed
+                    self._condition.wait(timeout)
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                # Keep flushing later updates; failed ones resolve their futures
+                logger.exception("Write-behind flush failed")
+
+    def _due(self) -> bool:
+        if not self._pending:
+            return False
+        if self._closed or len(self._pending) >= self.max_records:
+            return True
+        elapsed = time.monotonic() - cast(float, self._first_pending)
+        return elapsed >= self.flush_interval
+
+    def _send(self, batch: "OrderedDict[Tuple[str, str], _PendingWrite]") -> None:
+        by_object: Dict[str, List[Tuple[str, _PendingWrite]]] = {}
+        for (object_name, record_id), pending in batch.items():
+            by_object.setdefault(object_name, []).append((record_id, pending))
+        for object_name, writes in by_object.items():
+            for start in range(0, len(writes), _COLLECTIONS_BATCH_SIZE):
+                self._send_chunk(
+                    object_name, writes[start : start + _COLLECTIONS_BATCH_SIZE]
+                )
+
+    def _send_chunk(
+        self, object_name: str, writes: List[Tuple[str, _PendingWrite]]
+    ) -> None:
+        """Update up to 200 records of one object with one Collections call."""
+        body = {
+            "allOrNone": False,
+            "records": [
+                {"attributes": {"type": object_name}, "id": record_id, **pending.fields}
+                for record_id, pending in writes
+            ],
+        }
+        try:
+            response = self.tool._client().restful(
+                "composite/sobjects", method="PATCH", data=json.dumps(body)
+            )
+        except Exception as exc:  # every record of the call failed
+            for _, pending in writes:
+                for future in pending.futures:
+                    future.set_exception(exc)
+            self._invalidate(object_name, [record_id for record_id, _ in writes])
+            return
+
+        # Queries run while the updates were queued may have cached old values
+        record_cache = self.tool._record_cache
+        outcomes = list(response or [])
+        failed: List[str] = []
+        for position, (record_id, pending) in enumerate(writes):
+            outcome = outcomes[position] if position < len(outcomes) else None
+            if outcome is not None and outcome.get("success"):
+                if record_cache is not None:
+                    try:
+                        record_cache.merge(
+                            object_name, record_id, pending.fields, written=True
+                        )
+                    except Exception:  # pylint: disable=broad-except
+                        failed.append(record_id)
+                for future in pending.futures:
+                    future.set_result(outcome)
+                continue
+            failed.append(record_id)
+            errors = outcome.get("errors", []) if outcome else []
+            message = "; ".join(error.get("message", "") for error in errors)
+            for future in pending.futures:
+                future.set_exception(
+                    ValueError(
+                        f"Failed to update {object_name} record {record_id}: "
+                        f"{message or 'no result returned'}"
+                    )
+                )
+        self._invalidate(object_name, failed)
+
+    def _invalidate(self, object_name: str, record_ids: List[str]) -> None:
+        """Drop cached data a flush made stale, once its futures are resolved."""
+        try:
+            if record_ids:
+                self.tool.invalidate_records(object_name, record_ids)
+            self.tool.invalidate_queries(object_name)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Invalidating %s caches after a flush failed", object_name)
@@ -0,0 +1,177 @@
+"""Unit tests for the aggregate operation."""
+
+from datetime import date, timedelta
+from typing import Any, Dict, List, cast
+from unittest.mock import MagicMock
+
+import pytest
+from simple_salesforce import Salesforce
+from simple_salesforce.api import SFType
+
+from langchain_salesforce.aggregate import AggregateQuery, parse_aggregate
+from langchain_salesforce.tools import SalesforceTool
+
+_DESCRIBES: Dict[str, Dict[str, Any]] = {
+    "Opportunity": {
+        "fields": [
+            {"name": "StageName", "type": "picklist"},
+            {"name": "Amount", "type": "currency"},
+            {"name": "CloseDate", "type": "date"},
+            {
+                "name": "AccountId",
+                "type": "reference",
+                "relationshipName": "Account",
+                "referenceTo": ["Account"],
+            },
+        ]
+    },
+    "Account": {"fields": [{"name": "Industry", "type": "picklist"}]},
+}
+
+
+@pytest.fixture
+def tool() -> SalesforceTool:
+    mock_sf = MagicMock(spec=Salesforce)
+    for object_name, describe in _DESCRIBES.items():
+        sobject = MagicMock(spec=SFType)
+        sobject.describe = MagicMock(return_value=describe)
+        setattr(mock_sf, object_name, sobject)
+    return SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+    )
+
+
+def _page(groups: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"totalSize": len(groups), "done": True, "records": groups}
+
+
+def test_parse_aggregate() -> None:
+    """Test parsing and normalizing aggregate expressions."""
+    assert parse_aggregate("sum( Amount )").label == "SUM(Amount)"
+    assert parse_aggregate("COUNT()").label == "COUNT(Id)"
+    assert parse_aggregate("count_distinct(Account.Name)").function == (
+        "COUNT_DISTINCT"
+    )
+    for expression in ("MEDIAN(Amount)", "SUM()", "SUM(Amount); DELETE"):
+        with pytest.raises(ValueError):
+            parse_aggregate(expression)
+
+
+def test_query_building() -> None:
+    """Test the SOQL built for a grouped aggregate."""
+    aggregate = AggregateQuery(
+        "Opportunity", ["StageName"], ["SUM(Amount)", "COUNT()"], "Amount > 0"
+    )
+
+    assert aggregate.columns == ["StageName", "SUM(Amount)", "COUNT(Id)"]
+    assert aggregate.soql() == (
+        "SELECT StageName g0, SUM(Amount) a0, COUNT(Id) a1 FROM Opportunity "
+        "WHERE (Amount > 0) GROUP BY StageName ORDER BY StageName ASC NULLS FIRST "
+        "LIMIT 2000"
+    )
+    assert AggregateQuery("Lead").soql() == "SELECT COUNT(Id) a0 FROM Lead"
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"group_by": ["Name, (SELECT Id FROM Contacts)"]},
+        {"where": "Amount >"},
+        {"where": "Amount > 0 LIMIT 5"},
+        {"where": "Amount > 0 GROUP BY Name"},
+    ],
+)
+def test_invalid_input(kwargs: Dict[str, Any]) -> None:
+    """Test that unsafe grouping fields and conditions are rejected."""
+    with pytest.raises(ValueError):
+        AggregateQuery("Opportunity", **kwargs)
+
+
+def test_keyset_condition() -> None:
+    """Test the condition that selects the groups after a given key."""
+    aggregate = AggregateQuery("Opportunity", ["StageName", "Account.Industry"])
+
+    query = aggregate.soql(["O'Hare", None])
+
+    assert (
+        "WHERE ((StageName > 'O\\'Hare') OR "
+        "(StageName = 'O\\'Hare' AND Account.Industry != null))"
+    ) in query
+
+
+def test_aggregate_operation(tool: SalesforceTool) -> None:
+    """Test the compact table returned by the aggregate operation."""
+    mock_sf = cast(MagicMock, tool._sf)
+    mock_sf.query.return_value = _page(
+        [
+            {"attributes": {"type": "AggregateResult"}, "g0": "Won", "a0": 3},
+            {"attributes": {"type": "AggregateResult"}, "g0": "Lost", "a0": 1},
+        ]
+    )
+
+    result = tool.invoke(
+        {
+            "operation": "aggregate",
+            "object_name": "Opportunity",
+            "group_by": ["StageName"],
+        }
+    )
+
+    assert result == {
+        "object": "Opportunity",
+        "columns": ["StageName", "COUNT(Id)"],
+        "rows": [["Won", 3], ["Lost", 1]],
+        "group_count": 2,
+        "complete": True,
+    }
+    assert mock_sf.query.call_count == 1
+
+
+def test_aggregate_pages_past_group_limit(tool: SalesforceTool) -> None:
+    """Test keyset paging when a query returns the maximum of 2,000 groups."""
+    mock_sf = cast(MagicMock, tool._sf)
+    days = [str(date(2020, 1, 1) + timedelta(days=i)) for i in range(2000)]
+    first = [{"g0": day, "g1": None, "a0": i} for i, day in enumerate(days)]
+    mock_sf.query.side_effect = [_page(first), _page([{"g0": "z", "g1": 1}])]
+
+    result = tool.invoke(
+        {
+            "operation": "aggregate",
+            "object_name": "Opportunity",
+            "group_by": ["CloseDate", "Account.Industry"],
+            "aggregates": ["SUM(Amount)"],
+        }
+    )
+
+    assert result["group_count"] == 2001
+    assert result["complete"] is True
+    second_query = mock_sf.query.call_args_list[1].args[0]
+    # Dates are compared unquoted
+    assert f"(CloseDate > {days[-1]})" in second_query
+    assert f"CloseDate = {days[-1]} AND Account.Industry != null" in second_query
+
+
+def test_aggregate_max_groups(tool: SalesforceTool) -> None:
+    """Test that results are cut off and flagged at aggregate_max_groups."""
+    tool.aggregate_max_groups = 1500
+    mock_sf = cast(MagicMock, tool._sf)
+    mock_sf.query.return_value = _page([{"g0": str(i)} for i in range(2000)])
+
+    result = tool.invoke(
+        {"operation": "aggregate", "object_name": "Lead", "group_by": ["Status"]}
+    )
+
+    assert result["group_count"] == 1500
+    assert result["complete"] is False
+    assert mock_sf.query.call_count == 1
+
+
+def test_aggregate_requires_valid_object(tool: SalesforceTool) -> None:
+    """Test parameter and object name validation."""
+    with pytest.raises(ValueError, match="Object name is required"):
+        tool.invoke({"operation": "aggregate"})
+    with pytest.raises(ValueError, match="Invalid Salesforce object name"):
+        tool.invoke({"operation": "aggregate", "object_name": "Lead WHERE"})
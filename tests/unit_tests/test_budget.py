@@ -0,0 +1,141 @@
+"""Unit tests for output budgets and continuation cursors."""
+
+from typing import Any, Dict, List, cast
+from unittest.mock import MagicMock
+
+import pytest
+from simple_salesforce import Salesforce
+
+from langchain_salesforce.budget import OutputBudget
+from langchain_salesforce.tools import SalesforceTool
+
+
+def _records(start: int, count: int) -> List[Dict[str, Any]]:
+    return [
+        {"attributes": {"type": "Contact"}, "Id": f"003{i:015d}", "Name": f"N{i}"}
+        for i in range(start, start + count)
+    ]
+
+
+def _no_more(url: str) -> Dict[str, Any]:
+    raise AssertionError("unexpected server fetch")
+
+
+def test_small_results_unchanged() -> None:
+    """Test that results within the budget are returned as is."""
+    budget = OutputBudget(1000)
+    result = {"totalSize": 1, "done": True, "records": _records(0, 1)}
+
+    assert budget.apply(result) is result
+    assert budget.apply({"id": "1", "success": True}) == {"id": "1", "success": True}
+
+
+def test_records_paged_locally() -> None:
+    """Test slicing a query page and continuing from the held records."""
+    budget = OutputBudget(2000, unit="bytes")
+    records = _records(0, 100)
+
+    first = budget.apply({"totalSize": 100, "done": True, "records": records})
+
+    assert first["truncated"] is True
+    assert first["done"] is False
+    assert budget.size(first) <= 2000
+    returned = first["summary"]["returned"]
+    assert first["records"] == records[:returned]
+    assert first["summary"]["remaining"] == 100 - returned
+    assert first["summary"]["total"] == 100
+    assert first["summary"]["fields"] == ["Id", "Name"]
+
+    seen = list(first["records"])
+    cursor = first["cursor"]
+    while cursor:
+        page = budget.fetch_more(cursor, _no_more)
+        seen.extend(page["records"])
+        cursor = page.get("cursor")
+    assert seen == records
+    assert page["done"] is True
+    # Cursors stay valid, so a retried fetch returns the same slice
+    assert (
+        budget.fetch_more(first["cursor"], _no_more)["records"][0] == records[returned]
+    )
+
+
+def test_server_cursor_followed_without_rerunning_query() -> None:
+    """Test that the next server page is fetched via nextRecordsUrl."""
+    budget = OutputBudget(10_000, unit="bytes")
+    query_more = MagicMock(
+        return_value={"done": True, "totalSize": 3, "records": _records(2, 1)}
+    )
+    first = budget.apply(
+        {
+            "totalSize": 3,
+            "done": False,
+            "nextRecordsUrl": "/services/data/v59.0/query/01g-2",
+            "records": _records(0, 2) + [{"Big": "x" * 20_000}],
+        }
+    )
+    assert "nextRecordsUrl" not in first
+    assert first["summary"]["more_on_server"] is True
+
+    page = budget.fetch_more(first["cursor"], query_more)
+    assert page["records"] == [{"Big": "x" * 20_000}]
+    last = budget.fetch_more(page["cursor"], query_more)
+
+    query_more.assert_called_once_with("/services/data/v59.0/query/01g-2")
+    assert last["records"] == _records(2, 1)
+    assert last["done"] is True
+
+
+def test_lists_and_describes_trimmed() -> None:
+    """Test object lists and describes, whose other lists are summarized."""
+    budget = OutputBudget(500)
+    objects = [{"name": f"Object{i}__c", "label": f"Object {i}"} for i in range(200)]
+
+    first = budget.apply(objects)
+    assert first["items"] == objects[: first["summary"]["returned"]]
+
+    describe = {
+        "name": "Account",
+        "fields": [{"name": f"Field{i}__c", "type": "string"} for i in range(300)],
+        "childRelationships": [{"relationshipName": f"R{i}"} for i in range(300)],
+    }
+    trimmed = budget.apply(describe)
+    assert trimmed["name"] == "Account"
+    assert "childRelationships" not in trimmed
+    assert trimmed["summary"]["omitted"] == {"childRelationships": 300}
+
+
+def test_invalid_cursor() -> None:
+    """Test errors for unknown cursors and invalid budgets."""
+    with pytest.raises(ValueError, match="Unknown or expired cursor"):
+        OutputBudget(100).fetch_more("nope", _no_more)
+    with pytest.raises(ValueError, match="unit"):
+        OutputBudget(100, unit="words")
+
+
+def test_tool_fetch_more() -> None:
+    """Test the budget and 'fetch_more' operation through the tool."""
+    mock_sf = MagicMock(spec=Salesforce)
+    records = _records(0, 50)
+    mock_sf.query = MagicMock(
+        return_value={"totalSize": 50, "done": True, "records": records}
+    )
+    tool = SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        output_budget=300,
+    )
+
+    first = cast(
+        Dict[str, Any], tool._run(operation="query", query="SELECT Id FROM Contact")
+    )
+    rest = cast(
+        Dict[str, Any], tool._run(operation="fetch_more", cursor=first["cursor"])
+    )
+
+    assert rest["records"][0] == records[len(first["records"])]
+    assert mock_sf.query.call_count == 1
+    with pytest.raises(ValueError, match="Cursor is required"):
+        tool._run(operation="fetch_more")
@@ -0,0 +1,61 @@
+"""Unit tests for the in-process caches."""
+
+from unittest.mock import patch
+
+import pytest
+
+from langchain_salesforce.cache import TTLCache
+
+
+def test_get_set_delete() -> None:
+    """Test basic cache operations."""
+    cache = TTLCache()
+    cache.set("describe:account", {"name": "Account"})
+
+    assert cache.get("describe:account") == {"name": "Account"}
+    assert "describe:account" in cache
+    assert cache.get("missing", "default") == "default"
+
+    cache.delete("describe:account")
+    assert "describe:account" not in cache
+
+
+def test_entries_expire() -> None:
+    """Test that entries are dropped once their TTL has passed."""
+    cache = TTLCache(ttl=10)
+    with patch("langchain_salesforce.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=100)
+    with patch("langchain_salesforce.cache.time.monotonic", return_value=111.0):
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+
+def test_lru_eviction() -> None:
+    """Test that the least recently used entry is evicted first."""
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert len(cache) == 2
+
+
+def test_delete_prefix() -> None:
+    """Test dropping a group of related keys."""
+    cache = TTLCache()
+    cache.set("query:account:SELECT Id FROM Account", 1)
+    cache.set("query:account:SELECT Name FROM Account", 2)
+    cache.set("query:contact:SELECT Id FROM Contact", 3)
+
+    assert cache.delete_prefix("query:account:") == 2
+    assert len(cache) == 1
+
+
+def test_invalid_maxsize() -> None:
+    """Test that a non-positive maxsize is rejected."""
+    with pytest.raises(ValueError, match="maxsize"):
+        TTLCache(maxsize=0)
@@ -0,0 +1,207 @@
+"""Unit tests for the shared cache backends."""
+
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
+from unittest.mock import MagicMock
+
+import pytest
+from simple_salesforce import Salesforce
+from simple_salesforce.api import SFType
+
+from langchain_salesforce.cache import CacheBackend, ScopedCache, TTLCache
+from langchain_salesforce.cache_backends import RedisCache, SQLiteCache
+from langchain_salesforce.tools import SalesforceTool
+
+_ID = "001000000000001AAA"
+
+
+class FakeRedis:
+    """In-memory stand-in for the subset of redis.Redis the cache uses."""
+
+    def __init__(self) -> None:
+        self.data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self.data.get(key)
+        if entry is None or (entry[1] is not None and time.time() >= entry[1]):
+            return None
+        return entry[0]
+
+    def set(self, key: str, value: str, px: Optional[int] = None) -> bool:
+        expires_at = time.time() + px / 1000 if px is not None else None
+        self.data[key] = (value.encode(), expires_at)
+        return True
+
+    def delete(self, *keys: str) -> int:
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def scan_iter(self, match: str, count: int = 10) -> Iterator[str]:
+        pattern = re.sub(
+            r"\\(.)|(\*)|(\?)|(.)",
+            lambda m: (
+                re.escape(m.group(1))
+                if m.group(1)
+                else ".*"
+                if m.group(2)
+                else "."
+                if m.group(3)
+                else re.escape(m.group(4))
+            ),
+            match,
+        )
+        return iter([key for key in list(self.data) if re.fullmatch(pattern, key)])
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def backend(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[CacheBackend]:
+    if request.param == "memory":
+        yield TTLCache()
+    elif request.param == "sqlite":
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        yield cache
+        cache.close()
+    else:
+        yield RedisCache(FakeRedis())
+
+
+def test_backend_contract(backend: CacheBackend) -> None:
+    """Test get, set, expiry and prefix deletion on every backend."""
+    backend.set("query:account:a", {"records": [1, 2]})
+    backend.set("query:account:b", ["x"])
+    backend.set("query:contact:a", "y")
+    backend.set("query:acc%unt_:c", 1)
+    backend.set("short", 1, ttl=0.01)
+
+    assert backend.get("query:account:a") == {"records": [1, 2]}
+    assert "query:account:b" in backend
+    assert backend.get("missing", "default") == "default"
+    time.sleep(0.02)
+    assert backend.get("short") is None
+
+    assert backend.delete_prefix("query:account:") == 2
+    assert backend.get("query:contact:a") == "y"
+    assert backend.get("query:acc%unt_:c") == 1
+    backend.delete("query:contact:a")
+    assert "query:contact:a" not in backend
+    backend.clear()
+    assert backend.get("query:acc%unt_:c") is None
+
+
+def test_scoped_cache_isolated(backend: CacheBackend) -> None:
+    """Test that views of one backend do not see or clear each other."""
+    describes = ScopedCache(backend, "prod:describe:", ttl=60)
+    other_org = ScopedCache(backend, "sandbox:describe:")
+    describes.set("describe:account", {"name": "Account"})
+    other_org.set("describe:account", {"name": "Other"})
+
+    describes.clear()
+
+    assert describes.get("describe:account") is None
+    assert other_org.get("describe:account") == {"name": "Other"}
+
+
+def test_sqlite_cache_bounded_and_shared(tmp_path: Path) -> None:
+    """Test eviction of the oldest entries and sharing through the file."""
+    path = str(tmp_path / "cache.db")
+    first = SQLiteCache(path, maxsize=10)
+    for index in range(105):
+        first.set(f"key{index}", index)
+    second = SQLiteCache(path)
+
+    assert second.get("key104") == 104
+    assert second.get("key0") is None
+    first.close()
+    second.close()
+
+
+def _make_tool(backend: CacheBackend, **kwargs: Any) -> SalesforceTool:
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.Account = MagicMock(spec=SFType)
+    mock_sf.Account.describe.return_value = {"name": "Account", "fields": []}
+    mock_sf.query.return_value = {
+        "totalSize": 1,
+        "done": True,
+        "records": [{"attributes": {"type": "Account"}, "Id": _ID, "Name": "A"}],
+    }
+    return SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        cache_backend=backend,
+        **{"query_cache_ttl": 60, "record_cache_ttl": 60, **kwargs},
+    )
+
+
+def test_tools_share_warm_caches() -> None:
+    """Test that tools on one backend reuse each other's cached data."""
+    backend = RedisCache(FakeRedis())
+    first, second = _make_tool(backend), _make_tool(backend)
+    query = {"operation": "query", "query": "SELECT Id, Name FROM Account"}
+
+    first.invoke({"operation": "describe", "object_name": "Account"})
+    first.invoke(query)
+    assert second.invoke({"operation": "describe", "object_name": "Account"}) == {
+        "name": "Account",
+        "fields": [],
+    }
+    assert second.invoke(query)["totalSize"] == 1
+    assert second.invoke(
+        {
+            "operation": "get_record",
+            "object_name": "Account",
+            "record_id": _ID,
+            "fields": ["Name"],
+        }
+    ) == {"Id": _ID, "Name": "A"}
+
+    second_sf = cast(MagicMock, second._sf)
+    second_sf.Account.describe.assert_not_called()
+    second_sf.Account.get.assert_not_called()
+    second_sf.query.assert_not_called()
+    keys: List[str] = list(cast(FakeRedis, backend.client).data)
+    assert all(key.startswith("langchain_salesforce:salesforce:") for key in keys)
+
+
+def test_writes_invalidate_without_scanning() -> None:
+    """Test that writes drop cached queries everywhere without key scans."""
+    backend = RedisCache(FakeRedis())
+    first, second = _make_tool(backend), _make_tool(backend)
+    query = {"operation": "query", "query": "SELECT Id, Name FROM Account"}
+    first.invoke(query)
+    client = cast(FakeRedis, backend.client)
+    client.scan_iter = MagicMock(side_effect=AssertionError("scanned"))  # type: ignore[method-assign]
+
+    first.invoke(
+        {
+            "operation": "update",
+            "object_name": "Account",
+            "record_id": _ID,
+            "record_data": {"Name": "B"},
+        }
+    )
+    second.invoke(query)
+
+    cast(MagicMock, second._sf).query.assert_called_once()
+
+
+def test_writes_skip_disabled_query_cache() -> None:
+    """Test that writes do not touch the backend when queries are not cached."""
+    backend = MagicMock(spec=CacheBackend, wraps=TTLCache())
+    tool = _make_tool(
+        backend, query_cache_ttl=0, search_cache_ttl=0, record_cache_ttl=0
+    )
+
+    tool.invoke(
+        {
+            "operation": "update",
+            "object_name": "Account",
+            "record_id": _ID,
+            "record_data": {"Name": "B"},
+        }
+    )
+
+    backend.delete.assert_not_called()
+    backend.delete_prefix.assert_not_called()
@@ -0,0 +1,146 @@
+"""Unit tests for parallel query extraction."""
+
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, cast
+from unittest.mock import MagicMock
+
+import pytest
+from simple_salesforce import Salesforce
+from simple_salesforce.api import SFType
+
+from langchain_salesforce.extract import QueryExtractor, flatten_record, process_page
+from langchain_salesforce.tools import SalesforceTool
+
+_QUERY = "SELECT Id, Name, CreatedDate, Owner.Name FROM Account"
+
+
+def _record(index: int) -> Dict[str, Any]:
+    return {
+        "attributes": {"type": "Account"},
+        "Id": f"001{index:015d}",
+        "Name": f"Account {index}",
+        "CreatedDate": "2024-01-15T10:30:00.000+0000",
+        "Owner": {"attributes": {"type": "User"}, "Name": "Ann"} if index else None,
+    }
+
+
+@pytest.fixture
+def tool() -> SalesforceTool:
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.query.return_value = {
+        "done": False,
+        "nextRecordsUrl": "/query/01g-2",
+        "records": [_record(0), _record(1)],
+    }
+    mock_sf.query_more.side_effect = [
+        {"done": False, "nextRecordsUrl": "/query/01g-4", "records": [_record(2)]},
+        {"done": True, "records": [_record(3)]},
+    ]
+    mock_sf.Account = MagicMock(spec=SFType)
+    mock_sf.Account.describe.return_value = {
+        "fields": [
+            {"name": "Name", "type": "string"},
+            {"name": "CreatedDate", "type": "datetime"},
+        ]
+    }
+    return SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+    )
+
+
+def test_flatten_record() -> None:
+    """Test that parents are flattened and children kept as lists."""
+    record = {
+        "attributes": {"type": "Account"},
+        "Name": "Acme",
+        "Owner": {"attributes": {}, "Manager": {"attributes": {}, "Name": "Bo"}},
+        "Contacts": {"records": [{"attributes": {}, "LastName": "Li"}]},
+    }
+
+    assert flatten_record(record) == {
+        "Name": "Acme",
+        "Owner.Manager.Name": "Bo",
+        "Contacts": [{"LastName": "Li"}],
+    }
+
+
+def test_process_page_coerces_types() -> None:
+    """Test type coercion and JSON Lines output."""
+    count, rows = process_page(
+        [{"Day": "2024-01-15", "Amount": 5, "Count": 2.0}],
+        field_types={"day": "date", "amount": "currency", "count": "int"},
+    )
+
+    assert count == 1
+    assert rows == [{"Day": date(2024, 1, 15), "Amount": 5.0, "Count": 2}]
+    _, text = process_page(rows, output="jsonl")
+    assert json.loads(text) == {"Day": "2024-01-15", "Amount": 5.0, "Count": 2}
+
+
+def test_extract_streams_pages_in_order(tool: SalesforceTool) -> None:
+    """Test that pages come back in order with coerced values."""
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        extractor = QueryExtractor(tool, coerce_types=True, executor=executor)
+        pages = list(extractor.extract(_QUERY))
+
+    assert [[row["Id"][-1] for row in page] for page in pages] == [
+        ["0", "1"],
+        ["2"],
+        ["3"],
+    ]
+    assert pages[0][1]["Owner.Name"] == "Ann"
+    assert pages[0][1]["CreatedDate"] == datetime(
+        2024, 1, 15, 10, 30, tzinfo=timezone.utc
+    )
+
+
+def test_write_csv_in_worker_processes(tool: SalesforceTool) -> None:
+    """Test CSV output produced by a real process pool."""
+    file = io.StringIO()
+
+    count = QueryExtractor(tool, output="csv", processes=2).write(_QUERY, file)
+
+    lines = file.getvalue().splitlines()
+    assert count == 4
+    assert lines[0] == "Id,Name,CreatedDate,Owner.Name"
+    assert lines[1].endswith(",Account 0,2024-01-15T10:30:00.000+0000,")
+    assert lines[4].endswith(",Account 3,2024-01-15T10:30:00.000+0000,Ann")
+
+
+def test_extract_propagates_errors_and_stops(tool: SalesforceTool) -> None:
+    """Test fetch errors reach the consumer and early close stops fetching."""
+    mock_sf = cast(MagicMock, tool._sf)
+    mock_sf.query_more.side_effect = RuntimeError("connection reset")
+    extractor = QueryExtractor(tool, processes=0)
+
+    pages = extractor.extract(_QUERY)
+    assert len(next(pages)) == 2
+    with pytest.raises(RuntimeError, match="connection reset"):
+        next(pages)
+
+    mock_sf.query_more.side_effect = None
+    mock_sf.query_more.return_value = {
+        "done": False,
+        "nextRecordsUrl": "/query/01g-next",
+        "records": [_record(9)],
+    }
+    pages = QueryExtractor(tool, processes=0, max_pending_pages=1).extract(_QUERY)
+    first: List[Any] = next(pages)
+    pages.close()
+    assert len(first) == 2
+    assert not any(t.name == "salesforce-extract" for t in threading.enumerate())
+
+
+def test_invalid_arguments(tool: SalesforceTool) -> None:
+    """Test argument validation."""
+    with pytest.raises(ValueError, match="Unsupported output"):
+        QueryExtractor(tool, output="xml")
+    with pytest.raises(ValueError, match="requires output"):
+        QueryExtractor(tool, processes=0).write(_QUERY, io.StringIO())
@@ -0,0 +1,165 @@
+"""Unit tests for per-call deadlines and hedged reads."""
+
+import threading
+import time
+from typing import Any, Dict, List, cast
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests.exceptions import ReadTimeout
+from simple_salesforce import Salesforce
+
+from langchain_salesforce.hedging import (
+    DeadlineExceededError,
+    HedgedCaller,
+    deadline_scope,
+    remaining_time,
+    request_timeout,
+)
+from langchain_salesforce.tools import SalesforceTool
+
+_PAGE: Dict[str, Any] = {"totalSize": 0, "done": True, "records": []}
+
+
+def _times_out(*args: Any, **kwargs: Any) -> Any:
+    """Stand in for an HTTP call that gets no answer before its timeout."""
+    time.sleep(cast(float, request_timeout(5)))
+    raise ReadTimeout("read timed out")
+
+
+def _first_call_times_out(result: Any) -> Any:
+    """Return a function whose first call times out at the deadline."""
+    calls: List[int] = []
+    lock = threading.Lock()
+
+    def call(*args: Any, **kwargs: Any) -> Any:
+        with lock:
+            calls.append(1)
+            first = len(calls) == 1
+        return _times_out() if first else result
+
+    return call
+
+
+def test_deadline_scope() -> None:
+    """Test that nested scopes can only shorten the deadline."""
+    assert remaining_time() is None
+    with deadline_scope(10) as outer:
+        with deadline_scope(60) as inner:
+            assert inner == outer
+        with deadline_scope(None) as same:
+            assert same == outer
+        with deadline_scope(0):
+            with pytest.raises(DeadlineExceededError):
+                remaining_time()
+        assert 0 < cast(float, remaining_time()) <= 10
+    assert remaining_time() is None
+
+
+def test_calls_run_on_caller_thread() -> None:
+    """Test that calls run inline, without the hedging pool, under a deadline."""
+    caller = HedgedCaller()
+    with deadline_scope(10):
+        assert caller.call("query", threading.get_ident) == threading.get_ident()
+        assert caller.call("query", request_timeout) <= 10
+    assert request_timeout() is None
+    assert caller._executor is None
+
+
+def test_slow_call_is_hedged() -> None:
+    """Test that a duplicate is sent after the quantile delay and used."""
+    caller = HedgedCaller(quantile=0.5, min_samples=3)
+    for _ in range(3):
+        assert caller.call("query", lambda: "fast", hedge=True) == "fast"
+
+    with deadline_scope(0.2):
+        result = caller.call("query", _first_call_times_out("hedge"), True)
+
+    assert result == "hedge"
+    metrics = caller.metrics()
+    assert (metrics["hedged"], metrics["hedge_wins"]) == (1, 1)
+    assert metrics["hedge_delays"]["query"] is not None
+    caller.shutdown()
+
+
+def test_deadline_abandons_slow_call() -> None:
+    """Test that a call timing out at the deadline raises DeadlineExceededError."""
+    caller = HedgedCaller()
+    start = time.monotonic()
+    with deadline_scope(0.05):
+        with pytest.raises(DeadlineExceededError, match="query"):
+            caller.call("query", _times_out)
+
+    assert time.monotonic() - start < 1
+    assert caller.metrics()["deadline_exceeded"] == 1
+    caller.shutdown()
+
+
+def test_failed_attempt_waits_for_other() -> None:
+    """Test that a failed attempt does not hide a successful hedge."""
+    caller = HedgedCaller(quantile=0.5, min_samples=1)
+    caller.call("describe", lambda: None, hedge=True)
+    attempts: List[int] = []
+
+    def flaky() -> str:
+        attempts.append(1)
+        if len(attempts) == 1:
+            time.sleep(0.05)
+            raise ConnectionError("reset")
+        time.sleep(0.1)
+        return "ok"
+
+    assert caller.call("describe", flaky, hedge=True) == "ok"
+    caller.shutdown()
+
+
+def _make_tool(**kwargs: Any) -> SalesforceTool:
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.query.return_value = _PAGE
+    return SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        **kwargs,
+    )
+
+
+def test_tool_deadline_from_config() -> None:
+    """Test that salesforce_timeout in the run config bounds a call."""
+    tool = _make_tool()
+    cast(MagicMock, tool._sf).query.side_effect = _times_out
+
+    with pytest.raises(DeadlineExceededError):
+        tool.invoke(
+            {"operation": "query", "query": "SELECT Id FROM Account"},
+            config={"configurable": {"salesforce_timeout": 0.05}},
+        )
+
+    tool = _make_tool(operation_timeout=0)
+    with pytest.raises(DeadlineExceededError):
+        tool.invoke({"operation": "list_objects"})
+    cast(MagicMock, tool._sf).describe.assert_not_called()
+
+
+async def test_tool_hedges_reads() -> None:
+    """Test that slow queries are hedged, over a session of their own."""
+    tool = _make_tool(hedge_reads=True, hedge_quantile=0.5, hedge_min_samples=1)
+    query = {"operation": "query", "query": "SELECT Id FROM Account"}
+    tool.invoke(query)
+    mock_sf = cast(MagicMock, tool._sf)
+    mock_sf.query.side_effect = _times_out
+    mock_sf.session_id = "session"
+    mock_sf.sf_instance = "example.my.salesforce.com"
+    mock_sf.sf_version = "59.0"
+    hedge_sf = MagicMock(spec=Salesforce)
+    hedge_sf.query.return_value = _PAGE
+
+    config: Any = {"configurable": {"salesforce_timeout": 0.5}}
+    with patch("simple_salesforce.Salesforce", return_value=hedge_sf) as clone:
+        assert await tool.ainvoke(query, config=config) == _PAGE
+
+    assert clone.call_args.kwargs["session_id"] == "session"
+    hedge_sf.query.assert_called_once_with("SELECT Id FROM Account")
+    hedging = tool.resilience_metrics()["hedging"]
+    assert (hedging["hedged"], hedging["hedge_wins"]) == (1, 1)
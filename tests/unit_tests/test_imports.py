@@ -0,0 +1,64 @@
+"""Unit tests for the package's import-time behavior."""
+
+import subprocess
+import sys
+
+import pytest
+
+import langchain_salesforce
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+def test_package_import_is_lazy() -> None:
+    """Test that importing the package loads none of its dependencies."""
+    loaded = _run(
+        "import sys, langchain_salesforce; "
+        "print(sorted(m for m in ('langchain_core', 'requests', "
+        "'simple_salesforce', 'langchain_salesforce.tools') if m in sys.modules))"
+    )
+
+    assert loaded == "[]"
+
+
+def test_tool_import_defers_simple_salesforce() -> None:
+    """Test that simple_salesforce is only imported on first login."""
+    loaded = _run(
+        "import sys; from langchain_salesforce import SalesforceTool; "
+        "print('simple_salesforce' in sys.modules)"
+    )
+
+    assert loaded == "False"
+
+
+def test_tool_import_defers_heavy_modules() -> None:
+    """Test that process pools and profilers are not imported with the tool."""
+    # langchain-core (through langsmith) may load multiprocessing itself, so
+    # only the modules the package adds on top of it count
+    loaded = _run(
+        "import sys, langchain_core.callbacks, langchain_core.runnables.config, "
+        "langchain_core.tools.base; before = set(sys.modules); "
+        "import langchain_salesforce.tools; "
+        "print(sorted(m for m in ('multiprocessing', 'concurrent.futures.process', "
+        "'cProfile', 'pstats') if m in set(sys.modules) - before))"
+    )
+
+    assert loaded == "[]"
+
+
+def test_lazy_attributes() -> None:
+    """Test attribute resolution of the lazily imported names."""
+    from langchain_salesforce.tools import SalesforceTool
+
+    assert langchain_salesforce.SalesforceTool is SalesforceTool
+    assert set(langchain_salesforce.__all__) <= set(dir(langchain_salesforce))
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        langchain_salesforce.Missing
@@ -0,0 +1,267 @@
+"""Unit tests for the SQLite mirror."""
+
+from typing import Any, Dict, List, Tuple, cast
+from unittest.mock import MagicMock
+
+import pytest
+from simple_salesforce import Salesforce
+from simple_salesforce.api import SFType
+
+from langchain_salesforce.mirror import SQLiteMirror
+from langchain_salesforce.tools import SalesforceTool
+
+ACCOUNT_FIELDS = [
+    {"name": "Id", "type": "id"},
+    {"name": "IsDeleted", "type": "boolean"},
+    {"name": "SystemModstamp", "type": "datetime"},
+    {"name": "Name", "type": "string"},
+    {"name": "Industry", "type": "picklist"},
+    {"name": "NumberOfEmployees", "type": "int"},
+    {"name": "IsPartner", "type": "boolean"},
+]
+
+
+def _account(
+    record_id: str,
+    name: str,
+    industry: Any,
+    employees: Any,
+    is_partner: bool = False,
+    modstamp: str = "2024-01-01T00:00:00.000+0000",
+    is_deleted: bool = False,
+) -> Dict[str, Any]:
+    return {
+        "attributes": {"type": "Account"},
+        "Id": record_id,
+        "IsDeleted": is_deleted,
+        "SystemModstamp": modstamp,
+        "Name": name,
+        "Industry": industry,
+        "NumberOfEmployees": employees,
+        "IsPartner": is_partner,
+    }
+
+
+def _make_mirror(
+    records: List[Dict[str, Any]],
+) -> Tuple[SQLiteMirror, SalesforceTool, MagicMock]:
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.sf_version = "59.0"
+    mock_sf.query = MagicMock(return_value={"done": True, "records": records})
+    mock_account = MagicMock(spec=SFType)
+    mock_account.describe = MagicMock(return_value={"fields": ACCOUNT_FIELDS})
+    mock_sf.Account = mock_account
+    tool = SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+    )
+    mirror = SQLiteMirror(
+        tool, {"Account": ["Name", "Industry", "NumberOfEmployees", "IsPartner"]}
+    )
+    mirror.refresh()
+    tool.attach_mirror(mirror)
+    mock_sf.query.reset_mock()
+    mock_sf.query.return_value = {"done": True, "records": [{"Id": "remote"}]}
+    return mirror, tool, mock_sf
+
+
+@pytest.fixture
+def mirrored() -> Tuple[SQLiteMirror, SalesforceTool, MagicMock]:
+    return _make_mirror(
+        [
+            _account("001000000000000AAA", "Acme", "Tech", 50, is_partner=True),
+            _account("001000000000001AAA", "Globex", "Energy", 500),
+            _account("001000000000002AAA", "initech", None, None),
+        ]
+    )
+
+
+def _names(result: Dict[str, Any]) -> List[str]:
+    return [record["Name"] for record in result["records"]]
+
+
+def test_query_answered_locally(
+    mirrored: Tuple[SQLiteMirror, SalesforceTool, MagicMock],
+) -> None:
+    """Test that simple queries are served without calling Salesforce."""
+    _, tool, mock_sf = mirrored
+
+    result = cast(
+        Dict[str, Any],
+        tool._run(
+            operation="query",
+            query="SELECT Id, Name, IsPartner FROM Account WHERE name = 'ACME'",
+        ),
+    )
+
+    assert mock_sf.query.call_count == 0
+    assert result["totalSize"] == 1
+    assert result["records"][0] == {
+        "attributes": {
+            "type": "Account",
+            "url": "/services/data/v59.0/sobjects/Account/001000000000000AAA",
+        },
+        "Id": "001000000000000AAA",
+        "Name": "Acme",
+        "IsPartner": True,
+    }
+
+
+@pytest.mark.parametrize(
+    "where,expected",
+    [
+        ("Industry != 'Tech'", ["Globex", "initech"]),
+        ("Industry = null", ["initech"]),
+        ("NumberOfEmployees > 10 AND IsPartner = false", ["Globex"]),
+        ("Industry IN ('Tech', 'Energy')", ["Acme", "Globex"]),
+        ("Industry NOT IN ('Tech')", ["Globex", "initech"]),
+        ("NOT Industry = 'Tech'", ["Globex", "initech"]),
+        ("Name LIKE '%e%'", ["Acme", "Globex", "initech"]),
+    ],
+)
+def test_where_matches_soql_semantics(
+    mirrored: Tuple[SQLiteMirror, SalesforceTool, MagicMock],
+    where: str,
+    expected: List[str],
+) -> None:
+    """Test null and case handling of translated WHERE conditions."""
+    mirror, _, _ = mirrored
+
+    result = mirror.query(f"SELECT Name FROM Account WHERE {where} ORDER BY Name")
+
+    assert result is not None
+    assert _names(result) == expected
+
+
+def test_order_by_and_limit(
+    mirrored: Tuple[SQLiteMirror, SalesforceTool, MagicMock],
+) -> None:
+    """Test ORDER BY null placement, LIMIT and OFFSET."""
+    mirror, _, _ = mirrored
+
+    desc = mirror.query("SELECT Name FROM Account ORDER BY NumberOfEmployees DESC")
+    asc = mirror.query(
+        "SELECT Name FROM Account ORDER BY NumberOfEmployees ASC NULLS LAST "
+        "LIMIT 2 OFFSET 1"
+    )
+
+    assert desc is not None and _names(desc) == ["Globex", "Acme", "initech"]
+    assert asc is not None and _names(asc) == ["Globex", "initech"]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT Id, Owner.Name FROM Account",
+        "SELECT Id, Phone FROM Account",
+        "SELECT COUNT(Id) FROM Account",
+        "SELECT Id FROM Account WHERE SystemModstamp > LAST_N_DAYS:5",
+        "SELECT Id FROM Contact",
+        "SELECT Id FROM Account WHERE Id = '001000000000000'",
+        "SELECT Name n FROM Account",
+    ],
+)
+def test_unsupported_queries_fall_back(
+    mirrored: Tuple[SQLiteMirror, SalesforceTool, MagicMock], query: str
+) -> None:
+    """Test that queries outside the mirror go to the API."""
+    _, tool, mock_sf = mirrored
+
+    result = tool._run(operation="query", query=query)
+
+    assert result == {"done": True, "records": [{"Id": "remote"}]}
+    assert mock_sf.query.call_count == 1
+
+
+def test_stale_mirror_falls_back(
+    mirrored: Tuple[SQLiteMirror, SalesforceTool, MagicMock],
+) -> None:
+    """Test that an object past max_staleness is not served locally."""
+    mirror, tool, mock_sf = mirrored
+    mirror.invalidate("Account")
+
+    tool._run(operation="query", query="SELECT Id FROM Account")
+
+    assert mock_sf.query.call_count == 1
+
+
+def test_writes_mark_mirror_stale(
+    mirrored: Tuple[SQLiteMirror, SalesforceTool, MagicMock],
+) -> None:
+    """Test that a write through the tool is never hidden by the mirror."""
+    mirror, tool, mock_sf = mirrored
+    mock_sf.Account.update.return_value = 204
+    mock_sf.query.return_value = {
+        "done": True,
+        "records": [{"Id": "001000000000000AAA", "Name": "Acme Corp"}],
+    }
+    query = "SELECT Id, Name FROM Account WHERE Id = '001000000000000AAA'"
+
+    tool._run(
+        operation="update",
+        object_name="Account",
+        record_id="001000000000000AAA",
+        record_data={"Name": "Acme Corp"},
+    )
+    result = cast(Dict[str, Any], tool._run(operation="query", query=query))
+
+    assert _names(result) == ["Acme Corp"]
+    assert mock_sf.query.call_count == 1
+    assert not mirror.is_fresh("Account")
+
+    mock_sf.query.return_value = {"done": True, "records": []}
+    mirror.refresh()
+    assert mirror.is_fresh("Account")
+    mirror.invalidate("account")
+    assert not mirror.is_fresh("Account")
+
+
+def test_refresh_applies_deltas(
+    mirrored: Tuple[SQLiteMirror, SalesforceTool, MagicMock],
+) -> None:
+    """Test that a refresh upserts changed rows and removes deleted ones."""
+    mirror, _, mock_sf = mirrored
+    mock_sf.query.return_value = {
+        "done": True,
+        "records": [
+            _account(
+                "001000000000001AAA",
+                "Globex Corp",
+                "Energy",
+                600,
+                modstamp="2024-01-02T00:00:00.000+0000",
+            ),
+            _account(
+                "001000000000002AAA",
+                "initech",
+                None,
+                None,
+                modstamp="2024-01-03T00:00:00.000+0000",
+                is_deleted=True,
+            ),
+        ],
+    }
+
+    results = mirror.refresh()
+
+    assert (
+        "SystemModstamp >= 2023-12-31T23:59:00.000Z" in (mock_sf.query.call_args[0][0])
+    )
+    assert results["Account"].deleted_ids == ["001000000000002AAA"]
+    local = mirror.query("SELECT Name, SystemModstamp FROM Account ORDER BY Name")
+    assert local is not None
+    assert _names(local) == ["Acme", "Globex Corp"]
+    assert local["records"][1]["SystemModstamp"] == "2024-01-02T00:00:00.000+0000"
+
+
+def test_invalid_mirror_configuration() -> None:
+    """Test that relationship fields and unknown fields are rejected."""
+    _, tool, _ = _make_mirror([])
+    with pytest.raises(ValueError, match="Only plain field names"):
+        SQLiteMirror(tool, {"Account": ["Owner.Name"]})
+
+    mirror = SQLiteMirror(tool, {"Account": ["Phone"]})
+    with pytest.raises(ValueError, match="Field 'Phone' not found"):
+        mirror.refresh()
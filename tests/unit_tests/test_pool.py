@@ -0,0 +1,200 @@
+"""Unit tests for the multi-org tool pool."""
+
+import threading
+from pathlib import Path
+from typing import Any, List, Tuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import Session
+from simple_salesforce import Salesforce
+
+from langchain_salesforce.cache_backends import SQLiteCache
+from langchain_salesforce.pool import SalesforceToolPool, TokenBucket
+from langchain_salesforce.tools import SalesforceTool
+
+
+def _make_tool(org: str) -> Tuple[SalesforceTool, MagicMock]:
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.describe = MagicMock(return_value={"sobjects": [{"name": org}]})
+    mock_sf.query = MagicMock(return_value={"records": [], "org": org})
+    tool = SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+    )
+    return tool, mock_sf
+
+
+@pytest.fixture
+def pool() -> SalesforceToolPool:
+    prod, _ = _make_tool("prod")
+    sandbox, _ = _make_tool("sandbox")
+    return SalesforceToolPool({"prod": prod, "sandbox": sandbox}, default_org="prod")
+
+
+def test_routes_by_input_config_and_default(pool: SalesforceToolPool) -> None:
+    """Test the order in which the target org is resolved."""
+    query = {"operation": "query", "query": "SELECT Id FROM Account"}
+
+    assert pool.invoke({**query, "org": "sandbox"})["org"] == "sandbox"
+    config: Any = {"configurable": {"salesforce_org": "sandbox"}}
+    assert pool.invoke(query, config=config)["org"] == "sandbox"
+    assert pool.invoke({**query, "org": "prod"}, config=config)["org"] == "prod"
+    assert pool.invoke(query)["org"] == "prod"
+
+
+def test_unknown_or_missing_org(pool: SalesforceToolPool) -> None:
+    """Test errors for orgs that cannot be resolved."""
+    with pytest.raises(ValueError, match="Unknown Salesforce org: 'staging'"):
+        pool.invoke({"operation": "list_objects", "org": "staging"})
+
+    pool.default_org = None
+    with pytest.raises(ValueError, match="No Salesforce org given"):
+        pool.invoke({"operation": "list_objects"})
+
+
+def test_orgs_have_separate_caches(pool: SalesforceToolPool) -> None:
+    """Test that cached describes are never shared between orgs."""
+    assert pool.invoke({"operation": "list_objects"}) == [{"name": "prod"}]
+    assert pool.invoke({"operation": "list_objects", "org": "sandbox"}) == [
+        {"name": "sandbox"}
+    ]
+
+
+def test_tools_created_lazily_and_reused() -> None:
+    """Test that factories and settings are only used on first access."""
+    factory = MagicMock(side_effect=lambda: _make_tool("factory")[0])
+    _, mock_sf = _make_tool("settings")
+    pool = SalesforceToolPool(
+        {
+            "factory": factory,
+            "settings": {
+                "username": "u",
+                "password": "p",
+                "security_token": "t",
+                "salesforce_client": mock_sf,
+            },
+        }
+    )
+    assert factory.call_count == 0
+    assert pool.orgs == ["factory", "settings"]
+
+    assert pool.get_tool("factory") is pool.get_tool("factory")
+    assert factory.call_count == 1
+    assert pool.get_tool("settings")._sf is mock_sf
+
+    with pytest.raises(ValueError, match="already registered"):
+        pool.add_org("factory", factory)
+    pool.remove_org("factory")
+    assert pool.orgs == ["settings"]
+
+
+def test_orgs_built_from_settings_share_backend_safely(tmp_path: Path) -> None:
+    """Test that orgs on one cache backend get their own namespaces."""
+    backend = SQLiteCache(str(tmp_path / "cache.db"))
+
+    def settings(org: str, **extra: Any) -> Any:
+        return {
+            "username": "u",
+            "password": "p",
+            "security_token": "t",
+            "salesforce_client": _make_tool(org)[1],
+            "cache_backend": backend,
+            **extra,
+        }
+
+    pool = SalesforceToolPool(
+        {
+            "prod": settings("prod"),
+            "sandbox": settings("sandbox"),
+            "custom": settings("custom", cache_namespace="shared"),
+        }
+    )
+
+    assert pool.invoke({"operation": "list_objects", "org": "prod"}) == [
+        {"name": "prod"}
+    ]
+    assert pool.invoke({"operation": "list_objects", "org": "sandbox"}) == [
+        {"name": "sandbox"}
+    ]
+    assert pool.get_tool("prod").cache_namespace == "prod"
+    assert pool.get_tool("custom").cache_namespace == "shared"
+
+
+def test_lazy_orgs_sized_without_logging_in() -> None:
+    """Test that max_concurrency sizes the connection pool at first login."""
+    settings = {"username": "u", "password": "p", "security_token": "t"}
+    pool = SalesforceToolPool(
+        {"lazy": {**settings, "auth_mode": "lazy"}}, max_concurrency=8
+    )
+
+    with patch("simple_salesforce.Salesforce") as login:
+        tool = pool.get_tool("lazy")
+    login.assert_not_called()
+    assert tool.connection_pool_size == 8
+
+    client = MagicMock(spec=Salesforce)
+    client.session = Session()
+    tool._configure_session(client)
+    assert (
+        client.session.get_adapter("https://").poolmanager.connection_pool_kw["maxsize"]
+        == 8
+    )
+
+
+def test_token_bucket() -> None:
+    """Test refill, burst capacity and timeouts of the rate limiter."""
+    now = [0.0]
+    sleeps: List[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2, burst=2, clock=lambda: now[0], sleep=sleep)
+
+    assert bucket.acquire() and bucket.acquire()
+    assert bucket.try_acquire() == pytest.approx(0.5)
+    assert not bucket.acquire(timeout=0.1)
+    assert bucket.acquire(timeout=1)
+    assert sleeps == [pytest.approx(0.5)]
+
+
+def test_concurrency_limit_isolated_per_org() -> None:
+    """Test that a saturated org does not block operations on another org."""
+    busy, busy_sf = _make_tool("busy")
+    quiet, _ = _make_tool("quiet")
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_query(*args: Any, **kwargs: Any) -> Any:
+        started.set()
+        release.wait(5)
+        return {"records": []}
+
+    busy_sf.query = MagicMock(side_effect=slow_query)
+    pool = SalesforceToolPool(
+        {"busy": busy, "quiet": quiet}, max_concurrency=1, acquire_timeout=0.05
+    )
+    query = {"operation": "query", "query": "SELECT Id FROM Account"}
+    worker = threading.Thread(target=pool.invoke, args=({**query, "org": "busy"},))
+    worker.start()
+    try:
+        assert started.wait(5)
+        with pytest.raises(TimeoutError, match="'busy' is at maximum concurrency"):
+            pool.invoke({**query, "org": "busy"})
+        assert pool.invoke({**query, "org": "quiet"})["org"] == "quiet"
+    finally:
+        release.set()
+        worker.join(5)
+
+
+async def test_ainvoke_routes_by_config(pool: SalesforceToolPool) -> None:
+    """Test async routing through the run config."""
+    config: Any = {"configurable": {"salesforce_org": "sandbox"}}
+
+    result = await pool.ainvoke({"operation": "list_objects"}, config=config)
+
+    assert result == [{"name": "sandbox"}]
@@ -0,0 +1,107 @@
+"""Unit tests for call profiling."""
+
+import json
+from datetime import timedelta
+from pathlib import Path
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from simple_salesforce import Salesforce
+
+from langchain_salesforce.profiling import (
+    Profiler,
+    Span,
+    current_span,
+    span,
+    trace_responses,
+)
+from langchain_salesforce.tools import SalesforceTool
+
+
+def _tool(profiler: Profiler) -> SalesforceTool:
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.query.return_value = {"totalSize": 0, "done": True, "records": []}
+    return SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        profiler=profiler,
+    )
+
+
+def _names(parent: Span) -> List[str]:
+    return [child.name for child in parent.children]
+
+
+def test_span_is_noop_outside_calls() -> None:
+    """Test that spans record nothing without a profiled call."""
+    with span("phase") as opened:
+        assert opened is None
+        assert current_span() is None
+
+
+def test_tool_call_span_tree() -> None:
+    """Test the spans recorded for a tool call, including failures."""
+    profiler = Profiler()
+    tool = _tool(profiler)
+
+    tool.invoke({"operation": "query", "query": "SELECT Id FROM Account"})
+    with pytest.raises(ValueError):
+        tool.invoke({"operation": "describe"})
+
+    ok, failed = profiler.traces()
+    assert ok.root.name == "invoke"
+    assert _names(ok.root) == ["parse_input", "run"]
+    run = ok.root.children[1]
+    assert run.attributes == {"operation": "query"}
+    assert _names(run) == ["validate_params", "execute"]
+    assert _names(run.children[1]) == ["http"]
+    assert run.children[1].children[0].attributes == {"kind": "query"}
+    assert failed.root.attributes["error"] == "ValueError"
+    assert failed.root.children[1].children[0].attributes["error"] == "ValueError"
+    assert profiler.traces(slow_only=True) == []
+
+
+def test_slow_calls_sampled(tmp_path: Path) -> None:
+    """Test cProfile sampling and the Chrome trace export."""
+    profiler = Profiler(slow_threshold=0.0, max_traces=1, output_dir=str(tmp_path))
+    tool = _tool(profiler)
+
+    tool.invoke({"operation": "query", "query": "SELECT Id FROM Account"})
+    tool.invoke({"operation": "query", "query": "SELECT Name FROM Account"})
+
+    (trace,) = profiler.traces(slow_only=True)
+    assert trace.profile is not None and "function calls" in trace.profile
+    assert trace.profile_path is not None and Path(trace.profile_path).exists()
+    count = profiler.export_chrome_trace(str(tmp_path / "trace.json"))
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert count == len(events) == 6
+    assert events[0]["name"] == "invoke" and events[0]["ph"] == "X"
+    assert events[0]["ts"] == 0
+    assert all(event["dur"] >= 0 for event in events)
+
+
+def test_response_hook_splits_http_span() -> None:
+    """Test that responses record their wait and JSON decoding."""
+    session = requests.Session()
+    trace_responses(session)
+    trace_responses(session)
+    (hook,) = session.hooks["response"]
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{"done": true}'
+    response.elapsed = timedelta(milliseconds=5)
+    response.request = requests.Request("GET", "https://example.com").prepare()
+
+    profiler = Profiler()
+    with profiler.call("call"), span("http") as http:
+        assert hook(response) is response
+        assert response.json() == {"done": True}
+
+    assert http is not None
+    assert _names(http) == ["http_wait", "json_decode"]
+    assert http.children[0].attributes == {"method": "GET", "status": 200}
+    assert http.children[1].attributes == {"bytes": 14}
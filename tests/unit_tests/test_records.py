@@ -0,0 +1,156 @@
+"""Unit tests for the record cache and the get_record operation."""
+
+import time
+from typing import Any, Dict, cast
+from unittest.mock import MagicMock
+
+import pytest
+from simple_salesforce import Salesforce
+from simple_salesforce.api import SFType
+
+from langchain_salesforce.records import RecordCache, to_id18
+from langchain_salesforce.tools import SalesforceTool
+
+_ID = "001000000000001AAA"
+
+
+def _account(**fields: Any) -> Dict[str, Any]:
+    return {"attributes": {"type": "Account"}, "Id": _ID, **fields}
+
+
+@pytest.fixture
+def tool() -> SalesforceTool:
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.Account = MagicMock(spec=SFType)
+    return SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        record_cache_ttl=60,
+    )
+
+
+def _get_record(tool: SalesforceTool, **kwargs: Any) -> Any:
+    return tool.invoke(
+        {"operation": "get_record", "object_name": "Account", **kwargs},
+    )
+
+
+def test_to_id18() -> None:
+    """Test the 15 to 18 character record ID conversion."""
+    assert to_id18("001000000000001") == "001000000000001AAA"
+    assert to_id18("ABCDE0000000000") == "ABCDE00000000005AA"
+    assert to_id18(_ID) == _ID
+
+
+def test_cache_merges_and_expires_fields() -> None:
+    """Test per-field freshness, related records and invalidation."""
+    cache = RecordCache(ttl=0.05)
+    cache.remember(
+        [
+            _account(
+                Name="Acme",
+                Owner={"attributes": {"type": "User"}, "Id": "005A", "Name": "Ann"},
+                Contacts={"records": [{"attributes": {"type": "Contact"}, "Id": "3"}]},
+            ),
+            {"expr0": 4},
+        ]
+    )
+
+    assert cache.lookup("account", _ID[:15], ["name", "Industry"]) == (
+        {"Name": "Acme"},
+        ["Industry"],
+    )
+    assert cache.lookup("User", "005A", ["Name"]) == ({"Name": "Ann"}, [])
+    assert cache.lookup("Contact", "3", ["Id"]) == ({"Id": "3"}, [])
+    assert cache.lookup("Account", _ID, None) == ({}, None)
+
+    time.sleep(0.06)
+    cache.merge("Account", _ID, {"Industry": "Tech"})
+    assert cache.lookup("Account", _ID, ["Name", "Industry"]) == (
+        {"Industry": "Tech"},
+        ["Name"],
+    )
+    cache.merge("User", "005A", {"Name": "Ann"})
+    cache.invalidate("Account", [_ID])
+    assert cache.lookup("Account", _ID, ["Industry"]) == ({}, ["Industry"])
+    assert cache.lookup("User", "005A", ["Name"]) == ({"Name": "Ann"}, [])
+    cache.invalidate()
+    assert cache.lookup("User", "005A", ["Name"]) == ({}, ["Name"])
+
+
+def test_get_record_served_from_query_results(tool: SalesforceTool) -> None:
+    """Test that queried fields are reused and only missing ones fetched."""
+    mock_sf = cast(MagicMock, tool._sf)
+    mock_sf.query.return_value = {
+        "totalSize": 1,
+        "done": True,
+        "records": [_account(Name="Acme", Industry="Tech")],
+    }
+    tool.invoke({"operation": "query", "query": "SELECT Id, Name FROM Account"})
+
+    assert _get_record(tool, record_id=_ID, fields=["name", "Industry"]) == {
+        "Id": _ID,
+        "Name": "Acme",
+        "Industry": "Tech",
+    }
+    mock_get = cast(MagicMock, mock_sf.Account.get)
+    mock_get.assert_not_called()
+
+    mock_get.return_value = _account(Phone="555")
+    assert _get_record(tool, record_id=_ID[:15], fields=["Name", "Phone"]) == {
+        "Id": _ID,
+        "Name": "Acme",
+        "Phone": "555",
+    }
+    mock_get.assert_called_once_with(_ID[:15], params={"fields": "Phone"})
+
+
+def test_get_record_whole_record(tool: SalesforceTool) -> None:
+    """Test that a full record fetch is cached as complete."""
+    mock_get = cast(MagicMock, cast(MagicMock, tool._sf).Account.get)
+    mock_get.return_value = _account(Name="Acme", Phone="555")
+
+    assert _get_record(tool, record_id=_ID) == {
+        "Id": _ID,
+        "Name": "Acme",
+        "Phone": "555",
+    }
+    assert _get_record(tool, record_id=_ID)["Phone"] == "555"
+    mock_get.assert_called_once_with(_ID)
+
+    with pytest.raises(ValueError, match="Invalid field name"):
+        _get_record(tool, record_id=_ID, fields=["Name FROM User"])
+
+
+def test_writes_update_record_cache(tool: SalesforceTool) -> None:
+    """Test write-through on create and update and invalidation on delete."""
+    mock_account = cast(MagicMock, tool._sf).Account
+    mock_account.create.return_value = {"id": _ID, "success": True}
+    tool.invoke(
+        {
+            "operation": "create",
+            "object_name": "Account",
+            "record_data": {"Name": "Acme"},
+        }
+    )
+    tool.invoke(
+        {
+            "operation": "update",
+            "object_name": "Account",
+            "record_id": _ID,
+            "record_data": {"Phone": "555"},
+        }
+    )
+
+    assert _get_record(tool, record_id=_ID, fields=["Name", "Phone"]) == {
+        "Id": _ID,
+        "Name": "Acme",
+        "Phone": "555",
+    }
+    mock_account.get.assert_not_called()
+
+    tool.invoke({"operation": "delete", "object_name": "Account", "record_id": _ID})
+    mock_account.get.return_value = _account(Name="Other")
+    assert _get_record(tool, record_id=_ID, fields=["Name"])["Name"] == "Other"
@@ -0,0 +1,173 @@
+"""Unit tests for the relationship-aware query planner."""
+
+from typing import Any, Dict, List, cast
+from unittest.mock import MagicMock
+
+import pytest
+from simple_salesforce import Salesforce
+from simple_salesforce.api import SFType
+
+from langchain_salesforce import related
+from langchain_salesforce.related import plan_related_query
+from langchain_salesforce.tools import SalesforceTool
+
+_ACCOUNT: Dict[str, Any] = {
+    "fields": [
+        {"name": "Name", "type": "string"},
+        {
+            "name": "OwnerId",
+            "type": "reference",
+            "relationshipName": "Owner",
+            "referenceTo": ["User"],
+        },
+    ],
+    "childRelationships": [
+        {
+            "childSObject": "Contact",
+            "field": "AccountId",
+            "relationshipName": "Contacts",
+        },
+        {
+            "childSObject": "Opportunity",
+            "field": "AccountId",
+            "relationshipName": "Opportunities",
+        },
+        {
+            "childSObject": "AccountHistory",
+            "field": "AccountId",
+            "relationshipName": None,
+        },
+    ],
+}
+
+
+def _describe(object_name: str) -> Dict[str, Any]:
+    return _ACCOUNT
+
+
+def _page(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"totalSize": len(records), "done": True, "records": records}
+
+
+@pytest.fixture
+def tool() -> SalesforceTool:
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.Account = MagicMock(spec=SFType)
+    mock_sf.Account.describe = MagicMock(return_value=_ACCOUNT)
+    return SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+    )
+
+
+def test_plan_uses_subqueries_and_parent_fields() -> None:
+    """Test that relationships are folded into one query."""
+    plan = plan_related_query(
+        _describe,
+        "Account",
+        fields=["Name"],
+        relationships={"contacts": ["Name", "Email"], "Owner": ["Name"]},
+        where="Name LIKE 'A%'",
+        limit=50,
+    )
+
+    assert plan.root_query == (
+        "SELECT Id, Name, (SELECT Id, Name, Email FROM Contacts), Owner.Id, "
+        "Owner.Name FROM Account WHERE Name LIKE 'A%' LIMIT 50"
+    )
+    assert plan.subqueries == ["Contacts"]
+    assert plan.batched == []
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"relationships": {"Cases": ["Id"]}}, "Unknown relationship 'Cases'"),
+        ({"relationships": {"Contacts": ["Name FROM User"]}}, "Invalid field"),
+        ({"fields": ["Name, (SELECT Id FROM Users)"]}, "Invalid field"),
+        ({"where": "Name = 'x' LIMIT 1"}, "Invalid where condition"),
+    ],
+)
+def test_plan_validation(kwargs: Dict[str, Any], message: str) -> None:
+    """Test that unknown relationships and unsafe input are rejected."""
+    with pytest.raises(ValueError, match=message):
+        plan_related_query(_describe, "Account", **kwargs)
+
+
+def test_query_related_assembles_graph(tool: SalesforceTool) -> None:
+    """Test one round trip for parents and children, following child pages."""
+    mock_sf = cast(MagicMock, tool._sf)
+    mock_sf.query.return_value = _page(
+        [
+            {
+                "attributes": {"type": "Account"},
+                "Id": "001A",
+                "Owner": {"attributes": {"type": "User"}, "Id": "005A", "Name": "Ann"},
+                "Contacts": {
+                    "done": False,
+                    "nextRecordsUrl": "/next",
+                    "records": [{"attributes": {"type": "Contact"}, "Id": "003A"}],
+                },
+            },
+            {"attributes": {"type": "Account"}, "Id": "001B", "Owner": None},
+        ]
+    )
+    mock_sf.query_more.return_value = _page([{"Id": "003B"}])
+
+    result = tool.invoke(
+        {
+            "operation": "query_related",
+            "object_name": "Account",
+            "relationships": {"Contacts": [], "Owner": ["Name"]},
+        }
+    )
+
+    assert result["records"] == [
+        {
+            "Id": "001A",
+            "Owner": {"Id": "005A", "Name": "Ann"},
+            "Contacts": [{"Id": "003A"}, {"Id": "003B"}],
+        },
+        {"Id": "001B", "Owner": None, "Contacts": []},
+    ]
+    assert len(result["queries"]) == 1
+    assert result["queries"][0].endswith("FROM Account LIMIT 200")
+    mock_sf.query.assert_called_once()
+    mock_sf.query_more.assert_called_once_with(
+        "/next", identifier_is_url=True, include_deleted=False
+    )
+
+
+def test_query_related_batches_extra_children(
+    tool: SalesforceTool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test batched IN queries once the subquery limit is reached."""
+    monkeypatch.setattr(related, "MAX_SUBQUERIES", 1)
+    monkeypatch.setattr(related, "IN_BATCH_SIZE", 2)
+    mock_sf = cast(MagicMock, tool._sf)
+    accounts = [{"Id": f"001{i}", "Contacts": None} for i in range(3)]
+    mock_sf.query.side_effect = [
+        _page(accounts),
+        _page(
+            [{"Id": "006A", "AccountId": "0010"}, {"Id": "006B", "AccountId": "0010"}]
+        ),
+        _page([{"Id": "006C", "AccountId": "0012"}]),
+    ]
+
+    result = tool.invoke(
+        {
+            "operation": "query_related",
+            "object_name": "Account",
+            "relationships": {"Contacts": ["Name"], "Opportunities": ["Amount"]},
+        }
+    )
+
+    assert [len(r["Opportunities"]) for r in result["records"]] == [2, 0, 1]
+    assert result["queries"][1:] == [
+        "SELECT Id, Amount, AccountId FROM Opportunity WHERE AccountId IN "
+        "('0010', '0011')",
+        "SELECT Id, Amount, AccountId FROM Opportunity WHERE AccountId IN ('0012')",
+    ]
+    assert mock_sf.query.call_count == 3
@@ -0,0 +1,186 @@
+"""Unit tests for circuit breaking and load shedding."""
+
+import threading
+from typing import Any, List, cast
+from unittest.mock import MagicMock
+
+import pytest
+from simple_salesforce import Salesforce
+from simple_salesforce.api import SFType
+
+from langchain_salesforce.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    LoadSheddingError,
+    is_service_failure,
+)
+from langchain_salesforce.tools import SalesforceTool
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_tool(**kwargs: Any) -> SalesforceTool:
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.Contact = MagicMock(spec=SFType)
+    mock_sf.query.return_value = {"totalSize": 0, "done": True, "records": []}
+    return SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        **kwargs,
+    )
+
+
+def test_breaker_opens_and_probes() -> None:
+    """Test the closed, open and half-open transitions."""
+    clock = _Clock()
+    breaker = CircuitBreaker("read", failure_threshold=2, reset_timeout=10, clock=clock)
+
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()  # one probe at a time
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record_success(0.1)
+    assert breaker.state == "closed"
+    metrics = breaker.metrics()
+    assert metrics["transitions"] == {
+        "closed->open": 1,
+        "open->half_open": 2,
+        "half_open->open": 1,
+        "half_open->closed": 1,
+    }
+    assert (metrics["failures"], metrics["successes"], metrics["rejected"]) == (
+        3,
+        1,
+        2,
+    )
+
+
+def test_slow_calls_count_as_failures() -> None:
+    """Test that calls over slow_call_seconds open the breaker."""
+    breaker = CircuitBreaker("read", failure_threshold=1, slow_call_seconds=1.0)
+
+    breaker.record_success(0.5)
+    assert breaker.state == "closed"
+    breaker.record_success(2.0)
+    assert breaker.state == "open"
+    assert breaker.metrics()["slow_calls"] == 1
+
+
+def test_is_service_failure() -> None:
+    """Test which errors count against the breaker."""
+    server_error = Exception("boom")
+    server_error.status = 503  # type: ignore[attr-defined]
+    not_found = Exception("missing")
+    not_found.status = 404  # type: ignore[attr-defined]
+
+    assert is_service_failure(ConnectionError("down"))
+    assert is_service_failure(TimeoutError())
+    assert is_service_failure(server_error)
+    assert not is_service_failure(not_found)
+    assert not is_service_failure(ValueError("bad query"))
+
+
+def test_tool_fails_fast_and_serves_cache() -> None:
+    """Test that open breakers serve cached reads and fail fast otherwise."""
+    tool = _make_tool(
+        circuit_breaker=True, breaker_failure_threshold=2, query_cache_ttl=60
+    )
+    mock_sf = cast(MagicMock, tool._sf)
+    cached = {"operation": "query", "query": "SELECT Id FROM Contact"}
+    tool.invoke(cached)
+
+    mock_sf.query.side_effect = ConnectionError("down")
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            tool.invoke({"operation": "query", "query": "SELECT Name FROM Contact"})
+    assert tool.resilience_metrics()["breakers"]["read"]["state"] == "open"
+
+    assert tool.invoke(cached)["records"] == []
+    with pytest.raises(CircuitOpenError, match="not cached"):
+        tool.invoke({"operation": "query", "query": "SELECT Name FROM Contact"})
+    assert mock_sf.query.call_count == 3
+    assert tool.resilience_metrics()["breakers"]["write"]["state"] == "closed"
+
+    create = {
+        "operation": "create",
+        "object_name": "Contact",
+        "record_data": {"LastName": "Lee"},
+    }
+    mock_create = cast(MagicMock, mock_sf.Contact.create)
+    mock_create.side_effect = TimeoutError()
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            tool.invoke(create)
+    with pytest.raises(CircuitOpenError, match="write"):
+        tool.invoke(create)
+    assert mock_create.call_count == 2
+
+
+def test_request_errors_do_not_open_breaker() -> None:
+    """Test that errors Salesforce answered with keep the breaker closed."""
+    tool = _make_tool(circuit_breaker=True, breaker_failure_threshold=1)
+    cast(MagicMock, tool._sf).query.side_effect = ValueError("MALFORMED_QUERY")
+
+    with pytest.raises(ValueError):
+        tool.invoke({"operation": "query", "query": "SELECT Id FROM Contact"})
+    assert tool.resilience_metrics()["breakers"]["read"]["state"] == "closed"
+
+
+def test_load_shedding() -> None:
+    """Test that operations over max_in_flight are rejected."""
+    tool = _make_tool(max_in_flight=1)
+    started = threading.Event()
+    release = threading.Event()
+    errors: List[BaseException] = []
+
+    def slow_query(*args: Any, **kwargs: Any) -> Any:
+        started.set()
+        release.wait(5)
+        return {"totalSize": 0, "done": True, "records": []}
+
+    cast(MagicMock, tool._sf).query.side_effect = slow_query
+
+    def run() -> None:
+        try:
+            tool.invoke({"operation": "query", "query": "SELECT Id FROM Contact"})
+        except BaseException as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    assert started.wait(5)
+    with pytest.raises(LoadSheddingError):
+        tool.invoke({"operation": "list_objects"})
+    assert tool.resilience_metrics()["in_flight"] == 1
+    release.set()
+    worker.join(5)
+
+    assert errors == []
+    metrics = tool.resilience_metrics()
+    assert metrics["breakers"] == {}
+    assert (metrics["in_flight"], metrics["max_in_flight"], metrics["shed"]) == (
+        0,
+        1,
+        1,
+    )
@@ -0,0 +1,179 @@
+"""Unit tests for the SOQL query rewriter."""
+
+from typing import Any, Dict, cast
+from unittest.mock import MagicMock
+
+import pytest
+from simple_salesforce import Salesforce
+from simple_salesforce.api import SFType
+from simple_salesforce.exceptions import SalesforceResourceNotFound
+
+from langchain_salesforce.rewrite import QueryRewriter
+from langchain_salesforce.tools import SalesforceTool
+
+CONTACT_DESCRIBE: Dict[str, Any] = {
+    "name": "Contact",
+    "fields": [
+        {"name": "AccountId", "type": "reference", "custom": False},
+        {"name": "Id", "type": "id", "custom": False},
+        {"name": "Name", "type": "string", "custom": False},
+        {"name": "Email", "type": "email", "custom": False},
+        {"name": "Photo__c", "type": "base64", "custom": True},
+        {"name": "Score__c", "type": "double", "custom": True},
+    ],
+}
+
+
+def _describe(object_name: str) -> Dict[str, Any]:
+    if object_name != "Contact":
+        raise SalesforceResourceNotFound("url", 404, object_name, b"")
+    return CONTACT_DESCRIBE
+
+
+def test_default_and_max_limit() -> None:
+    """Test that LIMIT is added when missing and reduced when too large."""
+    rewriter = QueryRewriter(_describe, default_limit=100, max_limit=500)
+
+    added = rewriter.rewrite("SELECT Id FROM Contact WHERE Email != null")
+    assert added.query == "SELECT Id FROM Contact WHERE Email != null LIMIT 100"
+    assert added.rewrites == ["Added LIMIT 100"]
+
+    reduced = rewriter.rewrite("SELECT Id FROM Contact LIMIT 5000 OFFSET 10")
+    assert reduced.query == "SELECT Id FROM Contact LIMIT 500 OFFSET 10"
+    assert reduced.rewrites == ["Reduced LIMIT 5000 to 500"]
+
+    unchanged = rewriter.rewrite("select Id from Contact limit 10")
+    assert unchanged.query == "select Id from Contact limit 10"
+    assert not unchanged.rewritten
+
+
+def test_single_row_aggregates_get_no_limit() -> None:
+    """Test that aggregate queries without GROUP BY are left alone."""
+    rewriter = QueryRewriter(_describe, default_limit=100)
+
+    assert not rewriter.rewrite("SELECT COUNT() FROM Contact").rewritten
+    grouped = rewriter.rewrite(
+        "SELECT AccountId, COUNT(Id) FROM Contact GROUP BY AccountId"
+    )
+    assert grouped.rewrites == ["Added LIMIT 100"]
+
+
+def test_field_cap_keeps_id_and_order() -> None:
+    """Test that surplus fields are dropped after removing duplicates."""
+    rewriter = QueryRewriter(_describe, max_fields=3)
+
+    result = rewriter.rewrite(
+        "SELECT Name, Email, name, Phone, Title, Id, (SELECT Id FROM Cases) "
+        "FROM Contact"
+    )
+
+    assert result.query == (
+        "SELECT Name, Email, Id, (SELECT Id FROM Cases) FROM Contact"
+    )
+    assert result.rewrites == [
+        "Removed 1 duplicate fields",
+        "Selected 3 of 5 fields (max_fields=3)",
+    ]
+
+
+def test_fields_functions_expanded_from_describe() -> None:
+    """Test that FIELDS() selections become explicit, capped field lists."""
+    rewriter = QueryRewriter(_describe, max_fields=3, expand_fields=True)
+
+    result = rewriter.rewrite("SELECT Email, FIELDS(ALL) FROM Contact")
+    assert result.query == "SELECT Email, Id, Name FROM Contact"
+    assert result.rewrites == [
+        "Expanded FIELDS(ALL) to 4 fields",
+        "Selected 3 of 5 fields (max_fields=3)",
+    ]
+
+    custom = QueryRewriter(_describe, expand_fields=True).rewrite(
+        "SELECT FIELDS(CUSTOM) FROM Contact"
+    )
+    assert custom.query == "SELECT Score__c FROM Contact"
+
+    # Without expand_fields the selection is sent as written
+    capped = QueryRewriter(_describe, max_fields=3).rewrite(
+        "SELECT FIELDS(CUSTOM) FROM Contact"
+    )
+    assert capped.query == "SELECT FIELDS(CUSTOM) FROM Contact LIMIT 200"
+
+
+def test_unexpanded_fields_function_limited_to_200() -> None:
+    """Test that FIELDS(ALL) keeps the LIMIT Salesforce requires for it."""
+    rewriter = QueryRewriter(_describe, default_limit=1000)
+
+    result = rewriter.rewrite("SELECT FIELDS(ALL) FROM Lead")
+
+    assert result.query == "SELECT FIELDS(ALL) FROM Lead LIMIT 200"
+
+
+def test_unparseable_query_untouched() -> None:
+    """Test that queries outside the parser's subset pass through."""
+    rewriter = QueryRewriter(_describe, default_limit=10)
+    query = "SELECT Id FROM Contact WITH SECURITY_ENFORCED"
+
+    assert rewriter.rewrite(query).query == query
+
+
+def test_invalid_bounds() -> None:
+    """Test argument validation."""
+    with pytest.raises(ValueError, match="max_fields"):
+        QueryRewriter(_describe, max_fields=0)
+    with pytest.raises(ValueError, match="must not exceed"):
+        QueryRewriter(_describe, default_limit=10, max_limit=5)
+
+
+def test_tool_reports_rewrites() -> None:
+    """Test that the tool sends the rewritten query and reports the changes."""
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_contact = MagicMock(spec=SFType)
+    mock_contact.describe = MagicMock(return_value=CONTACT_DESCRIBE)
+    mock_sf.Contact = mock_contact
+    mock_sf.query = MagicMock(return_value={"totalSize": 0, "records": []})
+    tool = SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        query_default_limit=50,
+        query_expand_fields=True,
+    )
+
+    result = cast(
+        Dict[str, Any],
+        tool._run(operation="query", query="SELECT FIELDS(STANDARD) FROM Contact"),
+    )
+
+    sent = "SELECT Id, Name, AccountId, Email FROM Contact LIMIT 50"
+    mock_sf.query.assert_called_once_with(sent)
+    assert result["rewritten_query"] == sent
+    assert result["rewrites"] == [
+        "Expanded FIELDS(STANDARD) to 4 fields",
+        "Added LIMIT 50",
+    ]
+
+    # Internal full scans are never rewritten
+    list(tool._iter_query_pages("SELECT Id FROM Contact"))
+    mock_sf.query.assert_called_with("SELECT Id FROM Contact")
+
+
+def test_tool_limit_options_do_not_expand_fields() -> None:
+    """Test that LIMIT bounds alone neither expand FIELDS() nor describe."""
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.Contact = MagicMock(spec=SFType)
+    mock_sf.query = MagicMock(return_value={"totalSize": 0, "records": []})
+    tool = SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        query_default_limit=50,
+    )
+
+    tool._run(operation="query", query="SELECT FIELDS(STANDARD) FROM Contact")
+
+    mock_sf.query.assert_called_once_with(
+        "SELECT FIELDS(STANDARD) FROM Contact LIMIT 50"
+    )
+    mock_sf.Contact.describe.assert_not_called()
@@ -0,0 +1,126 @@
+"""Unit tests for the SOSL search operation."""
+
+from typing import Any, Dict, cast
+from unittest.mock import MagicMock
+
+import pytest
+from simple_salesforce import Salesforce
+from simple_salesforce.api import SFType
+
+from langchain_salesforce.search import build_sosl, escape_search_term, rank_records
+from langchain_salesforce.tools import SalesforceTool
+
+
+def _record(object_type: str, **fields: Any) -> Dict[str, Any]:
+    return {"attributes": {"type": object_type, "url": "/services/data/x"}, **fields}
+
+
+@pytest.fixture
+def tool() -> SalesforceTool:
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.search = MagicMock(
+        return_value={
+            "searchRecords": [
+                _record("Account", Id="001A", Name="Acme Holdings"),
+                _record("Account", Id="001B", Name="Acme"),
+                _record("Contact", Id="003A", Name="Wile Coyote", Email="w@acme.com"),
+            ]
+        }
+    )
+    mock_sf.Contact = MagicMock(spec=SFType)
+    return SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+    )
+
+
+def test_build_sosl() -> None:
+    """Test the SOSL built from a term and returning fields."""
+    sosl = build_sosl(" Acme* ", {"Account": ["Id", "Name"], "Contact": []}, limit=20)
+
+    assert sosl == (
+        "FIND {Acme*} IN ALL FIELDS RETURNING Account(Id, Name), Contact LIMIT 20"
+    )
+    assert build_sosl("Acme") == "FIND {Acme} IN ALL FIELDS"
+
+
+def test_build_sosl_escapes_and_validates() -> None:
+    """Test that the term cannot break out of the FIND clause."""
+    assert escape_search_term("O'Hara} RETURNING {x") == "O\\'Hara\\} RETURNING \\{x"
+    assert escape_search_term("Jean-Luc & co?") == "Jean\\-Luc \\& co?"
+    with pytest.raises(ValueError, match="must not be empty"):
+        build_sosl("  ")
+    with pytest.raises(ValueError, match="Invalid field path"):
+        build_sosl("Acme", {"Account": ["Name) RETURNING User(Id"]})
+
+
+def test_rank_records() -> None:
+    """Test that exact and prefix matches move ahead across objects."""
+    records = [
+        _record("Contact", Id="1", Name="Bob", Email="bob@acme.com"),
+        _record("Account", Id="2", Name="Acme Corp"),
+        _record("Account", Id="3", Name="acme"),
+        _record("Lead", Id="4", Company="Other"),
+    ]
+
+    ranked = rank_records(records, "Acme*")
+
+    assert [record["Id"] for record in ranked] == ["3", "2", "1", "4"]
+    assert ranked[0] == {"type": "Account", "Id": "3", "Name": "acme"}
+
+
+def test_search_operation(tool: SalesforceTool) -> None:
+    """Test the ranked, compact result of the search operation."""
+    result = tool.invoke(
+        {
+            "operation": "search",
+            "search_term": "Acme",
+            "returning": {"Account": ["Id", "Name"], "Contact": ["Id", "Email"]},
+        }
+    )
+
+    assert result["count"] == 3
+    assert [record["Id"] for record in result["records"]] == ["001B", "001A", "003A"]
+    assert "attributes" not in result["records"][0]
+    mock_search = cast(MagicMock, tool._sf.search)
+    mock_search.assert_called_once_with(
+        "FIND {Acme} IN ALL FIELDS RETURNING Account(Id, Name), Contact(Id, Email) "
+        "LIMIT 50"
+    )
+
+
+def test_search_cached_until_write(tool: SalesforceTool) -> None:
+    """Test that repeated searches are cached and dropped on writes."""
+    search = {"operation": "search", "search_term": "Acme"}
+    mock_search = cast(MagicMock, tool._sf.search)
+
+    first = tool.invoke(search)
+    assert tool.invoke(search) == first
+    assert mock_search.call_count == 1
+
+    tool.invoke(
+        {
+            "operation": "create",
+            "object_name": "Contact",
+            "record_data": {"LastName": "Acme"},
+        }
+    )
+    tool.invoke(search)
+    assert mock_search.call_count == 2
+
+
+def test_search_validation(tool: SalesforceTool) -> None:
+    """Test required parameters, object names and empty responses."""
+    with pytest.raises(ValueError, match="Search term is required"):
+        tool.invoke({"operation": "search"})
+    with pytest.raises(ValueError, match="Invalid Salesforce object name"):
+        tool.invoke(
+            {"operation": "search", "search_term": "x", "returning": {"A B": []}}
+        )
+
+    cast(MagicMock, tool._sf.search).return_value = None
+    tool.search_cache_ttl = 0
+    result = tool.invoke({"operation": "search", "search_term": "nothing"})
+    assert result == {"records": [], "count": 0}
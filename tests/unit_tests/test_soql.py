@@ -0,0 +1,137 @@
+"""Unit tests for the SOQL parser."""
+
+import pytest
+
+from langchain_salesforce.soql import (
+    BooleanCondition,
+    Comparison,
+    Literal,
+    NotCondition,
+    SOQLParseError,
+    field_paths,
+    parse_soql,
+    quote_string,
+    to_soql,
+)
+
+
+def test_parse_full_query() -> None:
+    """Test parsing every supported clause."""
+    parsed = parse_soql(
+        "SELECT Id, Name, Account.Name FROM Contact "
+        "WHERE (Email LIKE '%@acme.com' OR Title != null) AND NOT IsDeleted = true "
+        "ORDER BY Name DESC NULLS LAST, Id LIMIT 10 OFFSET 5"
+    )
+
+    assert parsed.object_name == "Contact"
+    assert parsed.fields == ["Id", "Name", "Account.Name"]
+    assert isinstance(parsed.where, BooleanCondition)
+    assert parsed.where.operator == "AND"
+    assert isinstance(parsed.where.operands[1], NotCondition)
+    assert field_paths(parsed.where) == ["Email", "Title", "IsDeleted"]
+    assert [(o.field, o.descending, o.nulls) for o in parsed.order_by] == [
+        ("Name", True, "LAST"),
+        ("Id", False, None),
+    ]
+    assert parsed.limit == 10
+    assert parsed.offset == 5
+
+
+def test_parse_literals() -> None:
+    """Test the literal kinds recognized in WHERE conditions."""
+    parsed = parse_soql(
+        "SELECT Id FROM Opportunity WHERE Amount >= 1000.5 AND CloseDate = 2024-01-31 "
+        "AND CreatedDate > 2024-01-01T00:00:00Z AND StageName IN ('Won', 'It\\'s') "
+        "AND LastActivityDate = LAST_N_DAYS:30"
+    )
+
+    assert isinstance(parsed.where, BooleanCondition)
+    comparisons = parsed.where.operands
+    assert all(isinstance(c, Comparison) for c in comparisons)
+    values = [c.value for c in comparisons if isinstance(c, Comparison)]
+    assert [v.kind for v in values if isinstance(v, Literal)] == [
+        "number",
+        "date",
+        "datetime",
+        "date_literal",
+    ]
+    stages = values[3]
+    assert isinstance(stages, list)
+    assert [v.value for v in stages] == ["Won", "It's"]
+
+
+def test_parse_functions_and_alias() -> None:
+    """Test function calls with aliases in the select list."""
+    parsed = parse_soql(
+        "SELECT Industry, COUNT(Id) total FROM Account a GROUP BY Industry"
+    )
+
+    assert parsed.alias == "a"
+    assert parsed.group_by == ["Industry"]
+    count = parsed.select[1]
+    assert count.function == "COUNT"
+    assert count.arguments == ["Id"]
+    assert count.alias == "total"
+    assert parsed.fields == ["Industry"]
+
+    aliased = parse_soql(
+        "SELECT Industry ind, COUNT(Id) FROM Account GROUP BY Industry"
+    )
+    assert aliased.select[0].alias == "ind"
+    assert aliased.select[1].alias is None
+
+
+def test_quote_string() -> None:
+    """Test that quoted strings parse back to the original value."""
+    value = "O'Brien \\ 100%\n"
+
+    parsed = parse_soql(f"SELECT Id FROM Contact WHERE Name = {quote_string(value)}")
+
+    assert isinstance(parsed.where, Comparison)
+    assert isinstance(parsed.where.value, Literal)
+    assert parsed.where.value.value == value
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT Id FROM",
+        "SELECT Id Account",
+        "SELECT Id FROM Account WHERE Name = ",
+        "SELECT Id FROM Account LIMIT ten",
+        "SELECT Id FROM Account WHERE Name ~ 'x'",
+        "SELECT Id FROM Account FOR UPDATE",
+    ],
+)
+def test_parse_errors(query: str) -> None:
+    """Test that malformed or unsupported queries raise SOQLParseError."""
+    with pytest.raises(SOQLParseError):
+        parse_soql(query)
+
+
+def test_parse_subqueries() -> None:
+    """Test parent-child subqueries and semi-joins."""
+    parsed = parse_soql(
+        "SELECT Id, (SELECT LastName FROM Contacts WHERE Email != null) "
+        "FROM Account WHERE Id IN (SELECT AccountId FROM Opportunity)"
+    )
+
+    assert parsed.fields == ["Id"]
+    assert [q.object_name for q in parsed.child_queries] == ["Contacts"]
+    assert [q.object_name for q in parsed.semi_joins] == ["Opportunity"]
+    assert [q.object_name for q in parsed.subqueries] == ["Contacts", "Opportunity"]
+
+
+def test_to_soql_round_trip() -> None:
+    """Test that serialized queries parse back to the same tree."""
+    query = (
+        "SELECT Id, COUNT(Name) total, (SELECT Id FROM Contacts WHERE Email != null) "
+        "FROM Account a WHERE (Name LIKE 'A%' OR NOT (Type = 'X' AND Rating IN "
+        "('Hot', 'Warm'))) AND Id IN (SELECT AccountId FROM Opportunity) "
+        "GROUP BY Id ORDER BY Name DESC NULLS LAST LIMIT 10 OFFSET 5"
+    )
+
+    serialized = to_soql(parse_soql(query))
+
+    assert parse_soql(serialized) == parse_soql(query)
+    assert serialized.startswith("SELECT Id, COUNT(Name) total, (SELECT Id FROM")
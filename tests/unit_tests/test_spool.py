@@ -0,0 +1,127 @@
+"""Unit tests for spooling large query results to disk."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, cast
+from unittest.mock import MagicMock
+
+import pytest
+from simple_salesforce import Salesforce
+
+from langchain_salesforce.spool import SpooledResult, spool_pages
+from langchain_salesforce.tools import SalesforceTool
+
+_QUERY = "SELECT Id, Name FROM Account"
+
+
+def _records(start: int, stop: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "attributes": {"type": "Account"},
+            "Id": f"001{index:015d}",
+            "Name": None if index % 2 else f"Account {index}",
+        }
+        for index in range(start, stop)
+    ]
+
+
+@pytest.fixture
+def tool(tmp_path: Path) -> SalesforceTool:
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.query.return_value = {
+        "totalSize": 5,
+        "done": False,
+        "nextRecordsUrl": "/query/01g-2",
+        "records": _records(0, 2),
+    }
+    mock_sf.query_more.side_effect = [
+        {
+            "totalSize": 5,
+            "done": False,
+            "nextRecordsUrl": "/query/01g-4",
+            "records": _records(2, 4),
+        },
+        {"totalSize": 5, "done": True, "records": _records(4, 5)},
+    ]
+    return SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        spool_threshold=3,
+        spool_dir=str(tmp_path),
+        query_cache_ttl=60,
+    )
+
+
+def test_spool_pages_stats_and_lazy_iteration(tmp_path: Path) -> None:
+    """Test the spool file, its summary and reading it back."""
+    pages: List[Dict[str, Any]] = [
+        {"totalSize": 3, "records": _records(0, 2)},
+        {"records": _records(2, 3)},
+    ]
+
+    with spool_pages(_QUERY, pages, str(tmp_path)) as result:
+        assert len(result) == 3
+        assert result.summary()["field_counts"] == {"Id": 3, "Name": 2}
+        assert result.total_size == 3
+        assert result.size_bytes == os.path.getsize(result.path)
+        assert [record["Id"][-1] for record in result] == ["0", "1", "2"]
+        assert json.loads(str(result))["record_count"] == 3
+        path = result.path
+
+    assert result.closed and not os.path.exists(path)
+    with pytest.raises(ValueError, match="closed"):
+        list(result)
+
+
+def test_spool_file_removed_on_failure(tmp_path: Path) -> None:
+    """Test that a failed fetch leaves no spool file behind."""
+
+    def pages() -> Iterator[Dict[str, Any]]:
+        yield {"records": _records(0, 1)}
+        raise ConnectionError("reset")
+
+    with pytest.raises(ConnectionError):
+        spool_pages(_QUERY, pages(), str(tmp_path))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_tool_spools_large_results(tool: SalesforceTool, tmp_path: Path) -> None:
+    """Test that results above the threshold are spooled and not cached."""
+    result = cast(SpooledResult, tool.invoke({"operation": "query", "query": _QUERY}))
+
+    assert isinstance(result, SpooledResult)
+    assert result.path.startswith(str(tmp_path))
+    assert [record["Id"][-1] for record in result] == ["0", "1", "2", "3", "4"]
+    mock_sf = cast(MagicMock, tool._sf)
+    assert mock_sf.query_more.call_count == 2
+
+    mock_sf.query.return_value = {"totalSize": 2, "done": True, "records": []}
+    small = tool.invoke({"operation": "query", "query": _QUERY})
+    assert small == {"totalSize": 2, "done": True, "records": []}
+    result.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_tool_spools_large_single_page(tool: SalesforceTool, tmp_path: Path) -> None:
+    """Test that a one-page result above the threshold is spooled too."""
+    mock_sf = cast(MagicMock, tool._sf)
+    mock_sf.query.return_value = {
+        "totalSize": 4,
+        "done": True,
+        "records": _records(0, 4),
+    }
+
+    result = tool.invoke({"operation": "query", "query": _QUERY})
+
+    assert isinstance(result, SpooledResult)
+    assert (len(result), result.total_size) == (4, 4)
+    mock_sf.query_more.assert_not_called()
+    result.close()
+
+    mock_sf.query.return_value = {"totalSize": 500, "done": True, "records": []}
+    count = tool.invoke({"operation": "query", "query": "SELECT COUNT() FROM Account"})
+    assert count == {"totalSize": 500, "done": True, "records": []}
+    assert list(tmp_path.iterdir()) == []
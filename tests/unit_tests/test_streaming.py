@@ -0,0 +1,228 @@
+"""Unit tests for the change event subscriber."""
+
+import time
+from typing import Any, Dict, List, Optional, cast
+from unittest.mock import MagicMock, patch
+
+import pytest
+from simple_salesforce import Salesforce
+from simple_salesforce.api import SFType
+
+from langchain_salesforce.streaming import (
+    ChangeEvent,
+    ChangeEventSubscriber,
+    CometDEventSource,
+    QueueEventSource,
+    parse_change_event,
+)
+from langchain_salesforce.sync import InMemoryWatermarkStore
+from langchain_salesforce.tools import SalesforceTool
+
+
+def _cdc_message(
+    entity: str,
+    change_type: str = "UPDATE",
+    changed_fields: Optional[List[str]] = None,
+    replay_id: int = 42,
+) -> Dict[str, Any]:
+    return {
+        "channel": f"/data/{entity}ChangeEvent",
+        "data": {
+            "event": {"replayId": replay_id},
+            "payload": {
+                "ChangeEventHeader": {
+                    "entityName": entity,
+                    "changeType": change_type,
+                    "recordIds": ["001000000000001AAA"],
+                    "changedFields": changed_fields or [],
+                }
+            },
+        },
+    }
+
+
+@pytest.fixture
+def tool() -> SalesforceTool:
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.query = MagicMock(return_value={"done": True, "records": []})
+    mock_account = MagicMock(spec=SFType)
+    mock_account.describe = MagicMock(
+        return_value={"fields": [{"name": "Id"}, {"name": "Name"}]}
+    )
+    mock_sf.Account = mock_account
+    return SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        query_cache_ttl=3600,
+    )
+
+
+def test_parse_cdc_and_push_topic_events() -> None:
+    """Test decoding of CDC and PushTopic messages."""
+    cdc = parse_change_event(_cdc_message("Account", "GAP_OVERFLOW", ["Name"]))
+    assert cdc == ChangeEvent(
+        channel="/data/AccountChangeEvent",
+        object_name="Account",
+        change_type="GAP_OVERFLOW",
+        record_ids=["001000000000001AAA"],
+        changed_fields=["Name"],
+        replay_id=42,
+    )
+    assert cdc.is_gap
+
+    topic = parse_change_event(
+        {
+            "channel": "/topic/HotAccounts",
+            "data": {
+                "event": {"type": "deleted", "replayId": 7},
+                "sobject": {"Id": "001000000000001AAA", "Name": "Acme"},
+            },
+        },
+        topic_objects={"HotAccounts": "Account"},
+    )
+    assert topic is not None
+    assert topic.object_name == "Account"
+    assert topic.change_type == "DELETE"
+    assert topic.changed_fields == ["Name"]
+
+    assert parse_change_event({"channel": "/meta/connect"}) is None
+
+
+def test_record_change_invalidates_object_queries(tool: SalesforceTool) -> None:
+    """Test that a change only drops the cached queries of its object."""
+    mock_query = cast(MagicMock, tool._sf.query)
+    tool._run(operation="query", query="SELECT Id FROM Account")
+    tool._run(operation="query", query="SELECT Id FROM Contact")
+    subscriber = ChangeEventSubscriber(
+        tool, QueueEventSource(), ["/data/AccountChangeEvent"]
+    )
+
+    subscriber.handle(_cdc_message("Account", changed_fields=["Name"]))
+    tool._run(operation="query", query="SELECT Id FROM Account")
+    tool._run(operation="query", query="SELECT Id FROM Contact")
+
+    assert [c[0][0] for c in mock_query.call_args_list] == [
+        "SELECT Id FROM Account",
+        "SELECT Id FROM Contact",
+        "SELECT Id FROM Account",
+    ]
+
+
+def test_gap_event_invalidates_whole_object(tool: SalesforceTool) -> None:
+    """Test that a gap event drops every cached record of its object."""
+    mirror = MagicMock()
+    mirror.objects = ["Account"]
+    subscriber = ChangeEventSubscriber(
+        tool, QueueEventSource(), ["/data/ChangeEvents"], mirror=mirror
+    )
+
+    with patch.object(SalesforceTool, "invalidate_records") as invalidate_records:
+        subscriber.handle(_cdc_message("Account"))
+        invalidate_records.assert_called_once_with("Account", ["001000000000001AAA"])
+
+        invalidate_records.reset_mock()
+        mirror.reset_mock()
+        subscriber.handle(_cdc_message("Account", "GAP_OVERFLOW"))
+        invalidate_records.assert_called_once_with("Account", ())
+    mirror.invalidate.assert_called_once_with("Account")
+    mirror.refresh.assert_called_once_with("Account")
+
+
+def test_unknown_field_invalidates_describe(tool: SalesforceTool) -> None:
+    """Test that a change to a field missing from the describe drops it."""
+    mock_describe = cast(MagicMock, tool._sf.Account.describe)
+    tool._run(operation="describe", object_name="Account")
+    subscriber = ChangeEventSubscriber(
+        tool, QueueEventSource(), ["/data/AccountChangeEvent"]
+    )
+
+    subscriber.handle(_cdc_message("Account", changed_fields=["Name"]))
+    tool._run(operation="describe", object_name="Account")
+    assert mock_describe.call_count == 1
+
+    subscriber.handle(_cdc_message("Account", changed_fields=["Tier__c"]))
+    tool._run(operation="describe", object_name="Account")
+    assert mock_describe.call_count == 2
+
+
+def test_mirror_refreshed_on_change(tool: SalesforceTool) -> None:
+    """Test that a change to a mirrored object refreshes the mirror."""
+    mirror = MagicMock()
+    mirror.objects = ["Account"]
+    subscriber = ChangeEventSubscriber(
+        tool, QueueEventSource(), ["/data/ChangeEvents"], mirror=mirror
+    )
+
+    subscriber.handle(_cdc_message("Account"))
+    subscriber.handle(_cdc_message("Contact"))
+
+    mirror.invalidate.assert_called_once_with("Account")
+    mirror.refresh.assert_called_once_with("Account")
+
+
+def test_background_subscriber_resumes_from_replay_store(
+    tool: SalesforceTool,
+) -> None:
+    """Test the background loop against a fake stream with replay ids."""
+    store = InMemoryWatermarkStore()
+    store.set("/data/AccountChangeEvent", "10")
+    source = QueueEventSource(poll_timeout=0.01)
+    received: List[ChangeEvent] = []
+    subscriber = ChangeEventSubscriber(
+        tool,
+        source,
+        ["/data/AccountChangeEvent", "/data/ContactChangeEvent"],
+        replay_store=store,
+        on_event=received.append,
+    )
+
+    subscriber.start()
+    source.put(_cdc_message("Account", replay_id=11))
+    deadline = time.monotonic() + 5
+    while not received and time.monotonic() < deadline:
+        time.sleep(0.01)
+    subscriber.stop()
+
+    assert source.subscriptions == {
+        "/data/AccountChangeEvent": 10,
+        "/data/ContactChangeEvent": -1,
+    }
+    assert [event.replay_id for event in received] == [11]
+    assert store.get("/data/AccountChangeEvent") == "11"
+
+
+def test_cometd_source_protocol() -> None:
+    """Test handshake, subscribe, connect and re-handshake advice."""
+    session = MagicMock()
+    replies = [
+        [{"channel": "/meta/handshake", "successful": True, "clientId": "c1"}],
+        [{"channel": "/meta/subscribe", "successful": True}],
+        [
+            {"channel": "/data/AccountChangeEvent", "data": {"event": {}}},
+            {
+                "channel": "/meta/connect",
+                "successful": False,
+                "advice": {"reconnect": "handshake"},
+            },
+        ],
+    ]
+    session.post.return_value.json.side_effect = replies
+    source = CometDEventSource(
+        "token", "na1.salesforce.com", api_version="59.0", session=session
+    )
+
+    source.subscribe({"/data/AccountChangeEvent": 5})
+    messages = source.poll()
+
+    assert [m["channel"] for m in messages] == ["/data/AccountChangeEvent"]
+    posted = [c.kwargs["json"][0] for c in session.post.call_args_list]
+    assert [m["channel"] for m in posted] == [
+        "/meta/handshake",
+        "/meta/subscribe",
+        "/meta/connect",
+    ]
+    assert posted[1]["ext"] == {"replay": {"/data/AccountChangeEvent": 5}}
+    assert session.post.call_args.args[0] == ("https://na1.salesforce.com/cometd/59.0")
+    assert source._client_id is None
@@ -0,0 +1,226 @@
+"""Unit tests for incremental change sync."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+from simple_salesforce import Salesforce
+
+from langchain_salesforce.sync import (
+    IncrementalSync,
+    InMemoryWatermarkStore,
+    JSONFileWatermarkStore,
+    _load_state,
+    _to_soql_datetime,
+)
+from langchain_salesforce.tools import SalesforceTool
+
+
+def _make_tool(pages: List[Dict[str, Any]]) -> Tuple[SalesforceTool, MagicMock]:
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.query = MagicMock(return_value=pages[0])
+    mock_sf.query_more = MagicMock(side_effect=pages[1:])
+    tool = SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+    )
+    return tool, mock_sf
+
+
+def test_to_soql_datetime() -> None:
+    """Test that API datetimes are normalized into SOQL literals."""
+    assert _to_soql_datetime("2024-01-15T10:30:00.000+0000") == (
+        "2024-01-15T10:30:00.000Z"
+    )
+    assert _to_soql_datetime("2024-01-15T12:30:00.250+0200") == (
+        "2024-01-15T10:30:00.250Z"
+    )
+    with pytest.raises(ValueError, match="Invalid watermark value"):
+        _to_soql_datetime("yesterday")
+
+
+def test_first_sync_fetches_everything_and_stores_watermark() -> None:
+    """Test a full first run across several pages via queryAll."""
+    tool, mock_sf = _make_tool(
+        [
+            {
+                "done": False,
+                "nextRecordsUrl": "/services/data/v59.0/query/01g-2000",
+                "records": [
+                    {
+                        "Id": "001000000000001",
+                        "SystemModstamp": "2024-01-01T00:00:00.000+0000",
+                        "IsDeleted": False,
+                        "Name": "Acme",
+                    }
+                ],
+            },
+            {
+                "done": True,
+                "records": [
+                    {
+                        "Id": "001000000000002",
+                        "SystemModstamp": "2024-01-02T00:00:00.000+0000",
+                        "IsDeleted": True,
+                        "Name": "Gone",
+                    }
+                ],
+            },
+        ]
+    )
+    store = InMemoryWatermarkStore()
+    sync = IncrementalSync(tool, store)
+
+    result = sync.sync("Account", ["Name"])
+
+    assert result.full_sync
+    assert [r["Id"] for r in result.records] == ["001000000000001"]
+    assert result.deleted_ids == ["001000000000002"]
+    assert result.watermark == "2024-01-02T00:00:00.000+0000"
+    assert _load_state(store.get(sync.state_key("Account", ["Name"]))) == (
+        "2024-01-02T00:00:00.000+0000",
+        {"001000000000002": "2024-01-02T00:00:00.000Z"},
+    )
+
+    assert mock_sf.query.call_args[0][0] == (
+        "SELECT Id, SystemModstamp, IsDeleted, Name FROM Account "
+        "ORDER BY SystemModstamp ASC"
+    )
+    assert mock_sf.query.call_args[1] == {"include_deleted": True}
+    assert mock_sf.query_more.call_args[1]["include_deleted"] is True
+
+
+def test_incremental_sync_filters_on_watermark() -> None:
+    """Test that a subsequent run only asks for newer records."""
+    tool, mock_sf = _make_tool([{"done": True, "records": []}])
+    store = InMemoryWatermarkStore()
+    sync = IncrementalSync(tool, store, watermark_field="LastModifiedDate")
+    key = sync.state_key("Contact", ["Email"], where="Email != null")
+    store.set(key, "2024-01-02T00:00:00.000+0000")
+
+    result = sync.sync("Contact", ["Email"], where="Email != null")
+
+    assert not result.full_sync
+    assert result.records == []
+    assert result.watermark == "2024-01-02T00:00:00.000+0000"
+    assert mock_sf.query.call_args[0][0] == (
+        "SELECT Id, LastModifiedDate, IsDeleted, Email FROM Contact "
+        "WHERE LastModifiedDate >= 2024-01-01T23:59:00.000Z AND (Email != null) "
+        "ORDER BY LastModifiedDate ASC"
+    )
+
+
+def test_overlap_refetches_without_duplicates() -> None:
+    """Test that records re-read through the overlap are returned once."""
+
+    def record(record_id: str, modstamp: str) -> Dict[str, Any]:
+        return {"Id": record_id, "SystemModstamp": modstamp, "IsDeleted": False}
+
+    first = record("001000000000001", "2024-01-01T10:00:00.000+0000")
+    late = record("001000000000002", "2024-01-01T09:59:30.000+0000")
+    updated = record("001000000000001", "2024-01-01T10:05:00.000+0000")
+    tool, mock_sf = _make_tool([{"done": True, "records": [first]}])
+    sync = IncrementalSync(tool, overlap=120)
+
+    sync.sync("Account", [])
+    mock_sf.query.return_value = {"done": True, "records": [late, first]}
+    second = sync.sync("Account", [])
+    mock_sf.query.return_value = {"done": True, "records": [late, first, updated]}
+    third = sync.sync("Account", [])
+
+    assert (
+        "SystemModstamp >= 2024-01-01T09:58:00.000Z"
+        in (mock_sf.query.call_args_list[1][0][0])
+    )
+    assert second.records == [late]
+    assert second.watermark == first["SystemModstamp"]
+    assert third.records == [updated]
+    assert third.watermark == updated["SystemModstamp"]
+    with pytest.raises(ValueError, match="overlap must be non-negative"):
+        IncrementalSync(tool, overlap=-1)
+
+
+def test_state_key_scoped_by_fields_and_where() -> None:
+    """Test that syncs of different slices of an object keep separate marks."""
+    tool, _ = _make_tool([{"done": True, "records": []}])
+    sync = IncrementalSync(tool)
+
+    key = sync.state_key("Account", ["Name", "Industry"])
+
+    assert key.startswith("Account:")
+    assert key == sync.state_key("Account", ["industry", "Name"])
+    assert key != sync.state_key("Account", ["Name"])
+    assert key != sync.state_key("Account", ["Name", "Industry"], where="A = 1")
+    assert key != sync.state_key("Account", ["Name", "Industry"], False)
+    assert key != IncrementalSync(tool, watermark_field="LastModifiedDate").state_key(
+        "Account", ["Name", "Industry"]
+    )
+
+
+def test_sync_without_deletions_uses_query_endpoint() -> None:
+    """Test that objects without IsDeleted can be synced via plain query."""
+    tool, mock_sf = _make_tool([{"done": True, "records": []}])
+    sync = IncrementalSync(tool)
+
+    sync.sync("User", ["Username"], include_deleted=False)
+
+    assert "IsDeleted" not in mock_sf.query.call_args[0][0]
+    assert mock_sf.query.call_args[1] == {}
+
+
+def test_watermark_not_advanced_on_failure() -> None:
+    """Test that a failing page leaves the previous watermark in place."""
+    tool, mock_sf = _make_tool(
+        [
+            {
+                "done": False,
+                "nextRecordsUrl": "/next",
+                "records": [
+                    {
+                        "Id": "001000000000001",
+                        "SystemModstamp": "2024-02-01T00:00:00.000+0000",
+                        "IsDeleted": False,
+                    }
+                ],
+            }
+        ]
+    )
+    mock_sf.query_more.side_effect = Exception("Connection reset")
+    store = InMemoryWatermarkStore()
+    sync = IncrementalSync(tool, store)
+
+    with pytest.raises(Exception, match="Connection reset"):
+        sync.sync("Account", [])
+    assert store.get(sync.state_key("Account", [])) is None
+
+
+def test_invalid_names_rejected() -> None:
+    """Test that object, field and watermark names are validated."""
+    tool, mock_sf = _make_tool([{"done": True, "records": []}])
+    with pytest.raises(ValueError, match="Unsupported watermark field"):
+        IncrementalSync(tool, watermark_field="CreatedDate")
+
+    sync = IncrementalSync(tool)
+    with pytest.raises(ValueError, match="Invalid Salesforce object name"):
+        sync.sync("__class__", ["Name"])
+    with pytest.raises(ValueError, match="Invalid Salesforce field name"):
+        sync.sync("Account", ["Name FROM User"])
+
+
+def test_json_file_store_roundtrip(tmp_path: Path) -> None:
+    """Test persisting, reloading and deleting watermarks on disk."""
+    path = tmp_path / "watermarks.json"
+    store = JSONFileWatermarkStore(str(path))
+    assert store.get("Account") is None
+
+    store.set("Account", "2024-01-01T00:00:00.000+0000")
+    store.set("Contact", "2024-01-02T00:00:00.000+0000")
+    reloaded = JSONFileWatermarkStore(str(path))
+    assert reloaded.get("Account") == "2024-01-01T00:00:00.000+0000"
+
+    reloaded.delete("Account")
+    assert json.loads(path.read_text()) == {"Contact": "2024-01-02T00:00:00.000+0000"}
@@ -1,7 +1,10 @@
 """Unit tests for the Salesforce tool."""
 
+import json
 import os
-from typing import Any, Dict, Type, cast
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple, Type, cast
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -645,3 +648,418 @@ class TestSalesforceToolUnit(ToolsUnitTests):
             record_id="003000000000001AAA",
         )
         assert result == {"success": True}
+
+    def test_describe_is_cached(self) -> None:
+        """Test that describes are served from cache until invalidated."""
+        tool = self.tool_constructor(**self.tool_constructor_params)
+
+        tool._run(operation="describe", object_name="Account")
+        tool._run(operation="describe", object_name="Account")
+        tool._run(
+            operation="get_field_metadata", object_name="Account", field_name="Name"
+        )
+        mock_describe = cast(MagicMock, tool._sf.Account.describe)
+        assert mock_describe.call_count == 1
+
+        tool.invalidate_describe("Account")
+        tool._run(operation="describe", object_name="Account")
+        assert mock_describe.call_count == 2
+
+    def test_describe_cache_disabled(self) -> None:
+        """Test that a zero describe TTL always hits the API."""
+        tool = self.tool_constructor(
+            **self.tool_constructor_params, describe_cache_ttl=0
+        )
+
+        tool._run(operation="describe", object_name="Account")
+        tool._run(operation="list_objects")
+        tool._run(operation="describe", object_name="Account")
+        tool._run(operation="list_objects")
+
+        assert cast(MagicMock, tool._sf.Account.describe).call_count == 2
+        assert cast(MagicMock, tool._sf.describe).call_count == 2
+
+    def test_query_cache_invalidated_by_writes(self) -> None:
+        """Test that cached queries are dropped when their object is written."""
+        tool = self.tool_constructor(**self.tool_constructor_params, query_cache_ttl=60)
+        mock_query = cast(MagicMock, tool._sf.query)
+        query = "SELECT Id, Email FROM Contact"
+
+        tool._run(operation="query", query=query)
+        tool._run(operation="query", query=query)
+        assert mock_query.call_count == 1
+
+        tool._run(
+            operation="update",
+            object_name="Contact",
+            record_id="003000000000001",
+            record_data={"Email": "new@example.com"},
+        )
+        tool._run(operation="query", query=query)
+        assert mock_query.call_count == 2
+
+    def test_query_cache_skips_parent_fields(self) -> None:
+        """Test that queries reading parent fields are never cached."""
+        tool = self.tool_constructor(**self.tool_constructor_params, query_cache_ttl=60)
+        mock_query = cast(MagicMock, tool._sf.query)
+        queries = [
+            "SELECT Id, Account.Name FROM Contact",
+            "SELECT Id FROM Contact c WHERE c.Account.Industry = 'Tech'",
+            "SELECT Id FROM Contact ORDER BY Owner.Name",
+            "SELECT COUNT(Id) FROM Contact GROUP BY Account.Type",
+        ]
+
+        for query in queries:
+            tool._run(operation="query", query=query)
+            tool._run(operation="query", query=query)
+        tool._run(operation="query", query="SELECT c.Id FROM Contact c")
+        tool._run(operation="query", query="SELECT c.Id FROM Contact c")
+
+        assert mock_query.call_count == 2 * len(queries) + 1
+
+    def test_query_cache_disabled_by_default(self) -> None:
+        """Test that query results are not cached unless configured."""
+        tool = self.tool_constructor(**self.tool_constructor_params)
+        query = "SELECT Id FROM Account"
+
+        tool._run(operation="query", query=query)
+        tool._run(operation="query", query=query)
+
+        assert cast(MagicMock, tool._sf.query).call_count == 2
+
+    def test_concurrent_invoke_stress(self) -> None:
+        """Test that many threads can share one tool without interference."""
+        tool = self.tool_constructor(**self.tool_constructor_params)
+        mock_sf = cast(MagicMock, tool._sf)
+        # MagicMock's call counter is not thread-safe; list.append is atomic
+        calls: List[str] = []
+
+        def query(soql: str) -> Dict[str, Any]:
+            calls.append(soql)
+            return {"query": soql}
+
+        mock_sf.query = MagicMock(side_effect=query)
+
+        def call(i: int) -> None:
+            query = f"SELECT Id FROM Account LIMIT {i}"
+            assert tool.invoke({"operation": "query", "query": query}) == {
+                "query": query
+            }
+            fields = tool.invoke({"operation": "describe", "object_name": "Account"})
+            assert len(fields["fields"]) == 2
+            assert tool.invoke({"operation": "list_objects"}) == [{"name": "Account"}]
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(call, range(2000)))
+
+        assert len(calls) == 2000
+        assert cast(MagicMock, mock_sf.Account.describe).call_count <= 16
+
+    def test_thread_local_clients(self) -> None:
+        """Test that each thread gets its own client sharing the login."""
+        tool = self.tool_constructor(
+            **self.tool_constructor_params, thread_local_clients=True
+        )
+        mock_sf = cast(MagicMock, tool._sf)
+        mock_sf.session_id = "session"
+        mock_sf.sf_instance = "example.my.salesforce.com"
+        mock_sf.sf_version = "59.0"
+        clients: Dict[int, Any] = {}
+        lock = threading.Lock()
+
+        def make_client(**kwargs: Any) -> MagicMock:
+            assert kwargs["session_id"] == "session"
+            client = MagicMock(spec=Salesforce)
+            client.query = MagicMock(return_value={"records": []})
+            with lock:
+                clients[threading.get_ident()] = client
+            return client
+
+        with patch("simple_salesforce.Salesforce", side_effect=make_client):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(
+                    executor.map(
+                        lambda _: tool._run(
+                            operation="query", query="SELECT Id FROM Account"
+                        ),
+                        range(100),
+                    )
+                )
+
+        assert 1 <= len(clients) <= 4
+        assert sum(c.query.call_count for c in clients.values()) == 100
+        assert cast(MagicMock, mock_sf.query).call_count == 0
+
+    def test_batch_groups_creates_into_collections(self) -> None:
+        """Test that creates share Collections calls and results keep order."""
+        tool = self.tool_constructor(**self.tool_constructor_params)
+        mock_sf = cast(MagicMock, tool._sf)
+
+        def restful(
+            path: str, method: str = "GET", data: str = "", **kwargs: Any
+        ) -> Any:
+            records = json.loads(data)["records"]
+            return [
+                {"id": f"{r['attributes']['type']}{i}", "success": True, "errors": []}
+                if r.get("LastName") != "Bad"
+                else {"success": False, "errors": [{"message": "Invalid name"}]}
+                for i, r in enumerate(records)
+            ]
+
+        mock_sf.restful = MagicMock(side_effect=restful)
+        inputs: List[Any] = [
+            {
+                "operation": "create",
+                "object_name": "Contact",
+                "record_data": {"LastName": "A"},
+            },
+            {"operation": "query", "query": "SELECT Id FROM Account"},
+            {
+                "operation": "create",
+                "object_name": "Account",
+                "record_data": {"Name": "X"},
+            },
+            {
+                "operation": "create",
+                "object_name": "Contact",
+                "record_data": {"LastName": "Bad"},
+            },
+            {"operation": "invalid"},
+            {
+                "operation": "create",
+                "object_name": "Contact",
+                "record_data": {"LastName": "C"},
+            },
+        ]
+
+        results = tool.batch(inputs, return_exceptions=True)
+
+        assert mock_sf.restful.call_count == 2
+        assert results[0]["id"] == "Contact0"
+        assert results[1] == {"records": [{"Id": "1", "Name": "Test"}]}
+        assert results[2]["id"] == "Account0"
+        assert isinstance(results[3], ValueError)
+        assert "Invalid name" in str(results[3])
+        assert isinstance(results[4], ValueError)
+        assert results[5]["id"] == "Contact2"
+
+        with pytest.raises(ValueError, match="Invalid name"):
+            tool.batch(inputs)
+
+    def test_batch_chunks_collections_calls(self) -> None:
+        """Test that Collections calls carry at most 200 records."""
+        tool = self.tool_constructor(**self.tool_constructor_params)
+        mock_sf = cast(MagicMock, tool._sf)
+        mock_sf.restful = MagicMock(
+            side_effect=lambda path, method, data: (
+                [{"id": "1", "success": True, "errors": []}]
+                * len(json.loads(data)["records"])
+            )
+        )
+
+        results = tool.batch(
+            [
+                {"operation": "create", "object_name": "Lead", "record_data": {"N": i}}
+                for i in range(450)
+            ],
+            config={"max_concurrency": 2},
+        )
+
+        sizes = [
+            len(json.loads(c.kwargs["data"])["records"])
+            for c in mock_sf.restful.call_args_list
+        ]
+        assert sorted(sizes) == [50, 200, 200]
+        assert len(results) == 450
+
+    def test_batch_groups_describes_into_composite(self) -> None:
+        """Test that describes share composite requests and fill the cache."""
+        tool = self.tool_constructor(**self.tool_constructor_params)
+        mock_sf = cast(MagicMock, tool._sf)
+        account = {"name": "Account", "fields": [{"name": "Name"}]}
+        mock_sf.restful = MagicMock(
+            return_value={
+                "compositeResponse": [
+                    {
+                        "referenceId": "describe0",
+                        "httpStatusCode": 200,
+                        "body": account,
+                    },
+                    {
+                        "referenceId": "describe1",
+                        "httpStatusCode": 404,
+                        "body": [{"message": "The requested resource does not exist"}],
+                    },
+                ]
+            }
+        )
+
+        results = tool.batch(
+            [
+                {"operation": "describe", "object_name": "Account"},
+                {"operation": "describe", "object_name": "Missing"},
+                {
+                    "operation": "get_field_metadata",
+                    "object_name": "account",
+                    "field_name": "Name",
+                },
+            ],
+            return_exceptions=True,
+        )
+
+        assert mock_sf.restful.call_count == 1
+        sent = json.loads(mock_sf.restful.call_args.kwargs["data"])
+        assert [r["url"] for r in sent["compositeRequest"]] == [
+            "/services/data/v59.0/sobjects/Account/describe",
+            "/services/data/v59.0/sobjects/Missing/describe",
+        ]
+        assert results[0] == account
+        assert isinstance(results[1], ValueError)
+        assert "does not exist" in str(results[1])
+        assert results[2] == {"name": "Name"}
+
+        # Served from the describe cache from now on
+        assert tool.batch([{"operation": "describe", "object_name": "Account"}]) == [
+            account
+        ]
+        assert mock_sf.restful.call_count == 1
+        assert cast(MagicMock, mock_sf.Account.describe).call_count == 0
+
+    async def test_abatch(self) -> None:
+        """Test the async batch entry point."""
+        tool = self.tool_constructor(**self.tool_constructor_params)
+
+        results = await tool.abatch(
+            [{"operation": "list_objects"}, {"operation": "invalid"}],
+            return_exceptions=True,
+        )
+
+        assert results[0] == [{"name": "Account"}]
+        assert isinstance(results[1], ValueError)
+
+
+class TestDeferredLogin:
+    """Tests for the auth_mode option."""
+
+    @staticmethod
+    def _tool(auth_mode: str) -> SalesforceTool:
+        return SalesforceTool(
+            username="test@example.com",
+            password="test_password",
+            security_token="test_token",
+            auth_mode=auth_mode,
+        )
+
+    def test_eager_login_in_constructor(self) -> None:
+        """Test that the default mode logs in right away."""
+        with patch("simple_salesforce.Salesforce") as mock_cls:
+            self._tool("eager")
+            mock_cls.assert_called_once_with(
+                username="test@example.com",
+                password="test_password",
+                security_token="test_token",
+                domain="login",
+            )
+
+    def test_lazy_login_on_first_operation(self) -> None:
+        """Test that lazy mode logs in once, on the first operation."""
+        with patch("simple_salesforce.Salesforce") as mock_cls:
+            mock_cls.return_value.describe.return_value = {"sobjects": []}
+            tool = self._tool("lazy")
+            assert mock_cls.call_count == 0
+
+            tool._run(operation="list_objects")
+            tool._run(operation="list_objects")
+            assert mock_cls.call_count == 1
+
+    def test_failed_lazy_login_is_retried(self) -> None:
+        """Test that a failed deferred login surfaces and is retried."""
+        with patch("simple_salesforce.Salesforce") as mock_cls:
+            mock_cls.side_effect = [ConnectionError("down"), MagicMock()]
+            tool = self._tool("lazy")
+
+            with pytest.raises(ConnectionError):
+                tool._run(operation="query", query="SELECT Id FROM Account")
+            tool._run(operation="query", query="SELECT Id FROM Account")
+            assert mock_cls.call_count == 2
+
+    def test_background_login(self) -> None:
+        """Test that background mode logs in without blocking the caller."""
+        release = threading.Event()
+
+        def slow_login(**kwargs: Any) -> MagicMock:
+            release.wait(5)
+            return MagicMock()
+
+        with patch("simple_salesforce.Salesforce", side_effect=slow_login) as mock_cls:
+            tool = self._tool("background")
+            release.set()
+            tool._run(operation="query", query="SELECT Id FROM Account")
+            assert mock_cls.call_count == 1
+
+
+class TestWarmUp:
+    """Tests for SalesforceTool.warm_up."""
+
+    @staticmethod
+    def _tool(**kwargs: Any) -> Tuple[SalesforceTool, MagicMock]:
+        mock_sf = MagicMock(spec=Salesforce)
+        mock_sf.query = MagicMock(return_value={"records": [{"Id": "1"}]})
+        mock_account = MagicMock(spec=SFType)
+        mock_account.describe = MagicMock(return_value={"name": "Account"})
+        mock_sf.Account = mock_account
+        tool = SalesforceTool(
+            username="test@example.com",
+            password="test_password",
+            security_token="test_token",
+            salesforce_client=mock_sf,
+            **kwargs,
+        )
+        return tool, mock_sf
+
+    def test_warm_up_fills_caches(self) -> None:
+        """Test that later calls are served from the prefetched data."""
+        tool, mock_sf = self._tool(query_cache_ttl=60)
+        query = "SELECT Id FROM Account"
+
+        handle = tool.warm_up(["Account"], [query], background=False)
+
+        assert handle.done() and handle.errors() == {}
+        assert tool._run(operation="describe", object_name="Account") == {
+            "name": "Account"
+        }
+        assert tool._run(operation="query", query=query) == {"records": [{"Id": "1"}]}
+        assert mock_sf.Account.describe.call_count == 1
+        assert mock_sf.query.call_count == 1
+
+    def test_call_during_warm_up_waits_for_prefetch(self) -> None:
+        """Test that a call racing its prefetch does not repeat the request."""
+        tool, mock_sf = self._tool()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_describe() -> Dict[str, Any]:
+            started.set()
+            release.wait(5)
+            return {"name": "Account"}
+
+        mock_sf.Account.describe = MagicMock(side_effect=slow_describe)
+        handle = tool.warm_up(["Account"])
+        assert started.wait(5)
+        assert not handle.done()
+
+        threading.Timer(0.05, release.set).start()
+        tool._run(operation="describe", object_name="Account")
+
+        assert handle.wait(5)
+        assert mock_sf.Account.describe.call_count == 1
+
+    def test_warm_up_reports_errors(self) -> None:
+        """Test that failed prefetches are reported, not raised."""
+        tool, _ = self._tool()
+
+        handle = tool.warm_up(["Account", "Bad Name"], background=False)
+
+        assert list(handle.errors()) == ["Bad Name"]
+        with pytest.raises(ValueError, match="query_cache_ttl"):
+            tool.warm_up(queries=["SELECT Id FROM Account"])
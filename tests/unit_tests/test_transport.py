@@ -0,0 +1,152 @@
+"""Unit tests for request compression, conditional GETs and timeouts."""
+
+import gzip
+from typing import Any, Dict, List, Optional, cast
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from simple_salesforce import Salesforce
+from simple_salesforce.exceptions import SalesforceGeneralError
+
+from langchain_salesforce.cache import TTLCache
+from langchain_salesforce.hedging import HedgedCaller, deadline_scope
+from langchain_salesforce.tools import SalesforceTool
+from langchain_salesforce.transport import (
+    CompressingAdapter,
+    conditional_get,
+    enable_compression,
+    enable_deadline_timeouts,
+)
+
+_BASE_URL = "https://example.my.salesforce.com/services/data/v59.0/"
+_DESCRIBE: Dict[str, Any] = {"name": "Account", "fields": [{"name": "Name"}]}
+
+
+def _sent_requests(monkeypatch: pytest.MonkeyPatch) -> List[requests.PreparedRequest]:
+    sent: List[requests.PreparedRequest] = []
+
+    def send(
+        self: HTTPAdapter, request: requests.PreparedRequest, *args: Any, **kw: Any
+    ) -> requests.Response:
+        sent.append(request)
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    return sent
+
+
+def test_large_bodies_compressed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that only bodies above the threshold are gzipped."""
+    sent = _sent_requests(monkeypatch)
+    session = requests.Session()
+    enable_compression(session, min_size=100)
+    assert isinstance(session.get_adapter(_BASE_URL), CompressingAdapter)
+
+    large = '{"records": [' + ", ".join(['{"Name": "Acme"}'] * 50) + "]}"
+    session.patch(_BASE_URL + "composite/sobjects", data=large)
+    session.patch(_BASE_URL + "composite/sobjects", data='{"records": []}')
+
+    compressed, small = sent
+    body = cast(bytes, compressed.body)
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(body).decode() == large
+    assert compressed.headers["Content-Length"] == str(len(body))
+    assert "Content-Encoding" not in small.headers
+    assert session.headers["Accept-Encoding"] == "gzip, deflate"
+
+
+def test_reads_time_out_at_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that reads, but not other requests, get the deadline as timeout."""
+    timeouts: List[Any] = []
+
+    def send(self: HTTPAdapter, request: Any, **kwargs: Any) -> requests.Response:
+        timeouts.append(kwargs["timeout"])
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    session = requests.Session()
+    enable_deadline_timeouts(session)
+    enable_deadline_timeouts(session)
+    caller = HedgedCaller()
+
+    caller.call("query", lambda: session.get(_BASE_URL))
+    with deadline_scope(10):
+        caller.call("query", lambda: session.get(_BASE_URL))
+        caller.call("query", lambda: session.get(_BASE_URL, timeout=(3, 60)))
+        session.patch(_BASE_URL + "composite/sobjects", data="{}")
+    caller.shutdown()
+
+    unbounded, bounded, connect_read, write = timeouts
+    assert unbounded is None and write is None
+    assert 9 < bounded <= 10
+    assert connect_read[0] == 3 and 9 < connect_read[1] <= 10
+
+
+def _response(
+    status: int, body: Any = None, headers: Optional[Dict[str, str]] = None
+) -> MagicMock:
+    response = MagicMock(status_code=status, headers=headers or {})
+    response.json.return_value = body
+    return response
+
+
+def _not_modified(*args: Any, **kwargs: Any) -> Any:
+    raise SalesforceGeneralError(_BASE_URL, 304, "describe", b"")
+
+
+def test_conditional_get_reuses_body_on_304() -> None:
+    """Test that stored validators are sent back and a 304 reuses the body."""
+    client = MagicMock(spec=Salesforce)
+    client.base_url = _BASE_URL
+    client._call_salesforce.return_value = _response(
+        200, _DESCRIBE, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024"}
+    )
+    store = TTLCache()
+    path = "sobjects/Account/describe"
+
+    assert conditional_get(client, path, store) == _DESCRIBE
+    client._call_salesforce.assert_called_with(
+        "GET", _BASE_URL + path, name="", headers={}
+    )
+
+    client._call_salesforce.side_effect = _not_modified
+    assert conditional_get(client, path, store, name="describe") == _DESCRIBE
+    client._call_salesforce.assert_called_with(
+        "GET",
+        _BASE_URL + path,
+        name="describe",
+        headers={"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024"},
+    )
+
+    with pytest.raises(SalesforceGeneralError):
+        conditional_get(client, "sobjects", store)
+
+
+def test_tool_revalidates_expired_describes() -> None:
+    """Test that an expired describe is refetched conditionally."""
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.base_url = _BASE_URL
+    mock_sf._call_salesforce.return_value = _response(200, _DESCRIBE, {"ETag": '"v1"'})
+    tool = SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        conditional_requests=True,
+        describe_cache_ttl=0,
+    )
+    describe = {"operation": "describe", "object_name": "Account"}
+
+    assert tool.invoke(describe) == _DESCRIBE
+    mock_sf._call_salesforce.side_effect = _not_modified
+    assert tool.invoke(describe) == _DESCRIBE
+
+    last_call = mock_sf._call_salesforce.call_args
+    assert last_call.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert mock_sf._call_salesforce.call_count == 2
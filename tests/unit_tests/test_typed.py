@@ -0,0 +1,174 @@
+"""Unit tests for typed query records."""
+
+from datetime import date
+from typing import Any, Dict, Optional, cast
+from unittest.mock import MagicMock
+
+import pytest
+from simple_salesforce import Salesforce
+from simple_salesforce.api import SFType
+
+from langchain_salesforce.tools import SalesforceTool
+from langchain_salesforce.typed import TypedRecord, record_schema
+
+_DESCRIBES: Dict[str, Dict[str, Any]] = {
+    "Account": {
+        "fields": [
+            {"name": "Id", "type": "id"},
+            {"name": "Name", "type": "string"},
+            {"name": "AnnualRevenue", "type": "currency"},
+            {
+                "name": "OwnerId",
+                "type": "reference",
+                "relationshipName": "Owner",
+                "referenceTo": ["User"],
+            },
+        ],
+        "childRelationships": [
+            {"relationshipName": "Contacts", "childSObject": "Contact"}
+        ],
+    },
+    "User": {"fields": [{"name": "Name", "type": "string"}]},
+    "Contact": {"fields": [{"name": "Birthdate", "type": "date"}]},
+}
+
+_ACCOUNT = {
+    "attributes": {"type": "Account"},
+    "Id": "001000000000001AAA",
+    "Name": "Acme",
+    "AnnualRevenue": 5,
+    "Owner": {"attributes": {"type": "User"}, "Name": "Ann"},
+    "Contacts": {
+        "totalSize": 1,
+        "done": True,
+        "records": [{"attributes": {"type": "Contact"}, "Birthdate": "1990-05-01"}],
+    },
+}
+
+
+def test_record_schema_builds_nested_records() -> None:
+    """Test names, types, parents and children of generated records."""
+    schema = record_schema(
+        "SELECT id, a.Name, AnnualRevenue, a.Owner.Name, "
+        "(SELECT Birthdate FROM Contacts) FROM Account a",
+        _DESCRIBES.__getitem__,
+    )
+
+    record = schema.build(_ACCOUNT)
+
+    assert schema.field_names == ["Id", "Name", "AnnualRevenue", "Owner", "Contacts"]
+    assert type(record).__name__ == "AccountRecord"
+    assert issubclass(type(record), TypedRecord)
+    assert not hasattr(record, "__dict__")
+    assert record.AnnualRevenue == 5.0 and isinstance(record.AnnualRevenue, float)
+    assert record.Owner.Name == "Ann"
+    assert record.Contacts[0].Birthdate == date(1990, 5, 1)
+    assert schema.build({**_ACCOUNT, "Owner": None, "Contacts": None}).Contacts == []
+    assert record.to_dict()["Owner"] == {"Name": "Ann"}
+    with pytest.raises(AttributeError):
+        record.Phone = "555"  # type: ignore[attr-defined]
+
+
+def test_record_schema_aggregates_and_keywords() -> None:
+    """Test expression names, aliases and keyword field names."""
+    schema = record_schema(
+        "SELECT toLabel(Name), COUNT(Id), MAX(AnnualRevenue) top, None__c, "
+        "Name FROM Account GROUP BY Name",
+        _DESCRIBES.__getitem__,
+    )
+    record = schema.build({"Name": "Acme", "expr0": 2, "top": 9.0, "None__c": 1})
+
+    assert schema.field_names == ["Name", "expr0", "top", "None__c"]
+    assert (record.Name, record.expr0, record.top) == ("Acme", 2, 9.0)
+    keyword_schema = record_schema("SELECT None FROM Thing", lambda name: {})
+    assert keyword_schema.build({"None": 1}).None_ == 1
+    assert keyword_schema.build({"None": 1}).to_dict() == {"None": 1}
+
+
+def test_tool_returns_typed_records() -> None:
+    """Test the typed_records mode of the query operation."""
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.query.return_value = {"totalSize": 1, "done": True, "records": [_ACCOUNT]}
+    for object_name, describe in _DESCRIBES.items():
+        setattr(mock_sf, object_name, MagicMock(spec=SFType))
+        getattr(mock_sf, object_name).describe.return_value = describe
+    tool = SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        typed_records=True,
+    )
+    query = {"operation": "query", "query": "SELECT Name, Owner.Name FROM Account"}
+
+    first = tool.invoke(query)["records"][0]
+    second = tool.invoke(query)["records"][0]
+
+    assert (first.Name, first.Owner.Name) == ("Acme", "Ann")
+    assert type(first) is type(second)
+    cast(MagicMock, mock_sf.Account.describe).assert_called_once()
+    tool.invalidate_describe("Account")
+    assert type(tool.invoke(query)["records"][0]) is not type(first)
+
+
+def test_tool_types_continuation_pages() -> None:
+    """Test that pages fetched with 'fetch_more' hold typed records too."""
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.Account = MagicMock(spec=SFType)
+    mock_sf.Account.describe.return_value = _DESCRIBES["Account"]
+    mock_sf.User = MagicMock(spec=SFType)
+    mock_sf.User.describe.return_value = _DESCRIBES["User"]
+
+    def page(name: str, next_url: Optional[str]) -> Dict[str, Any]:
+        record = {**_ACCOUNT, "Name": name}
+        return {
+            "totalSize": 3,
+            "done": next_url is None,
+            "records": [record],
+            **({"nextRecordsUrl": next_url} if next_url else {}),
+        }
+
+    mock_sf.query.return_value = page("First", "/query/01g-2000")
+    mock_sf.query_more.side_effect = [
+        page("Second", "/query/01g-4000"),
+        page("Third", None),
+    ]
+    tool = SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        typed_records=True,
+        output_budget=1,
+    )
+
+    result = tool.invoke(
+        {"operation": "query", "query": "SELECT Name, Owner.Name FROM Account"}
+    )
+    records = list(result["records"])
+    while result.get("cursor"):
+        result = tool.invoke({"operation": "fetch_more", "cursor": result["cursor"]})
+        records.extend(result["records"])
+
+    assert [record.Name for record in records] == ["First", "Second", "Third"]
+    assert {type(record) for record in records} == {type(records[0])}
+    assert records[2].Owner.Name == "Ann"
+
+
+def test_tool_falls_back_to_dicts_for_unparsed_queries() -> None:
+    """Test that queries outside the parsed subset return dict records."""
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.query.return_value = {"totalSize": 1, "done": True, "records": [_ACCOUNT]}
+    tool = SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        typed_records=True,
+    )
+    query = "SELECT Name FROM Account WITH SECURITY_ENFORCED"
+
+    result = tool.invoke({"operation": "query", "query": query})
+
+    assert result["records"] == [_ACCOUNT]
+    mock_sf.query.assert_called_once_with(query)
@@ -0,0 +1,359 @@
+"""Unit tests for local SOQL and record data validation."""
+
+from datetime import date, datetime
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+from simple_salesforce import Salesforce
+from simple_salesforce.api import SFType
+
+from langchain_salesforce.tools import SalesforceTool
+from langchain_salesforce.validation import (
+    RecordValidationError,
+    RecordValidator,
+    SOQLIssue,
+    SOQLValidationError,
+    SOQLValidator,
+)
+
+DESCRIBES: Dict[str, Dict[str, Any]] = {
+    "Account": {
+        "name": "Account",
+        "fields": [
+            {"name": "Id"},
+            {"name": "Name"},
+            {"name": "Industry"},
+            {"name": "OwnerId", "relationshipName": "Owner", "referenceTo": ["User"]},
+        ],
+        "childRelationships": [
+            {"relationshipName": "Contacts", "childSObject": "Contact"},
+            {"relationshipName": "Opportunities", "childSObject": "Opportunity"},
+        ],
+    },
+    "Contact": {
+        "name": "Contact",
+        "fields": [
+            {"name": "Id"},
+            {"name": "LastName"},
+            {"name": "Email"},
+            {
+                "name": "AccountId",
+                "relationshipName": "Account",
+                "referenceTo": ["Account"],
+            },
+            {
+                "name": "WhoId",
+                "relationshipName": "Who",
+                "referenceTo": ["Contact", "Lead"],
+            },
+        ],
+    },
+    "Opportunity": {
+        "name": "Opportunity",
+        "fields": [{"name": "Id"}, {"name": "AccountId"}, {"name": "Amount"}],
+    },
+    "User": {"name": "User", "fields": [{"name": "Id"}, {"name": "Email"}]},
+}
+
+
+@pytest.fixture
+def validator() -> SOQLValidator:
+    return SOQLValidator(DESCRIBES.__getitem__, lambda: list(DESCRIBES))
+
+
+def _messages(issues: List[SOQLIssue]) -> List[str]:
+    return [str(issue) for issue in issues]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT Id, Name, Owner.Email FROM Account WHERE Industry = 'Tech'",
+        "SELECT a.Name FROM Account a ORDER BY a.Name",
+        "SELECT Id, (SELECT LastName, Email FROM Contacts) FROM Account",
+        "SELECT Id FROM Account WHERE Id IN (SELECT AccountId FROM Opportunity)",
+        "SELECT Industry, COUNT(Id) FROM Account GROUP BY Industry",
+        "SELECT Who.Anything FROM Contact",
+        "SELECT FIELDS(STANDARD) FROM Account",
+        "select id, lastname from contact",
+    ],
+)
+def test_valid_queries(validator: SOQLValidator, query: str) -> None:
+    """Test that correct queries produce no issues."""
+    assert validator.validate(query) == []
+
+
+def test_unknown_object_suggests_names(validator: SOQLValidator) -> None:
+    """Test that a misspelled object name is reported with suggestions."""
+    assert _messages(validator.validate("SELECT Id FROM Acount")) == [
+        "Object 'Acount' does not exist. Did you mean: Account, Contact?"
+    ]
+
+
+def test_unknown_fields_and_relationships(validator: SOQLValidator) -> None:
+    """Test field, relationship path and child relationship checks."""
+    issues = validator.validate(
+        "SELECT Id, Emial, Acount.Name, Account.Owner.Emal, "
+        "(SELECT Amount FROM Opportunity) FROM Contact WHERE LastNme = 'x'"
+    )
+
+    assert _messages(issues) == [
+        "Field 'Emial' does not exist on 'Contact'. Did you mean: Email?",
+        "Relationship 'Acount' does not exist on 'Contact'. Did you mean: Account?",
+        "Field 'Emal' does not exist on 'User'. Did you mean: Email?",
+        "Child relationship 'Opportunity' does not exist on 'Contact'.",
+        "Field 'LastNme' does not exist on 'Contact'. Did you mean: LastName?",
+    ]
+
+
+def test_subqueries_checked_against_their_object(validator: SOQLValidator) -> None:
+    """Test that child subqueries and semi-joins use the right describe."""
+    issues = validator.validate(
+        "SELECT Id, (SELECT Amount FROM Contacts) FROM Account "
+        "WHERE Id IN (SELECT AcountId FROM Opportunity)"
+    )
+
+    assert _messages(issues) == [
+        "Field 'Amount' does not exist on 'Contact'. Did you mean: AccountId?",
+        "Field 'AcountId' does not exist on 'Opportunity'. "
+        "Did you mean: AccountId, Amount?",
+    ]
+
+
+def test_unparseable_queries_are_not_checked(validator: SOQLValidator) -> None:
+    """Test that syntax outside the parser's subset is left to Salesforce."""
+    assert validator.validate("SELECT Id FROM Account WITH SECURITY_ENFORCED") == []
+
+
+def test_tool_rejects_invalid_query_before_sending() -> None:
+    """Test that the tool raises locally when validation is enabled."""
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.describe = MagicMock(
+        return_value={"sobjects": [{"name": name} for name in DESCRIBES]}
+    )
+    mock_contact = MagicMock(spec=SFType)
+    mock_contact.describe = MagicMock(return_value=DESCRIBES["Contact"])
+    mock_sf.Contact = mock_contact
+    mock_sf.query = MagicMock(return_value={"records": []})
+    tool = SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        validate_queries=True,
+    )
+
+    with pytest.raises(SOQLValidationError, match="Did you mean: Email") as exc_info:
+        tool._run(operation="query", query="SELECT Emial FROM Contact")
+    assert len(exc_info.value.issues) == 1
+    assert mock_sf.query.call_count == 0
+
+    tool._run(operation="query", query="SELECT Email FROM Contact")
+    tool._run(operation="query", query="SELECT LastName FROM Contact")
+    assert mock_sf.query.call_count == 2
+    assert mock_contact.describe.call_count == 1
+    assert mock_sf.describe.call_count == 1
+
+
+CASE: Dict[str, Any] = {
+    "name": "Case",
+    "fields": [
+        {"name": "Id", "type": "id", "createable": False, "updateable": False},
+        {
+            "name": "Subject",
+            "type": "string",
+            "length": 10,
+            "createable": True,
+            "updateable": True,
+            "nillable": False,
+            "defaultedOnCreate": False,
+        },
+        {
+            "name": "Status",
+            "type": "picklist",
+            "createable": True,
+            "updateable": True,
+            "restrictedPicklist": True,
+            "picklistValues": [
+                {"value": "New", "active": True},
+                {"value": "Closed", "active": True},
+                {"value": "Legacy", "active": False},
+            ],
+        },
+        {"name": "Escalated__c", "type": "boolean", "nillable": False},
+        {"name": "Hours__c", "type": "int", "createable": True, "updateable": True},
+        {
+            "name": "Cost__c",
+            "type": "currency",
+            "createable": True,
+            "updateable": False,
+        },
+        {"name": "Due__c", "type": "date", "createable": True, "updateable": True},
+        {"name": "Seen__c", "type": "datetime", "createable": True},
+        {"name": "AccountId", "type": "reference", "createable": True},
+        {"name": "CaseNumber", "type": "string", "createable": False},
+    ],
+}
+
+
+@pytest.fixture
+def record_validator() -> RecordValidator:
+    return RecordValidator({"Case": CASE}.__getitem__)
+
+
+def test_record_data_coerced(record_validator: RecordValidator) -> None:
+    """Test coercion of numbers, dates and booleans and canonical names."""
+    coerced = record_validator.coerce(
+        "Case",
+        {
+            "subject": "Printer",
+            "Status": "New",
+            "Escalated__c": "true",
+            "Hours__c": "3",
+            "Cost__c": "1,250.50",
+            "Due__c": date(2024, 5, 1),
+            "Seen__c": datetime(2024, 5, 1, 12, 30),
+            "AccountId": "001000000000000AAA",
+        },
+        "create",
+    )
+
+    assert coerced == {
+        "Subject": "Printer",
+        "Status": "New",
+        "Escalated__c": True,
+        "Hours__c": 3,
+        "Cost__c": 1250.5,
+        "Due__c": "2024-05-01",
+        "Seen__c": "2024-05-01T12:30:00.000Z",
+        "AccountId": "001000000000000AAA",
+    }
+    assert record_validator.coerce(
+        "Case", {"Seen__c": "2024-05-01T14:30:00+02:00"}, "update"
+    ) == {"Seen__c": "2024-05-01T12:30:00.000Z"}
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-05-01T12:30:00.000+0000",
+        "2024-05-01T18:00:00.000+0530",
+        "2024-05-01T08:30:00-0400",
+        "2024-05-01T12:30:00.000Z",
+    ],
+)
+def test_api_datetimes_coerced(record_validator: RecordValidator, value: str) -> None:
+    """Test that datetimes in the API's own format, e.g. +0000, are accepted."""
+    assert record_validator.coerce("Case", {"Seen__c": value}, "update") == {
+        "Seen__c": "2024-05-01T12:30:00.000Z"
+    }
+
+
+@pytest.mark.parametrize(
+    "field_name, value",
+    [
+        ("Cost__c", "3,14"),
+        ("Cost__c", "1,23,456"),
+        ("Cost__c", "nan"),
+        ("Hours__c", "inf"),
+        ("Hours__c", float("nan")),
+    ],
+)
+def test_malformed_numbers_rejected(
+    record_validator: RecordValidator, field_name: str, value: Any
+) -> None:
+    """Test that locale decimals and non-finite numbers are reported."""
+    _, issues = record_validator.check("Case", {field_name: value}, "create")
+
+    assert _messages(list(issues))[0] == (
+        f"Field '{field_name}' expects a number, got {value!r}."
+    )
+
+
+def test_invalid_required_field_reported_once(
+    record_validator: RecordValidator,
+) -> None:
+    """Test that a required field failing coercion is not also reported missing."""
+    _, issues = record_validator.check("Case", {"Subject": "Much too long"}, "create")
+
+    assert _messages(list(issues)) == ["Field 'Subject' is longer than 10 characters."]
+
+
+def test_record_data_issues(record_validator: RecordValidator) -> None:
+    """Test that every problem is reported at once."""
+    _, issues = record_validator.check(
+        "Case",
+        {
+            "Subjct": "x",
+            "CaseNumber": "42",
+            "Status": "Legacy",
+            "Hours__c": 1.5,
+            "Due__c": "May 1st",
+            "AccountId": "Acme",
+            "Escalated__c": None,
+        },
+        "create",
+    )
+
+    assert _messages(list(issues)) == [
+        "Field 'Subjct' does not exist on 'Case'. Did you mean: Subject?",
+        "Field 'CaseNumber' is not createable.",
+        "Field 'Status' has no picklist value 'Legacy'.",
+        "Field 'Hours__c' expects an integer, got 1.5.",
+        "Field 'Due__c' expects a date (YYYY-MM-DD), got 'May 1st'.",
+        "Field 'AccountId' expects a record ID, got 'Acme'.",
+        "Field 'Escalated__c' cannot be null.",
+        "Required fields are missing: Subject.",
+    ]
+
+
+def test_update_checks_updateable(record_validator: RecordValidator) -> None:
+    """Test that updates skip required fields but check updateability."""
+    with pytest.raises(RecordValidationError) as exc_info:
+        record_validator.coerce(
+            "Case", {"Cost__c": 5, "Subject": "Much too long"}, "update"
+        )
+
+    assert _messages(list(exc_info.value.issues)) == [
+        "Field 'Cost__c' is not updateable.",
+        "Field 'Subject' is longer than 10 characters.",
+    ]
+
+
+def test_tool_rejects_invalid_record_before_sending() -> None:
+    """Test that creates, updates and batches are validated locally."""
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_case = MagicMock(spec=SFType)
+    mock_case.describe = MagicMock(return_value=CASE)
+    mock_case.create = MagicMock(return_value={"id": "500", "success": True})
+    mock_sf.Case = mock_case
+    tool = SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        validate_records=True,
+    )
+    create = {"operation": "create", "object_name": "Case"}
+
+    with pytest.raises(RecordValidationError, match="Did you mean: Subject"):
+        tool.invoke({**create, "record_data": {"Subjet": "x"}})
+    with pytest.raises(RecordValidationError, match="is not updateable"):
+        tool.invoke(
+            {
+                "operation": "update",
+                "object_name": "Case",
+                "record_id": "500000000000001",
+                "record_data": {"Cost__c": 1},
+            }
+        )
+    results = tool.batch(
+        [{**create, "record_data": {"Hours__c": "x"}}], return_exceptions=True
+    )
+    assert isinstance(results[0], RecordValidationError)
+    assert mock_sf.restful.call_count == 0
+
+    tool.invoke({**create, "record_data": {"Subject": "ok", "Hours__c": "2"}})
+    mock_case.create.assert_called_once_with({"Subject": "ok", "Hours__c": 2})
+    assert mock_case.describe.call_count == 1
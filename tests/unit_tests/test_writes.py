@@ -0,0 +1,255 @@
+"""Unit tests for the write-behind update buffer."""
+
+import json
+import threading
+from typing import Any, Dict, List, cast
+from unittest.mock import MagicMock, patch
+
+import pytest
+from simple_salesforce import Salesforce
+from simple_salesforce.api import SFType
+
+from langchain_salesforce.tools import SalesforceTool
+from langchain_salesforce.writes import WriteBehindBuffer
+
+_CASE_1 = "500000000000001AAA"
+_CASE_2 = "500000000000002AAA"
+
+
+def _make_tool(**kwargs: Any) -> SalesforceTool:
+    mock_sf = MagicMock(spec=Salesforce)
+    mock_sf.Case = MagicMock(spec=SFType)
+
+    def restful(path: str, method: str = "GET", data: str = "", **_: Any) -> Any:
+        records = json.loads(data)["records"]
+        return [
+            {"id": record["id"], "success": True, "errors": []} for record in records
+        ]
+
+    mock_sf.restful = MagicMock(side_effect=restful)
+    return SalesforceTool(
+        username="test@example.com",
+        password="test_password",
+        security_token="test_token",
+        salesforce_client=mock_sf,
+        **kwargs,
+    )
+
+
+def _sent_bodies(tool: SalesforceTool) -> List[Dict[str, Any]]:
+    mock_restful = cast(MagicMock, tool._sf.restful)
+    return [json.loads(call.kwargs["data"]) for call in mock_restful.call_args_list]
+
+
+def test_updates_merged_per_record() -> None:
+    """Test that updates of a record are merged into one Collections call."""
+    tool = _make_tool()
+    buffer = WriteBehindBuffer(tool, flush_interval=60)
+
+    first = buffer.update("Case", _CASE_1, {"Status": "Working", "Priority": "Low"})
+    second = buffer.update("Case", _CASE_1, {"Priority": "High"})
+    other = buffer.update("Case", _CASE_2, {"Status": "New"})
+    assert buffer.pending == 2
+    assert not first.done()
+
+    buffer.close()
+
+    expected = {"id": _CASE_1, "success": True, "errors": []}
+    assert first.result() == second.result() == expected
+    assert other.result()["id"] == _CASE_2
+    assert _sent_bodies(tool) == [
+        {
+            "allOrNone": False,
+            "records": [
+                {
+                    "attributes": {"type": "Case"},
+                    "id": _CASE_1,
+                    "Status": "Working",
+                    "Priority": "High",
+                },
+                {"attributes": {"type": "Case"}, "id": _CASE_2, "Status": "New"},
+            ],
+        }
+    ]
+    cast(MagicMock, tool._sf.restful).assert_called_once_with(
+        "composite/sobjects", method="PATCH", data=json.dumps(_sent_bodies(tool)[0])
+    )
+
+
+def test_flush_on_size_and_time() -> None:
+    """Test the background flush triggered by either threshold."""
+    tool = _make_tool()
+    with WriteBehindBuffer(tool, max_records=2, flush_interval=60) as buffer:
+        buffer.update("Case", _CASE_1, {"Status": "New"})
+        future = buffer.update("Case", _CASE_2, {"Status": "New"})
+        assert future.result(timeout=5)["success"]
+
+    tool = _make_tool()
+    with WriteBehindBuffer(tool, flush_interval=0.01) as buffer:
+        assert buffer.update("Case", _CASE_1, {"Status": "New"}).result(timeout=5)
+
+
+def test_failures_reported_per_record() -> None:
+    """Test that record errors and failed calls resolve the futures."""
+    tool = _make_tool()
+    mock_restful = cast(MagicMock, tool._sf.restful)
+    mock_restful.side_effect = None
+    mock_restful.return_value = [
+        {"id": _CASE_1, "success": True, "errors": []},
+        {"success": False, "errors": [{"message": "Invalid status"}]},
+    ]
+    buffer = WriteBehindBuffer(tool, flush_interval=60)
+    ok = buffer.update("Case", _CASE_1, {"Status": "New"})
+    bad = buffer.update("Case", _CASE_2, {"Status": "Bogus"})
+    buffer.flush()
+
+    assert ok.result()["success"]
+    with pytest.raises(ValueError, match=f"record {_CASE_2}: Invalid status"):
+        bad.result()
+
+    mock_restful.side_effect = ConnectionError("down")
+    failed = buffer.update("Case", _CASE_1, {"Status": "New"})
+    buffer.close()
+    with pytest.raises(ConnectionError):
+        failed.result()
+    with pytest.raises(ValueError, match="closed"):
+        buffer.update("Case", _CASE_1, {"Status": "New"})
+
+
+def test_15_and_18_character_ids_merged() -> None:
+    """Test that both forms of a record ID queue a single update."""
+    tool = _make_tool()
+    with WriteBehindBuffer(tool, flush_interval=60) as buffer:
+        buffer.update("Case", _CASE_1[:15], {"Status": "Working"})
+        buffer.update("Case", _CASE_1, {"Priority": "High"})
+        assert buffer.pending == 1
+
+    [record] = _sent_bodies(tool)[0]["records"]
+    assert (record["id"], record["Status"], record["Priority"]) == (
+        _CASE_1,
+        "Working",
+        "High",
+    )
+
+
+def test_failed_invalidation_resolves_futures() -> None:
+    """Test that a failed invalidation neither loses results nor stops flushing."""
+    tool = _make_tool()
+    with patch.object(
+        SalesforceTool, "invalidate_queries", side_effect=RuntimeError("cache down")
+    ):
+        with WriteBehindBuffer(tool, flush_interval=0.01) as buffer:
+            first = buffer.update("Case", _CASE_1, {"Status": "New"})
+            assert first.result(timeout=5)["success"]
+            second = buffer.update("Case", _CASE_2, {"Status": "New"})
+            assert second.result(timeout=5)["success"]
+
+
+def test_updates_of_a_record_sent_in_order() -> None:
+    """Test that a flush waits for an earlier flush of the same record."""
+    tool = _make_tool()
+    mock_restful = cast(MagicMock, tool._sf.restful)
+    restful = mock_restful.side_effect
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_restful(*args: Any, **kwargs: Any) -> Any:
+        started.set()
+        release.wait(5)
+        return restful(*args, **kwargs)
+
+    mock_restful.side_effect = slow_restful
+    buffer = WriteBehindBuffer(tool, flush_interval=60)
+    buffer.update("Case", _CASE_1, {"Status": "Working"})
+    first_flush = threading.Thread(target=buffer.flush)
+    first_flush.start()
+    assert started.wait(5)
+    buffer.update("Case", _CASE_1, {"Status": "Closed"})
+    second_flush = threading.Thread(target=buffer.flush)
+    second_flush.start()
+    release.set()
+    first_flush.join(5)
+    second_flush.join(5)
+    buffer.close()
+
+    statuses = [body["records"][0]["Status"] for body in _sent_bodies(tool)]
+    assert statuses == ["Working", "Closed"]
+
+
+def test_tool_write_behind() -> None:
+    """Test that the tool queues updates when write_behind is enabled."""
+    tool = _make_tool(write_behind=True, write_behind_interval=60)
+    assert tool.write_buffer is not None
+
+    result = tool.invoke(
+        {
+            "operation": "update",
+            "object_name": "Case",
+            "record_id": _CASE_1,
+            "record_data": {"Status": "Closed"},
+        }
+    )
+
+    assert result == {"id": _CASE_1, "queued": True}
+    assert tool.write_buffer.pending == 1
+    cast(MagicMock, tool._sf.Case.update).assert_not_called()
+    tool.write_buffer.close()
+    assert _sent_bodies(tool)[0]["records"][0]["Status"] == "Closed"
+    assert _make_tool().write_buffer is None
+
+
+def test_tool_close_flushes_and_is_registered_at_exit() -> None:
+    """Test that closing the tool sends queued updates exactly once."""
+    with patch("langchain_salesforce.tools.atexit") as mock_atexit:
+        tool = _make_tool(write_behind=True, write_behind_interval=60)
+    mock_atexit.register.assert_called_once_with(tool.close)
+    tool.invoke(
+        {
+            "operation": "update",
+            "object_name": "Case",
+            "record_id": _CASE_1,
+            "record_data": {"Status": "Closed"},
+        }
+    )
+
+    with patch("langchain_salesforce.tools.atexit") as mock_atexit:
+        tool.close()
+    mock_atexit.unregister.assert_called_once_with(tool.close)
+    assert tool.write_buffer is not None and tool.write_buffer.pending == 0
+    assert len(_sent_bodies(tool)) == 1
+    with pytest.raises(ValueError, match="closed"):
+        tool.write_buffer.update("Case", _CASE_1, {"Status": "New"})
+    _make_tool().close()
+
+
+def test_sent_updates_refresh_record_cache() -> None:
+    """Test that records read while an update was queued are not left stale."""
+    tool = _make_tool(write_behind=True, write_behind_interval=60, record_cache_ttl=60)
+    mock_sf = cast(MagicMock, tool._sf)
+    mock_sf.query.return_value = {
+        "totalSize": 2,
+        "done": True,
+        "records": [
+            {"attributes": {"type": "Case"}, "Id": case_id, "Status": "New"}
+            for case_id in (_CASE_1, _CASE_2)
+        ],
+    }
+    mock_sf.restful.side_effect = lambda *args, **kwargs: [
+        {"id": _CASE_1, "success": True, "errors": []},
+        {"success": False, "errors": [{"message": "locked"}]},
+    ]
+    buffer = cast(WriteBehindBuffer, tool.write_buffer)
+    buffer.update("Case", _CASE_1, {"Status": "Closed"})
+    buffer.update("Case", _CASE_2, {"Status": "Closed"})
+    tool.invoke({"operation": "query", "query": "SELECT Id, Status FROM Case"})
+
+    buffer.flush()
+
+    record_cache = tool._record_cache
+    assert record_cache is not None
+    assert record_cache.lookup("Case", _CASE_1, ["Status"]) == (
+        {"Status": "Closed"},
+        [],
+    )
+    assert record_cache.lookup("Case", _CASE_2, ["Status"]) == ({}, ["Status"])
+    tool.close()